@@ -0,0 +1,3 @@
+"""
+Runnable benchmarks and regression checks, run from the repository root with python -m benchmarks.<name>.
+"""
@@ -0,0 +1,190 @@
+"""
+Regression check and benchmark of the dashboard builders against their former row-by-row
+implementations in dashboard_reference.py, on generated input files.
+Usage: python -m benchmarks.dashboard [builders] [lines] [reference_max_lines]
+
+Both versions write their JSON with the same settings (indented, stdlib json) and must
+produce byte-identical files. The reference is only run up to reference_max_lines LTAP
+lines, larger sizes time the current builder alone.
+
+Examples:
+    python -m benchmarks.dashboard
+    python -m benchmarks.dashboard lines_all_floors 10000,100000,1000000 100000
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import data_script.config.constants as constant
+import data_script.utils.files_utils as files_utils
+from data_script.extraction.dashboard_modules import processing
+from benchmarks import dashboard_reference as reference
+
+# Builder name -> (current builder, reference builder), the output is dashboard/<name>.json
+# unless listed in OUTPUTS
+BUILDERS = {
+    "deliveries_all_floors": (processing.create_deliveries_all_floors, reference.create_deliveries_all_floors),
+    "hu_all_floors": (processing.create_hu_all_floors, reference.create_hu_all_floors),
+    "lines_all_floors": (processing.create_lines_all_floors, reference.create_lines_all_floors),
+    "deliveries_all_floors_pgi": (processing.create_deliveries_all_floors_pgi, reference.create_deliveries_all_floors_pgi),
+    "hu_all_floors_pgi": (processing.create_hu_all_floors_pgi, reference.create_hu_all_floors_pgi),
+    "lines_all_floors_pgi": (processing.create_lines_all_floors_pgi, reference.create_lines_all_floors_pgi),
+    "all_floors_pgi": (processing.create_all_floors_pgi, reference.create_all_floors_pgi),
+    "picking_hourly_dashboard": (processing.create_picking_hourly_dashboard, reference.create_picking_hourly_dashboard),
+}
+
+# Builders writing several files: name -> outputs in the dashboard folder
+OUTPUTS = {
+    "all_floors_pgi": ["deliveries_all_floors_pgi", "hu_all_floors_pgi", "lines_all_floors_pgi"],
+}
+
+# Source bins covering every floor prefix, lower case, padding, unknown prefixes and empty values
+SOURCE_BINS = np.array(["F01-02", "l-33", " X9", "N-11", "n2", "Y7", "o1", "W-3", "Z99", "123", "", "  ", "Q1", None], dtype=object)
+
+
+def make_inputs(root: str, lines: int, seed: int = 0) -> None:
+    """
+    Write random dashboard and picking input files with about the given number of LTAP lines.
+
+    The files contain the edge cases the builders handle: missing deliveries,
+    unknown WM statuses, missing dates, HUs with and without leading zeros,
+    unknown source bins and unparsable confirmation times.
+    """
+    rng = np.random.default_rng(seed)
+    for folder in ("dashboard", "misc", "picking"):
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+
+    def pick(values, size):
+        values = np.array(values, dtype=object)
+        return values[rng.integers(0, len(values), size)]
+
+    def blank(values, share):
+        values = pd.Series(values, dtype=object)
+        values[rng.random(len(values)) < share] = None
+        return values
+
+    deliveries = np.arange(80000000, 80000000 + max(lines // 6, 10))
+
+    # VL06F: one row per HU, one to three HUs per delivery
+    vl06f_deliveries = np.repeat(deliveries, rng.integers(1, 4, len(deliveries)))
+    hus = (1000000 + np.arange(len(vl06f_deliveries))).astype(str).astype(object)
+    statuses = pick(["A", "B", "C", " a", "D", None, "c "], len(deliveries))
+    dates = pick(["03.01.2026", "01.01.2026", "02.01.2026", "05.01.2026", None], len(deliveries))
+    index = np.searchsorted(deliveries, vl06f_deliveries)
+    pd.DataFrame({
+        "delivery": blank(vl06f_deliveries, 0.02),
+        "gi_date": blank(dates[index], 0.1),
+        "wm": statuses[index],
+        "hu": blank(hus, 0.05),
+    }).to_csv(os.path.join(root, "dashboard", "vl06f_dashboard.csv"), index=False)
+    pd.DataFrame({"delivery": list(deliveries[rng.random(len(deliveries)) > 0.4]) + [None]}).to_csv(
+        os.path.join(root, "dashboard", "likp_dashboard.csv"), index=False
+    )
+
+    # ZORF links: HU and TO number of each line of a delivery
+    to_numbers = []
+    for offset, name in enumerate(("zorf_hu_to_link_likp", "zorf_hu_to_link_vl06f", "zorf_huto_lnkhis_likp")):
+        rows = lines // 3
+        line_hus = pick(hus, rows)
+        padded = rng.random(rows) > 0.5
+        numbers = 500000 + offset * rows + np.arange(rows)
+        to_numbers.append(numbers)
+        pd.DataFrame({
+            "delivery": blank(pick(deliveries, rows), 0.03),
+            "hu": blank(np.where(padded, "00" + line_hus.astype(str), line_hus), 0.05),
+            "to_number": blank(numbers, 0.05),
+            "source_bin": pick(SOURCE_BINS, rows),
+        }).to_csv(os.path.join(root, "dashboard", f"{name}.csv"), index=False)
+
+    # LTAP lines of the TO numbers
+    to_numbers = np.concatenate(to_numbers)
+    for name in ("ltap_likp_to_numbers", "ltap_likp_to_numbers_two", "ltap_vl06f_to_numbers"):
+        rows = lines // 3
+        pd.DataFrame({
+            "to_number": pick(to_numbers, rows),
+            "confirmation_date": pick(["01.01.2026", None, " ", "02.01.2026"], rows),
+            "destination_bin": blank(pick(deliveries, rows), 0.05),
+            "source_bin": pick(SOURCE_BINS, rows),
+        }).to_csv(os.path.join(root, "dashboard", f"{name}.csv"), index=False)
+
+    # Picking inputs of the hourly dashboard
+    routes = [f"R{i:03d}" for i in range(40)]
+    pd.DataFrame({"route": [route.lower() + " " for route in routes[:15]]}).to_csv(
+        os.path.join(root, "misc", "bflow_routes.csv"), index=False
+    )
+    for name in ("zorf_huto_lnkhis", "zorf_hu_to_link"):
+        rows = len(deliveries)
+        pd.DataFrame({
+            "document": pick(list(deliveries) + [None, "abc"], rows),
+            "route": pick(routes + [None, " r001"], rows),
+        }).to_csv(os.path.join(root, "picking", f"{name}.csv"), index=False)
+    times = [f"{hour:02d}:{minute:02d}:{second:02d}" for hour, minute, second in
+             zip(rng.integers(5, 23, 500), rng.integers(0, 60, 500), rng.integers(0, 60, 500))]
+    pd.DataFrame({
+        "destination_bin": pick(list(deliveries) + [None, "x"], lines),
+        "confirmation_time": pick(times + [None, "", "7:5", "bad", "10", " 8:45 ", "9:15abc", "11: 40", "+6:31", "9.5:10", "12:30:"], lines),
+    }).to_csv(os.path.join(root, "picking", "picking.csv"), index=False)
+
+
+def run(builder, output_paths: list) -> tuple:
+    """Run a builder and return its duration and the bytes of each file it wrote."""
+    files_utils.clear_csv_cache()
+    for path in output_paths:
+        if os.path.exists(path):
+            os.remove(path)
+    start = time.perf_counter()
+    builder()
+    seconds = time.perf_counter() - start
+    contents = []
+    for path in output_paths:
+        with open(path, "rb") as f:
+            contents.append(f.read())
+    return seconds, contents
+
+
+if __name__ == "__main__":
+    names = sys.argv[1].split(",") if len(sys.argv) >= 2 else list(BUILDERS)
+    sizes = [int(size) for size in sys.argv[2].split(",")] if len(sys.argv) >= 3 else [10_000, 100_000, 1_000_000]
+    reference_max_lines = int(sys.argv[3]) if len(sys.argv) >= 4 else 100_000
+
+    unknown = [name for name in names if name not in BUILDERS]
+    if unknown:
+        print(f"✗ Error: unknown builders {unknown}, available: {list(BUILDERS)}")
+        sys.exit(1)
+
+    # Both versions write indented stdlib JSON so their files can be compared byte for byte
+    constant.JSON_COMPACT = False
+    files_utils.ORJSON_AVAILABLE = False
+
+    root = tempfile.mkdtemp(prefix="benchmark_dashboard_")
+    constant.OUTPUT_PATH = root
+    failed = False
+    try:
+        for lines in sizes:
+            make_inputs(root, lines)
+            for name in names:
+                current, former = BUILDERS[name]
+                output_paths = [os.path.join(root, "dashboard", f"{output}.json") for output in OUTPUTS.get(name, [name])]
+                seconds, content = run(current, output_paths)
+
+                if lines > reference_max_lines:
+                    print(f"{lines:>9} lines {name}: current {seconds * 1000:9.1f} ms (reference skipped)")
+                    continue
+
+                reference_seconds, expected = run(former, output_paths)
+                if content != expected:
+                    failed = True
+                    print(f"✗ Error: {name} differs from the reference on {lines} lines")
+                    continue
+                print(
+                    f"{lines:>9} lines {name}: identical, reference {reference_seconds * 1000:9.1f} ms, "
+                    f"current {seconds * 1000:9.1f} ms ({reference_seconds / seconds:.1f}x), {sum(map(len, content))} bytes"
+                )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    sys.exit(1 if failed else 0)
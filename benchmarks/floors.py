@@ -0,0 +1,65 @@
+"""
+Microbenchmark of the vectorized floor classifier against the per-row determine_floor.
+Usage: python -m benchmarks.floors [rows] [repeats]
+
+Examples:
+    python -m benchmarks.floors
+    python -m benchmarks.floors 1000000 3
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+from data_script.extraction.dashboard_modules.processing import (
+    determine_floor,
+    classify_floors,
+    floor_bitmask,
+    FLOOR_BITS,
+)
+
+
+def make_source_bins(rows: int) -> pd.Series:
+    """Random source bins covering every floor prefix, unknown prefixes and missing values."""
+    rng = np.random.default_rng(0)
+    prefixes = np.array(["F", "l", " X", "N", "Y", "o", "W", "A", "", "7."], dtype=object)
+    aisles = rng.integers(0, 40, rows).astype(str).astype(object)
+    levels = rng.integers(0, 60, rows).astype(str).astype(object)
+    bins = pd.Series(prefixes[rng.integers(0, len(prefixes), rows)] + aisles + "-" + levels)
+    bins[rng.random(rows) < 0.05] = np.nan
+    return bins
+
+
+def best_of(repeats: int, func) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) >= 2 else 200_000
+    repeats = int(sys.argv[2]) if len(sys.argv) >= 3 else 5
+
+    source_bins = make_source_bins(rows)
+
+    # Both versions must agree before their timings mean anything
+    scalar = source_bins.apply(determine_floor)
+    categorical = classify_floors(source_bins)
+    bitmask = floor_bitmask(source_bins)
+    expected_first = scalar.map(lambda floors: floors[0] if floors else np.nan)
+    expected_bits = scalar.map(lambda floors: sum(FLOOR_BITS[floor] for floor in floors))
+    if not (categorical.astype(object).equals(expected_first) and bitmask.astype(int).equals(expected_bits.astype(int))):
+        print("✗ Error: vectorized classification differs from determine_floor")
+        sys.exit(1)
+
+    scalar_seconds = best_of(repeats, lambda: source_bins.apply(determine_floor))
+    categorical_seconds = best_of(repeats, lambda: classify_floors(source_bins))
+    bitmask_seconds = best_of(repeats, lambda: floor_bitmask(source_bins))
+
+    print(f"{rows} source bins, best of {repeats}")
+    print(f"determine_floor per row: {scalar_seconds * 1000:9.1f} ms")
+    print(f"classify_floors:         {categorical_seconds * 1000:9.1f} ms ({scalar_seconds / categorical_seconds:.1f}x)")
+    print(f"floor_bitmask:           {bitmask_seconds * 1000:9.1f} ms ({scalar_seconds / bitmask_seconds:.1f}x)")
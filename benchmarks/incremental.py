@@ -0,0 +1,339 @@
+"""
+Regression check of the incremental extractions against a full-day extraction, with a fake
+SAP session producing canned exports from a generated day.
+Usage: python -m benchmarks.incremental [extractions] [cycles] [seed]
+
+The day is replayed in the given number of cycles, each one an incremental run on the lines
+SAP has committed so far, and the JSON and the stored lines must be identical to those of a
+single full-day extraction. The replay is repeated with runs interrupted before their state
+is saved (the next run must recover from the rows they appended) and without a time
+selection on the SAP screen (the whole day is exported and filtered locally).
+
+Examples:
+    python -m benchmarks.incremental
+    python -m benchmarks.incremental packing 200 3
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Set
+import numpy as np
+import pandas as pd
+import data_script.config.constants as constant
+from data_script.utils.files_utils import convert_sap_export, convert_to_json, read_table
+from data_script.utils.incremental import row_keys
+from data_script.extraction import picking, packing
+
+DATE = "18.10.2026"
+FIRST_SECOND = 6 * 3600
+LAST_SECOND = 22 * 3600
+
+# Selection fields set on the fake screens when LTAP_CONFIRMATION_TIME_FIELD / CDHDR_TIME_FIELD are unset
+LTAP_TIME_FIELD = "wnd[0]/usr/ctxtI8-LOW"
+CDHDR_TIME_FIELD = "wnd[0]/usr/ctxtI6-LOW"
+
+
+class FakeField:
+    """Screen element of the fake session, keeps the text set on it and ignores actions."""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.selected = False
+        self.caretPosition = 0
+
+    def press(self) -> None:
+        pass
+
+    def select(self) -> None:
+        pass
+
+    def setFocus(self) -> None:
+        pass
+
+
+class FakeSession:
+    """
+    Stand-in for SAPSession writing canned exports instead of driving SAP GUI.
+
+    The fields set with findById are kept, so the export can depend on the
+    selection (e.g. the time from which lines are extracted). save_to_folder
+    writes export(table, fields) in the layout of a SAP list export.
+    """
+
+    def __init__(self, export: Callable[[str, Dict[str, FakeField]], pd.DataFrame]) -> None:
+        self.export = export
+        self.fields: Dict[str, FakeField] = {}
+        self.table_name = ""
+
+    def StartTransaction(self, name: str) -> None:
+        pass
+
+    def table(self, table_name: str) -> None:
+        self.table_name = table_name
+
+    def checkbox_selection(self, selection: List[Any]) -> None:
+        pass
+
+    def findById(self, id: str) -> FakeField:
+        return self.fields.setdefault(id, FakeField())
+
+    def save_to_folder(self, folder: str, filename: str) -> None:
+        df = self.export(self.table_name, self.fields)
+        with open(os.path.join(constant.OUTPUT_PATH, folder, f"{filename}.txt"), "w", encoding="latin-1", newline="") as f:
+            f.write(f"Table {self.table_name}\n\nSelection\n")
+            f.write("\t".join(df.columns) + "\n" + "-" * 40 + "\n")
+            df.to_csv(f, sep="\t", header=False, index=False)
+
+
+def selected_time(fields: Dict[str, FakeField], field_id: str) -> str:
+    """Time entered in a selection field of the fake screen, empty when none."""
+    return fields[field_id].text if field_id in fields else ""
+
+
+def clock_times(seconds: np.ndarray) -> np.ndarray:
+    """Seconds of the day as SAP times (HH:MM:SS)."""
+    return np.array([f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in seconds], dtype=object)
+
+
+def commit_seconds(rng: np.random.Generator, seconds: np.ndarray) -> np.ndarray:
+    """Second each row is committed in SAP, a few rows later than they are confirmed (inside the overlap)."""
+    late = rng.random(len(seconds)) < 0.05
+    delay = rng.integers(1, max(constant.INCREMENTAL_OVERLAP_SECONDS * 3 // 4, 2), len(seconds))
+    return seconds + np.where(late, delay, 0)
+
+
+class PickingDay:
+    """
+    A generated day of LTAP lines and the routes of their deliveries.
+
+    Lines are exported once committed (commit <= clock) and confirmed at or
+    after the time selected on the LTAP screen, lines without a time always.
+    Deliveries ending with 3 have no route yet, so their lines stay pending.
+    """
+
+    def __init__(self, lines: int, seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        seconds = np.sort(rng.integers(FIRST_SECOND, LAST_SECOND, lines))
+        deliveries = 80000000 + rng.integers(0, max(lines // 6, 1), lines)
+        areas = np.array([area for floor in constant.FLOORS.values() for area in floor] + ["ZZ9", ""], dtype=object)
+        times = clock_times(seconds)
+        times[rng.random(lines) < 0.01] = ""
+        self.lines = pd.DataFrame({
+            "Source Bin": [f"B{b}" for b in rng.integers(1, 100, lines)],
+            "Conf.dt.": DATE,
+            "Actual qty": rng.integers(1, 13, lines),
+            "User": rng.choice(np.array(["ANNA", "BOB", "CARL", "DANA", " EVE"], dtype=object), lines),
+            "PAr": rng.choice(areas, lines),
+            "Material": [f"M{m}" for m in rng.integers(1, 500, lines)],
+            "Conf.t.": times,
+            "Dest. Bin": rng.choice(deliveries, lines),
+            "Delivery": deliveries,
+            "TO Number": 1000000 + np.arange(lines),
+        })
+        self.commit = commit_seconds(rng, seconds)
+        # Two identical lines, both must be counted
+        self.lines = pd.concat([self.lines, self.lines.iloc[[10]]], ignore_index=True)
+        self.commit = np.append(self.commit, self.commit[10])
+
+        self.routes = [f"R{i:02d}" for i in range(12)]
+        unique_deliveries = np.unique(deliveries)
+        routed = unique_deliveries[unique_deliveries % 10 != 3]
+        self.route_of = dict(zip(routed.tolist(), rng.choice(np.array(self.routes, dtype=object), len(routed))))
+        self.clock = LAST_SECOND
+
+    def write_reference_files(self, root: str) -> None:
+        for folder in ("picking", "misc"):
+            os.makedirs(os.path.join(root, folder), exist_ok=True)
+        pd.DataFrame({"route": self.routes, "flow": ["y2", "b_flow", "a_flow"] * 4}).to_csv(os.path.join(root, "misc", "routes.csv"), index=False)
+
+    def export(self, table: str, fields: Dict[str, FakeField]) -> pd.DataFrame:
+        if table == "LTAP":
+            since = selected_time(fields, constant.LTAP_CONFIRMATION_TIME_FIELD or "")
+            times = self.lines["Conf.t."]
+            selected = (self.commit <= self.clock) & ((times == "") | (times >= since)).to_numpy()
+            return self.lines[selected]
+
+        # HUTOLINK: routes of the deliveries uploaded from picking_deliveries.csv
+        wanted = pd.read_csv(os.path.join(constant.OUTPUT_PATH, "picking", "picking_deliveries.csv")).iloc[:, 0]
+        documents = [delivery for delivery in sorted(set(wanted)) if delivery in self.route_of]
+        return pd.DataFrame({"Document": documents, "Route": [self.route_of[d] for d in documents]}, columns=["Document", "Route"])
+
+
+def full_picking(day: PickingDay) -> None:
+    """Extract the whole day at once, as picking.py does without LTAP_INCREMENTAL."""
+    session_factory = lambda: FakeSession(day.export)
+    floor_mapping = picking.build_floor_mapping(constant.FLOORS)
+    picking.extract_ltap(DATE, "picking", "picking", session_factory=session_factory)
+    picking.retrieve_deliveries()
+    picking.extract_hutolink("ZORF_HU_TO_LINK", "picking", "zorf_hu_to_link", session_factory)
+    picking.extract_hutolink("ZORF_HUTO_LNKHIS", "picking", "zorf_huto_lnkhis", session_factory)
+    convert_sap_export("zorf_hu_to_link", "picking", constant.HUTOLINK_DF)
+    convert_sap_export("zorf_huto_lnkhis", "picking", constant.HUTOLINK_DF)
+    ltap = picking.prepare_ltap_data(picking.combine(), floor_mapping)
+    lines_per_user = ltap.groupby(["user", "floor", "flow"]).size()
+    nested_dict, total_hours = picking.calculate_picking_hourly_productivity(ltap)
+    picking.calculate_picking_aggregate_metrics(ltap, nested_dict, total_hours, lines_per_user)
+    convert_to_json("picking", "picking", json.loads(json.dumps(nested_dict)))
+
+
+def incremental_picking(day: PickingDay) -> None:
+    """One incremental run on the lines committed at day.clock."""
+    picking.run_incremental_picking(DATE, picking.build_floor_mapping(constant.FLOORS), lambda: FakeSession(day.export))
+
+
+def picking_outputs(root: str) -> List[Any]:
+    """picking.json and the lines of picking.csv in a comparable form."""
+    with open(os.path.join(root, "picking", "picking.json"), "rb") as f:
+        productivity = json.loads(f.read())
+    lines = read_table(os.path.join(root, "picking", "picking.csv"))
+    return [productivity, sorted(row_keys(lines, sorted(lines.columns)))]
+
+
+class PackingDay:
+    """
+    A generated day of box closing change documents (CDHDR) and the floor of the users.
+
+    Documents are exported like the LTAP lines of PickingDay. A few documents
+    close again a box closed shortly before (inside the overlap window) and
+    are never committed before the first one, which is the one counted.
+    """
+
+    def __init__(self, documents: int, seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        seconds = np.sort(rng.integers(FIRST_SECOND, LAST_SECOND, documents))
+        positions = np.arange(documents)
+        closed_again = (rng.random(documents) < 0.05) & (positions > 0)
+        first = np.where(closed_again, np.maximum(positions - rng.integers(1, 4, documents), 0), positions)
+        times = clock_times(seconds)
+        times[rng.random(documents) < 0.01] = ""
+        self.users = ["ANNA", "BOB", "CARL", "DANA", "EVE", "FRED"]
+        self.documents = pd.DataFrame({
+            "Object": "ZORF_BOX",
+            "Object Value": 5000000 + first,
+            "Doc.Number": 900000 + positions,
+            "User": rng.choice(np.array(self.users, dtype=object), documents),
+            "Date": DATE,
+            "Time": times,
+            "TCode": "ZORF_BOX_CLOSING",
+        })
+        commit = commit_seconds(rng, seconds)
+        self.commit = np.maximum(commit, commit[first])
+        self.clock = LAST_SECOND
+
+    def write_reference_files(self, root: str) -> None:
+        for folder in ("packing", "misc"):
+            os.makedirs(os.path.join(root, folder), exist_ok=True)
+        floors = list(constant.PACKING_THRESHOLDS)
+        users_floor = pd.DataFrame({"user": self.users, "floor": [floors[i % len(floors)] for i in range(len(self.users))]})
+        users_floor.to_csv(os.path.join(root, "misc", "users_floor.csv"), index=False)
+
+    def export(self, table: str, fields: Dict[str, FakeField]) -> pd.DataFrame:
+        since = selected_time(fields, constant.CDHDR_TIME_FIELD or "")
+        times = self.documents["Time"]
+        selected = (self.commit <= self.clock) & ((times == "") | (times >= since)).to_numpy()
+        return self.documents[selected]
+
+
+def full_packing(day: PackingDay) -> None:
+    """Extract the whole day at once, as packing.py does without CDHDR_INCREMENTAL."""
+    packing.extract_cdhdr(DATE, "packing", "packing", session_factory=lambda: FakeSession(day.export))
+    convert_sap_export("packing", "packing", constant.CDHDR_DF)
+    cdhdr = packing.prepare_cdhdr_data(packing.combine())
+    packing_per_user = cdhdr.groupby(["user", "floor"]).size()
+    nested_dict, total_hours = packing.calculate_packing_hourly_productivity(cdhdr)
+    packing.calculate_packing_aggregate_metrics(nested_dict, total_hours, packing_per_user)
+    convert_to_json("packing", "packing", json.loads(json.dumps(nested_dict)))
+
+
+def incremental_packing(day: PackingDay) -> None:
+    """One incremental run on the change documents committed at day.clock."""
+    packing.run_incremental_packing(DATE, lambda: FakeSession(day.export))
+
+
+def packing_outputs(root: str) -> List[Any]:
+    """packing.json in a comparable form."""
+    with open(os.path.join(root, "packing", "packing.json"), "rb") as f:
+        return [json.loads(f.read())]
+
+
+# Extraction -> (generated day, full-day extraction, incremental run, outputs, module saving the state,
+# name of the time selection field constant, fake field used when it is unset)
+EXTRACTIONS = {
+    "picking": (PickingDay, full_picking, incremental_picking, picking_outputs, picking, "LTAP_CONFIRMATION_TIME_FIELD", LTAP_TIME_FIELD),
+    "packing": (PackingDay, full_packing, incremental_packing, packing_outputs, packing, "CDHDR_TIME_FIELD", CDHDR_TIME_FIELD),
+}
+
+
+def replay(day: Any, run: Callable[[Any], None], module: Any, cycles: int, interrupted: Set[int]) -> None:
+    """Replay the day in cycles, the cycles in interrupted first run once without saving their state."""
+    save_state = module.save_state
+
+    def interrupt(path: str, state: Dict[str, Any]) -> None:
+        raise RuntimeError("interrupted before saving the state")
+
+    for cycle, clock in enumerate(np.linspace(FIRST_SECOND, LAST_SECOND + 3600, cycles).astype(int)):
+        day.clock = clock
+        if cycle in interrupted:
+            module.save_state = interrupt
+            try:
+                run(day)
+            except RuntimeError:
+                pass
+            finally:
+                module.save_state = save_state
+        run(day)
+
+
+def check(name: str, root: str, rows: int, cycles: int, seed: int, interrupted: Set[int], time_field: Optional[str]) -> bool:
+    """Compare an incremental replay of a generated day with its full-day extraction."""
+    make_day, full, run, outputs, module, field_constant, _ = EXTRACTIONS[name]
+    setattr(constant, field_constant, time_field)
+    results = []
+    for incremental in (False, True):
+        shutil.rmtree(root, ignore_errors=True)
+        day = make_day(rows, seed)
+        day.write_reference_files(root)
+        if incremental:
+            replay(day, run, module, cycles, interrupted)
+        else:
+            full(day)
+        results.append(outputs(root))
+    return results[0] == results[1]
+
+
+if __name__ == "__main__":
+    names = sys.argv[1].split(",") if len(sys.argv) >= 2 else list(EXTRACTIONS)
+    cycles = int(sys.argv[2]) if len(sys.argv) >= 3 else 40
+    seed = int(sys.argv[3]) if len(sys.argv) >= 4 else 0
+    rows = 3000
+
+    unknown = [name for name in names if name not in EXTRACTIONS]
+    if unknown:
+        print(f"✗ Error: unknown extractions {unknown}, available: {list(EXTRACTIONS)}")
+        sys.exit(1)
+
+    root = tempfile.mkdtemp(prefix="benchmark_incremental_")
+    constant.OUTPUT_PATH = root
+    failed = False
+    try:
+        for name in names:
+            field_constant, fake_field = EXTRACTIONS[name][5:]
+            time_field = getattr(constant, field_constant) or fake_field
+            scenarios = {
+                "replay": (set(), time_field),
+                "interrupted runs": (set(range(0, cycles, 7)), time_field),
+                "no time selection": (set(range(3, cycles, 11)), None),
+            }
+            for scenario, (interrupted, field) in scenarios.items():
+                if check(name, root, rows, cycles, seed, interrupted, field):
+                    print(f"{name}, {scenario}: {rows} rows in {cycles} cycles identical to the full-day extraction")
+                else:
+                    failed = True
+                    print(f"✗ Error: {name}, {scenario}: {cycles} cycles differ from the full-day extraction")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    sys.exit(1 if failed else 0)
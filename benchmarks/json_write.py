@@ -0,0 +1,111 @@
+"""
+Benchmark of dump_json/write_json with the stdlib and orjson against the former indented writes.
+Usage: python -m benchmarks.json_write [users] [repeats]
+
+Examples:
+    python -m benchmarks.json_write
+    python -m benchmarks.json_write 1000 3
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import data_script.utils.files_utils as files_utils
+
+
+def make_picking(users: int) -> dict:
+    """Random picking.json content: user -> floor -> flow -> hour counts plus aggregate metrics."""
+    rng = random.Random(0)
+    floors = ["ground_floor", "first_floor", "second_floor"]
+    flows = ["a_flow", "b_flow", "c_flow"]
+    return {
+        f"USER{user:03d}": {
+            floor: {
+                **{
+                    flow: {
+                        f"{hour:02d}": {"count": rng.randint(0, 200), "productivity_color": rng.choice(["red", "orange", "green", "purple"])}
+                        for hour in range(6, 22)
+                    }
+                    for flow in flows
+                },
+                "hours_worked": round(rng.random() * 8, 2),
+                "productivity": round(rng.random() * 100, 2),
+            }
+            for floor in floors
+        }
+        for user in range(users)
+    }
+
+
+def best_of(repeats: int, func) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def former_write(path: str, data: dict) -> None:
+    """The writes before dump_json: a validation dump, then an indented json.dump."""
+    json.dumps(data, indent=4)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+
+
+def parse(path: str, with_orjson: bool) -> dict:
+    with open(path, "rb") as f:
+        content = f.read()
+    return files_utils.orjson.loads(content) if with_orjson else json.loads(content)
+
+
+if __name__ == "__main__":
+    users = int(sys.argv[1]) if len(sys.argv) >= 2 else 300
+    repeats = int(sys.argv[2]) if len(sys.argv) >= 3 else 5
+
+    data = make_picking(users)
+    path = os.path.join(tempfile.mkdtemp(), "picking.json")
+
+    rows = []
+    former_write(path, data)
+    rows.append(("indent=4 + validation dump (before)", os.path.getsize(path),
+                 best_of(repeats, lambda: former_write(path, data)), best_of(repeats, lambda: parse(path, False))))
+
+    modes = [(False, True), (False, False)]
+    if files_utils.ORJSON_AVAILABLE:
+        modes += [(True, True), (True, False)]
+    else:
+        print("orjson is not installed, only the stdlib writer is measured")
+
+    orjson_available = files_utils.ORJSON_AVAILABLE
+    outputs = {}
+    try:
+        for with_orjson, compact in modes:
+            files_utils.ORJSON_AVAILABLE = with_orjson
+            files_utils.write_json(path, data, compact=compact)
+
+            # Every writer must produce the same document, and both backends the same bytes
+            if parse(path, False) != data:
+                print(f"✗ Error: {'orjson' if with_orjson else 'stdlib'} output differs from the data written")
+                sys.exit(1)
+            with open(path, "rb") as f:
+                written = f.read()
+            if written != outputs.setdefault(compact, written):
+                print(f"✗ Error: orjson and stdlib write different {'compact' if compact else 'indented'} files")
+                sys.exit(1)
+
+            rows.append((
+                f"{'orjson' if with_orjson else 'stdlib'} {'compact' if compact else 'indent'}",
+                os.path.getsize(path),
+                best_of(repeats, lambda: files_utils.write_json(path, data, compact=compact)),
+                best_of(repeats, lambda: parse(path, with_orjson)),
+            ))
+    finally:
+        files_utils.ORJSON_AVAILABLE = orjson_available
+
+    print(f"{users} users, best of {repeats}")
+    for label, size, write_seconds, parse_seconds in rows:
+        print(f"{label:38s} {size / 1e6:6.2f} MB  write {write_seconds * 1000:7.1f} ms  parse {parse_seconds * 1000:6.1f} ms")
@@ -0,0 +1,75 @@
+"""
+Benchmark of calculate_picking_aggregate_metrics on synthetic LTAP data of several sizes.
+Usage: python -m benchmarks.picking_metrics [sizes] [users]
+
+Examples:
+    python -m benchmarks.picking_metrics
+    python -m benchmarks.picking_metrics 10000,100000,1000000 100
+"""
+
+import sys
+import copy
+import time
+import numpy as np
+import pandas as pd
+from data_script.extraction.picking import (
+    calculate_picking_hourly_productivity,
+    calculate_picking_aggregate_metrics,
+)
+
+
+def make_ltap(rows: int, users: int) -> pd.DataFrame:
+    """Random prepared LTAP lines for every floor and flow, as prepare_ltap_data returns them."""
+    rng = np.random.default_rng(0)
+    user_names = np.array([f"USER{i:03d}" for i in range(users)], dtype=object)
+    floors = np.array(["ground_floor", "first_floor", "second_floor"], dtype=object)
+    flows = np.array(["a_flow", "b_flow"], dtype=object)
+    hours = np.array([f"{hour:02d}" for hour in range(6, 23)], dtype=object)
+    return pd.DataFrame({
+        "user": user_names[rng.integers(0, users, rows)],
+        "floor": floors[rng.integers(0, len(floors), rows)],
+        "flow": flows[rng.integers(0, len(flows), rows)],
+        "hour": hours[rng.integers(0, len(hours), rows)],
+        "actual_quantity": rng.integers(1, 20, rows),
+    })
+
+
+def items_picked_per_group(ltap: pd.DataFrame, lines_per_user: pd.Series) -> dict:
+    """Reference: one boolean mask over the whole frame per user/floor/flow."""
+    return {
+        (user, floor, flow): int(ltap.loc[(ltap["user"] == user) & (ltap["floor"] == floor) & (ltap["flow"] == flow), "actual_quantity"].sum())
+        for user, floor, flow in lines_per_user.index
+    }
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1].split(",")] if len(sys.argv) >= 2 else [10_000, 100_000, 1_000_000]
+    users = int(sys.argv[2]) if len(sys.argv) >= 3 else 100
+
+    for rows in sizes:
+        ltap = make_ltap(rows, users)
+        lines_per_user = ltap.groupby(["user", "floor", "flow"]).size()
+        hourly, total_hours = calculate_picking_hourly_productivity(ltap)
+
+        nested_dict = copy.deepcopy(hourly)
+        start = time.perf_counter()
+        calculate_picking_aggregate_metrics(ltap, nested_dict, total_hours, lines_per_user)
+        seconds = time.perf_counter() - start
+
+        # The masks are only timed on the smallest size, they grow with groups x rows
+        if rows == min(sizes):
+            start = time.perf_counter()
+            expected = items_picked_per_group(ltap, lines_per_user)
+            mask_seconds = time.perf_counter() - start
+            computed = {
+                (user, floor, flow): metrics["items_picked"]
+                for user, floors in nested_dict.items()
+                for floor, flows in floors.items()
+                for flow, metrics in flows.items()
+            }
+            if computed != expected:
+                print("✗ Error: items_picked differs from the per-group masks")
+                sys.exit(1)
+            print(f"{rows:>9} rows, {len(lines_per_user)} groups: per-group masks {mask_seconds * 1000:9.1f} ms")
+
+        print(f"{rows:>9} rows, {len(lines_per_user)} groups: single groupby {seconds * 1000:9.1f} ms")
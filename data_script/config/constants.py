@@ -3,6 +3,7 @@ import os
 from dotenv import load_dotenv
 from datetime import datetime
 import logging
+from typing import Optional
 
 # Get the project root and path to data
 project_root = Path(__file__).parent.parent.parent
@@ -28,6 +29,27 @@ def get_output_path() -> str:
 # OUTPUT PATH
 OUTPUT_PATH = get_output_path()
 
+# JSON OUTPUT FORMAT (compact by default, set JSON_COMPACT=false for files indented by two spaces,
+# the same layout with and without orjson)
+JSON_COMPACT = os.getenv("JSON_COMPACT", "true").strip().lower() not in ("0", "false", "no")
+
+# INTERMEDIATE TABLES (Feather when pyarrow is installed, set TABLE_FORMAT=csv to disable;
+# TABLE_CSV_EXPORT=false skips the CSV copy written next to each Feather file)
+TABLE_FORMAT = os.getenv("TABLE_FORMAT", "feather").strip().lower()
+TABLE_CSV_EXPORT = os.getenv("TABLE_CSV_EXPORT", "true").strip().lower() not in ("0", "false", "no")
+
+# INCREMENTAL EXTRACTION (LTAP_INCREMENTAL=true / CDHDR_INCREMENTAL=true only process LTAP lines / CDHDR change
+# documents since the last run; up to INCREMENTAL_OVERLAP_SECONDS before the high-water mark are extracted again and deduplicated)
+LTAP_INCREMENTAL = os.getenv("LTAP_INCREMENTAL", "false").strip().lower() in ("1", "true", "yes")
+CDHDR_INCREMENTAL = os.getenv("CDHDR_INCREMENTAL", "false").strip().lower() in ("1", "true", "yes")
+INCREMENTAL_OVERLAP_SECONDS = int(os.getenv("INCREMENTAL_OVERLAP_SECONDS", "120"))
+
+# Selection-screen field of the LTAP confirmation time in Z_TABU_DIS (e.g. "wnd[0]/usr/ctxtI8-LOW").
+# When unset the whole day is extracted and lines before the high-water mark are dropped locally.
+LTAP_CONFIRMATION_TIME_FIELD: Optional[str] = os.getenv("LTAP_CONFIRMATION_TIME_FIELD") or None
+# Same for the CDHDR change time (UTIME)
+CDHDR_TIME_FIELD: Optional[str] = os.getenv("CDHDR_TIME_FIELD") or None
+
 # CHECKBOX SELECTIONS
 LTAP_CHECKBOX = [
     (5, [0, 1, 2, 5, 6, 7]),
@@ -63,7 +85,7 @@ LTAP_DF = {
     'Source Bin': 'source_bin', 'Conf.dt.': 'confirmation_date', 'Actual qty': 'actual_quantity', ' Actual qty': 'actual_quantity', 
     'User': 'user', 'PAr': 'picking_area', 'Material Description': 'material_description', 
     'Conf.t.': 'confirmation_time', 'Material': 'material', 'Dest. Bin': 'destination_bin', 'Delivery': 'delivery', 
-    'Batch': 'batch'
+    'Batch': 'batch', 'TO Number': 'to_number', ' TO Number': 'to_number'
 }
 HUTOLINK_DF = {
     'Document': 'document',
@@ -143,6 +165,12 @@ FLOORS = {
     "first_floor": ["1.4", "1.1", "1.3", "1.2", "1.5", "2.N"],
     "second_floor": ["2.1", "2.3", "2.4", "2.2", "2.P"]
     }
+# First character of a dashboard source bin -> floor
+FLOOR_PREFIXES = {
+    "ground_floor": ["F", "L", "X"],
+    "first_floor": ["N"],
+    "second_floor": ["Y", "O", "W"]
+    }
 BREAKS = {
     "09": 0.75,
     "10": 0.75,
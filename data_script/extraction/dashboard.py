@@ -13,7 +13,7 @@ from data_script.extraction.dashboard_modules.extraction import (
 )
 
 from data_script.extraction.dashboard_modules.transformation import (
-    extract_bflow_routes,
+    refresh_bflow_routes,
     extract_deliveries,
     extract_to_number_from_zorf_huto_link_for_dashboard,
     convert_likp_for_dashboard,
@@ -26,12 +26,11 @@ from data_script.extraction.dashboard_modules.processing import (
     create_deliveries_all_floors,
     create_hu_all_floors,
     create_lines_all_floors,
-    create_deliveries_all_floors_pgi,
-    create_hu_all_floors_pgi,
-    create_lines_all_floors_pgi,
+    create_all_floors_pgi,
     create_picking_hourly_dashboard
 )
 
+from data_script.utils.files_utils import clear_csv_cache
 from data_script.utils.logger import setup_logger
 
 # Set up logger
@@ -45,8 +44,8 @@ if __name__ == "__main__":
         extract_vl06f_for_dashboard("dashboard", "vl06f_dashboard")
         convert_vl06f_for_dashboard()
         
-        # Extract b_flow routes
-        extract_bflow_routes()
+        # Extract b_flow routes when routes.csv changed
+        refresh_bflow_routes()
         
         # Extract LIKP data
         extract_likp_for_dashboard("dashboard", "likp_dashboard")
@@ -75,9 +74,7 @@ if __name__ == "__main__":
         create_deliveries_all_floors()
         create_hu_all_floors()
         create_lines_all_floors()
-        create_deliveries_all_floors_pgi()
-        create_hu_all_floors_pgi()
-        create_lines_all_floors_pgi()
+        create_all_floors_pgi()
         create_picking_hourly_dashboard()
         
         logger.info("Dashboard extraction workflow completed successfully")
@@ -94,4 +91,7 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Unexpected error in dashboard extraction workflow: {e}", exc_info=True)
         raise
+    finally:
+        # The shared frames are only needed during the run
+        clear_csv_cache()
 
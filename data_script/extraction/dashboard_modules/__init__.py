@@ -14,6 +14,7 @@ from data_script.extraction.dashboard_modules.extraction import (
 
 from data_script.extraction.dashboard_modules.transformation import (
     extract_bflow_routes,
+    refresh_bflow_routes,
     extract_deliveries,
     extract_to_number_from_zorf_huto_link_for_dashboard,
     convert_likp_for_dashboard,
@@ -24,9 +25,14 @@ from data_script.extraction.dashboard_modules.transformation import (
 
 from data_script.extraction.dashboard_modules.processing import (
     determine_floor,
+    classify_floors,
+    floor_bitmask,
+    FLOOR_NAMES,
+    FLOOR_BITS,
     create_deliveries_all_floors,
     create_hu_all_floors,
     create_lines_all_floors,
+    create_all_floors_pgi,
     create_deliveries_all_floors_pgi,
     create_hu_all_floors_pgi,
     create_lines_all_floors_pgi,
@@ -41,6 +47,7 @@ __all__ = [
     "extract_ltap_from_to_numbers",
     # Transformation
     "extract_bflow_routes",
+    "refresh_bflow_routes",
     "extract_deliveries",
     "extract_to_number_from_zorf_huto_link_for_dashboard",
     "convert_likp_for_dashboard",
@@ -49,9 +56,14 @@ __all__ = [
     "convert_ltap_to_numbers",
     # Processing
     "determine_floor",
+    "classify_floors",
+    "floor_bitmask",
+    "FLOOR_NAMES",
+    "FLOOR_BITS",
     "create_deliveries_all_floors",
     "create_hu_all_floors",
     "create_lines_all_floors",
+    "create_all_floors_pgi",
     "create_deliveries_all_floors_pgi",
     "create_hu_all_floors_pgi",
     "create_lines_all_floors_pgi",
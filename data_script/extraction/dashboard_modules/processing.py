@@ -1,13 +1,38 @@
-from typing import Dict, Set, Any, Union, List
+import re
+from typing import Dict, Any, Union, List, Optional
 import data_script.config.constants as constant
 from data_script.utils.logger import setup_logger
+from data_script.utils.files_utils import read_csv_cached, table_exists, write_json
+from data_script.utils.reference_data import bflow_routes
+import numpy as np
 import pandas as pd
-from pathlib import Path
-import json
 
 # Set up logger
 logger = setup_logger("dashboard_processing")
 
+# Column dtypes of the CSVs read by the builders, shared through read_csv_cached
+VL06F_DTYPES = {"delivery": "Int64", "hu": str, "wm": "category"}
+LIKP_DTYPES = {"delivery": "Int64"}
+ZORF_DTYPES = {"delivery": "Int64", "to_number": "Int64", "hu": str, "route": "category", "source_bin": "category"}
+LTAP_DTYPES = {"to_number": "Int64", "destination_bin": "Int64", "source_bin": "category", "confirmation_date": "category"}
+ROUTES_DTYPES = {"route": "category"}
+
+# Floor names in FLOOR_PREFIXES order and their bit in floor_bitmask
+FLOOR_NAMES = list(constant.FLOOR_PREFIXES)
+FLOOR_BITS = {floor: 1 << position for position, floor in enumerate(FLOOR_NAMES)}
+
+# First character -> bitmask of every floor it belongs to
+_FLOOR_BITS_BY_PREFIX: Dict[str, int] = {}
+for _floor, _prefixes in constant.FLOOR_PREFIXES.items():
+    for _prefix in _prefixes:
+        _FLOOR_BITS_BY_PREFIX[_prefix.upper()] = _FLOOR_BITS_BY_PREFIX.get(_prefix.upper(), 0) | FLOOR_BITS[_floor]
+
+# First character -> first floor it belongs to
+_FLOOR_BY_PREFIX = {
+    prefix: next(floor for floor in FLOOR_NAMES if bits & FLOOR_BITS[floor])
+    for prefix, bits in _FLOOR_BITS_BY_PREFIX.items()
+}
+
 def determine_floor(source_bin: Union[str, float]) -> List[str]:
     """
     Determine floor(s) based on source bin first character.
@@ -25,17 +50,90 @@ def determine_floor(source_bin: Union[str, float]) -> List[str]:
     if len(source_bin_str) == 0:
         return []
 
-    first_char = source_bin_str[0].upper()
-    floors = []
+    bits = _FLOOR_BITS_BY_PREFIX.get(source_bin_str[0].upper(), 0)
+    return [floor for floor in FLOOR_NAMES if bits & FLOOR_BITS[floor]]
 
-    if first_char in ["F", "L", "X"]:
-        floors.append("ground_floor")
-    if first_char == "N":
-        floors.append("first_floor")
-    if first_char in ["Y", "O", "W"]:
-        floors.append("second_floor")
+def _factorize_bin_prefixes(source_bins: pd.Series):
+    """
+    Factorize source bins and take the upper-cased first character of each distinct bin.
+    
+    Returns:
+        Tuple of (codes, prefixes): codes per row (-1 for missing bins) indexing
+        into the prefix of every distinct bin
+    """
+    codes, uniques = pd.factorize(source_bins)
+    prefixes = pd.Series(uniques, dtype=object).astype(str).str.strip().str[:1].str.upper()
+    return codes, prefixes
 
-    return floors
+def classify_floors(source_bins: pd.Series) -> pd.Series:
+    """
+    Vectorized determine_floor for a whole source bin column.
+    
+    Each distinct bin is classified once, so the cost is driven by the number
+    of different bins rather than the number of rows.
+    
+    Args:
+        source_bins: Source bin identifiers (strings or floats)
+    
+    Returns:
+        Categorical Series aligned with source_bins with FLOOR_NAMES as categories,
+        NaN where no floor applies. A prefix listed for several floors gets the
+        first one; use floor_bitmask to keep all of them.
+    """
+    codes, prefixes = _factorize_bin_prefixes(source_bins)
+    floor_codes = prefixes.map(_FLOOR_BY_PREFIX).map({floor: position for position, floor in enumerate(FLOOR_NAMES)})
+    # Trailing -1 is picked up by missing bins (code -1)
+    floor_codes = np.append(floor_codes.fillna(-1).to_numpy(dtype=np.int8), np.int8(-1))
+    floors = pd.Categorical.from_codes(floor_codes[codes], dtype=pd.CategoricalDtype(FLOOR_NAMES))
+    return pd.Series(floors, index=source_bins.index, name=source_bins.name)
+
+def floor_bitmask(source_bins: pd.Series) -> pd.Series:
+    """
+    Vectorized determine_floor returning every matching floor as a bitmask.
+    
+    Args:
+        source_bins: Source bin identifiers (strings or floats)
+    
+    Returns:
+        uint8 Series aligned with source_bins, with FLOOR_BITS[floor] set for each
+        floor the bin belongs to and 0 where no floor applies
+    """
+    codes, prefixes = _factorize_bin_prefixes(source_bins)
+    bits = prefixes.map(_FLOOR_BITS_BY_PREFIX).fillna(0).to_numpy(dtype=np.uint8)
+    # Trailing 0 is picked up by missing bins (code -1)
+    bits = np.append(bits, np.uint8(0))
+    return pd.Series(bits[codes], index=source_bins.index, name=source_bins.name)
+
+def _format_gi_dates(gi_dates: pd.Series) -> pd.Series:
+    """
+    Vectorized GI date formatting: strings are kept as-is, other values become dd.mm.YYYY.
+
+    Args:
+        gi_dates: GI date column as read from CSV
+
+    Returns:
+        Series of date strings, NaN where the date is missing or cannot be parsed
+    """
+    gi_dates = gi_dates.where(gi_dates != "")
+    if gi_dates.dtype == object:
+        # read_csv only yields strings (or NaN) in object columns
+        return gi_dates
+    return pd.to_datetime(gi_dates, errors="coerce").dt.strftime("%d.%m.%Y")
+
+def _has_value(values: pd.Series) -> pd.Series:
+    """
+    Vectorized `pd.notna(value) and str(value).strip() != ''`.
+
+    Args:
+        values: Column to check
+
+    Returns:
+        Boolean Series aligned with values
+    """
+    # Check each distinct value once, missing values (code -1) pick up the trailing False
+    codes, uniques = pd.factorize(values)
+    filled = (pd.Series(uniques, dtype=object).astype(str).str.strip() != "").to_numpy(dtype=bool)
+    return pd.Series(np.append(filled, False)[codes], index=values.index)
 
 def create_deliveries_all_floors() -> None:
     """
@@ -61,23 +159,19 @@ def create_deliveries_all_floors() -> None:
         }
         
         # Validate files exist
-        if not Path(vl06f_file).exists():
+        if not table_exists(vl06f_file):
             error_msg = f"Required file not found: vl06f_dashboard.csv at {vl06f_file}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         for name, path in zorf_files.items():
-            if not Path(path).exists():
+            if not table_exists(path):
                 error_msg = f"Required file not found: {name} at {path}"
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
         
         logger.debug("Reading VL06F dashboard file")
-        try:
-            vl06f_df = pd.read_csv(vl06f_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for vl06f_dashboard.csv, trying latin-1")
-            vl06f_df = pd.read_csv(vl06f_file, encoding="latin-1")
+        vl06f_df = read_csv_cached(vl06f_file, dtype=VL06F_DTYPES)
         
         # Validate required columns
         required_cols = ["delivery", "gi_date", "wm"]
@@ -87,127 +181,68 @@ def create_deliveries_all_floors() -> None:
             logger.error(error_msg)
             raise KeyError(error_msg)
         
-        vl06f_df["delivery"] = vl06f_df["delivery"].fillna(0).astype(int)
         logger.debug(f"VL06F dashboard: {len(vl06f_df)} rows")
         
         # Read all zorf files
         all_zorf_dfs = []
         for name, path in zorf_files.items():
             logger.debug(f"Reading {name}")
-            try:
-                df = pd.read_csv(path, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                df = pd.read_csv(path, encoding="latin-1")
+            df = read_csv_cached(path, dtype=ZORF_DTYPES)
             
             if "delivery" not in df.columns or "source_bin" not in df.columns:
                 error_msg = f"Missing required columns in {name}"
                 logger.error(error_msg)
                 raise KeyError(error_msg)
             
-            df["delivery"] = df["delivery"].fillna(0).astype(int)
             all_zorf_dfs.append(df)
             logger.debug(f"{name}: {len(df)} rows")
         
-        # Create delivery -> floors mapping
+        # Create delivery -> floor table (one row per delivery and floor)
         logger.debug("Creating delivery to floors mapping")
-        delivery_to_floors: Dict[int, Set[str]] = {}
-        
-        for zorf_df in all_zorf_dfs:
-            for _, row in zorf_df.iterrows():
-                delivery = int(row['delivery'])
-                source_bin = row['source_bin']
-                
-                if delivery == 0:
-                    continue
-                
-                floors = determine_floor(source_bin)
-                
-                if delivery not in delivery_to_floors:
-                    delivery_to_floors[delivery] = set()
-                
-                delivery_to_floors[delivery].update(floors)
-        
-        logger.info(f"Mapped {len(delivery_to_floors)} deliveries to floors")
-        
-        # Process VL06F data and track unique deliveries
+        zorf_df = pd.concat([df[["delivery", "source_bin"]] for df in all_zorf_dfs], ignore_index=True)
+        zorf_df["delivery"] = zorf_df["delivery"].fillna(0).astype(int)
+        zorf_df = zorf_df[zorf_df["delivery"] != 0]
+        zorf_df["floor"] = classify_floors(zorf_df["source_bin"])
+        delivery_floors = zorf_df.dropna(subset=["floor"])[["delivery", "floor"]].drop_duplicates()
+        
+        logger.info(f"Mapped {zorf_df['delivery'].nunique()} deliveries to floors")
+        
+        # Select VL06F deliveries with a valid status and GI date
         logger.debug("Processing VL06F data and counting unique deliveries")
+        deliveries = pd.DataFrame({
+            "delivery": vl06f_df["delivery"].fillna(0).astype(int),
+            "date": _format_gi_dates(vl06f_df["gi_date"]),
+            "wm": vl06f_df["wm"].astype(str).str.strip().str.lower(),
+        })
+        deliveries = deliveries[
+            (deliveries["delivery"] != 0)
+            & deliveries["wm"].isin(["a", "b", "c"])
+            & deliveries["date"].notna()
+        ]
+        
+        # Every date with a valid delivery is reported, in order of first appearance
         result: Dict[str, Dict[str, Any]] = {}
+        for date_str in deliveries["date"].drop_duplicates():
+            result[date_str] = {
+                floor: {status: {'amount_of_deliveries': 0} for status in ['a', 'b', 'c']}
+                for floor in ['ground_floor', 'first_floor', 'second_floor']
+            }
+            result[date_str].update({status: {'amount_of_deliveries': 0} for status in ['a', 'b', 'c']})
         
-        for _, row in vl06f_df.iterrows():
-            delivery = int(row['delivery'])
-            gi_date = row['gi_date']
-            wm = str(row['wm']).strip().upper()
-            
-            if delivery == 0:
-                continue
-            
-            if wm not in ['A', 'B', 'C']:
-                continue
-            
-            if pd.isna(gi_date) or gi_date == '':
-                continue
-            
-            # Format date
-            try:
-                if isinstance(gi_date, str):
-                    date_str = gi_date
-                else:
-                    date_str = pd.to_datetime(gi_date).strftime("%d.%m.%Y")
-            except Exception:
-                continue
-            
-            # Initialize date entry if not exists
-            if date_str not in result:
-                result[date_str] = {
-                    'ground_floor': {
-                        'a': {'amount_of_deliveries': set()},
-                        'b': {'amount_of_deliveries': set()},
-                        'c': {'amount_of_deliveries': set()}
-                    },
-                    'first_floor': {
-                        'a': {'amount_of_deliveries': set()},
-                        'b': {'amount_of_deliveries': set()},
-                        'c': {'amount_of_deliveries': set()}
-                    },
-                    'second_floor': {
-                        'a': {'amount_of_deliveries': set()},
-                        'b': {'amount_of_deliveries': set()},
-                        'c': {'amount_of_deliveries': set()}
-                    },
-                    'a': {'amount_of_deliveries': set()},
-                    'b': {'amount_of_deliveries': set()},
-                    'c': {'amount_of_deliveries': set()}
-                }
-            
-            # Get floors for this delivery
-            floors = delivery_to_floors.get(delivery, set())
-            
-            if not floors:
-                continue
-            
-            # Add this delivery to each floor it belongs to
-            for floor in floors:
-                result[date_str][floor][wm.lower()]['amount_of_deliveries'].add(delivery)
-            
-            # Add to total count
-            result[date_str][wm.lower()]['amount_of_deliveries'].add(delivery)
-        
-        # Convert sets to counts
-        logger.debug("Converting sets to counts")
-        for date_str in result:
-            for floor in ['ground_floor', 'first_floor', 'second_floor']:
-                for status in ['a', 'b', 'c']:
-                    result[date_str][floor][status]['amount_of_deliveries'] = len(result[date_str][floor][status]['amount_of_deliveries'])
-            
-            for status in ['a', 'b', 'c']:
-                result[date_str][status]['amount_of_deliveries'] = len(result[date_str][status]['amount_of_deliveries'])
+        # Count unique deliveries per floor, and in total for deliveries on any floor
+        deliveries_with_floors = deliveries.merge(delivery_floors, on="delivery", how="inner")
+        per_floor = deliveries_with_floors.groupby(["date", "floor", "wm"], observed=True)["delivery"].nunique()
+        for (date_str, floor, status), count in per_floor.items():
+            result[date_str][floor][status]['amount_of_deliveries'] = int(count)
+        
+        totals = deliveries[deliveries["delivery"].isin(delivery_floors["delivery"])].groupby(["date", "wm"])["delivery"].nunique()
+        for (date_str, status), count in totals.items():
+            result[date_str][status]['amount_of_deliveries'] = int(count)
         
         # Save to JSON file
         output_path = f"{constant.OUTPUT_PATH}/dashboard/deliveries_all_floors.json"
         logger.info(f"Saving deliveries_all_floors.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        write_json(output_path, result)
         
         logger.info(f"Successfully created deliveries_all_floors.json with {len(result)} dates")
         
@@ -249,29 +284,25 @@ def create_hu_all_floors() -> None:
         }
         
         # Validate files exist
-        if not Path(vl06f_file).exists():
+        if not table_exists(vl06f_file):
             error_msg = f"Required file not found: vl06f_dashboard.csv at {vl06f_file}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         for name, path in zorf_files.items():
-            if not Path(path).exists():
+            if not table_exists(path):
                 error_msg = f"Required file not found: {name} at {path}"
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
         
         for name, path in ltap_files.items():
-            if not Path(path).exists():
+            if not table_exists(path):
                 error_msg = f"Required file not found: {name} at {path}"
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
         
         logger.debug("Reading VL06F dashboard file")
-        try:
-            vl06f_df = pd.read_csv(vl06f_file, dtype={'hu': str}, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for vl06f_dashboard.csv, trying latin-1")
-            vl06f_df = pd.read_csv(vl06f_file, dtype={'hu': str}, encoding="latin-1")
+        vl06f_df = read_csv_cached(vl06f_file, dtype=VL06F_DTYPES)
         
         if "hu" not in vl06f_df.columns or "gi_date" not in vl06f_df.columns:
             error_msg = "Missing required columns in vl06f_dashboard.csv"
@@ -284,11 +315,7 @@ def create_hu_all_floors() -> None:
         all_zorf_dfs = []
         for name, path in zorf_files.items():
             logger.debug(f"Reading {name}")
-            try:
-                df = pd.read_csv(path, dtype={'hu': str}, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                df = pd.read_csv(path, dtype={'hu': str}, encoding="latin-1")
+            df = read_csv_cached(path, dtype=ZORF_DTYPES)
             
             if "hu" not in df.columns or "to_number" not in df.columns or "source_bin" not in df.columns:
                 error_msg = f"Missing required columns in {name}"
@@ -302,11 +329,7 @@ def create_hu_all_floors() -> None:
         all_ltap_dfs = []
         for name, path in ltap_files.items():
             logger.debug(f"Reading {name}")
-            try:
-                df = pd.read_csv(path, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                df = pd.read_csv(path, encoding="latin-1")
+            df = read_csv_cached(path, dtype=LTAP_DTYPES)
             
             if "to_number" not in df.columns or "confirmation_date" not in df.columns:
                 error_msg = f"Missing required columns in {name}"
@@ -316,148 +339,64 @@ def create_hu_all_floors() -> None:
             all_ltap_dfs.append(df)
             logger.debug(f"{name}: {len(df)} rows")
         
-        # Create HU to info mapping
+        # Create HU -> TO number and HU -> floor tables (ZORF HUs carry a "00" prefix)
         logger.debug("Creating HU to info mapping")
-        hu_to_info: Dict[str, Dict[str, Set[Any]]] = {}
-        
-        for zorf_df in all_zorf_dfs:
-            for _, row in zorf_df.iterrows():
-                hu = str(row['hu']).strip() if pd.notna(row['hu']) else ''
-                to_number = row['to_number']
-                source_bin = row['source_bin']
-                
-                if hu == '':
-                    continue
-                
-                if hu not in hu_to_info:
-                    hu_to_info[hu] = {'to_numbers': set(), 'source_bins': set()}
-                
-                if pd.notna(to_number):
-                    hu_to_info[hu]['to_numbers'].add(to_number)
-                if pd.notna(source_bin):
-                    hu_to_info[hu]['source_bins'].add(source_bin)
-        
-        logger.info(f"Mapped {len(hu_to_info)} HUs to info")
-        
-        # Create to_number to confirmation_dates mapping
+        zorf_df = pd.concat([df[["hu", "to_number", "source_bin"]] for df in all_zorf_dfs], ignore_index=True)
+        zorf_df["hu"] = zorf_df["hu"].str.strip()
+        zorf_df = zorf_df[zorf_df["hu"].notna() & (zorf_df["hu"] != "")]
+        
+        hu_to_numbers = zorf_df[["hu", "to_number"]].dropna(subset=["to_number"]).drop_duplicates()
+        hu_floors = zorf_df[["hu", "source_bin"]].assign(floor=classify_floors(zorf_df["source_bin"]))
+        hu_floors = hu_floors.dropna(subset=["floor"])[["hu", "floor"]].drop_duplicates()
+        
+        logger.info(f"Mapped {zorf_df['hu'].nunique()} HUs to info")
+        
+        # Create TO number -> confirmed table (a TO is confirmed when all its lines are)
         logger.debug("Creating TO number to confirmation dates mapping")
-        to_number_to_confirmation_dates: Dict[Any, List[bool]] = {}
-        
-        for ltap_df in all_ltap_dfs:
-            for _, row in ltap_df.iterrows():
-                to_number = row['to_number']
-                confirmation_date = row['confirmation_date']
-                
-                if pd.notna(to_number):
-                    if to_number not in to_number_to_confirmation_dates:
-                        to_number_to_confirmation_dates[to_number] = []
-                    
-                    if pd.notna(confirmation_date) and str(confirmation_date).strip() != '':
-                        to_number_to_confirmation_dates[to_number].append(True)
-                    else:
-                        to_number_to_confirmation_dates[to_number].append(False)
-        
-        logger.info(f"Mapped {len(to_number_to_confirmation_dates)} TO numbers to confirmation status")
-        
-        # Process VL06F data
+        ltap_df = pd.concat(
+            [df[["to_number"]].assign(confirmed=_has_value(df["confirmation_date"])) for df in all_ltap_dfs],
+            ignore_index=True
+        )
+        ltap_df = ltap_df[ltap_df["to_number"].notna()]
+        to_confirmed = ltap_df.groupby("to_number")["confirmed"].all()
+        
+        logger.info(f"Mapped {len(to_confirmed)} TO numbers to confirmation status")
+        
+        # A HU is picked when every one of its TOs is in LTAP and confirmed
+        hu_to_numbers["confirmed"] = hu_to_numbers["to_number"].map(to_confirmed).eq(True)
+        hu_status = hu_to_numbers.groupby("hu")["confirmed"].all().map({True: "picked", False: "not_picked"})
+        hu_status = hu_status.rename("status").rename_axis("zorf_hu").reset_index()
+        
+        # Join VL06F HUs with their status and floors
         logger.debug("Processing VL06F data and determining picked status")
+        hus = pd.DataFrame({
+            "hu": vl06f_df["hu"].str.strip(),
+            "date": _format_gi_dates(vl06f_df["gi_date"]),
+        })
+        hus = hus[hus["hu"].notna() & (hus["hu"] != "") & hus["date"].notna()]
+        hus["zorf_hu"] = "00" + hus["hu"]
+        hus = hus.merge(hu_status, on="zorf_hu", how="inner")
+        hus = hus.merge(hu_floors.rename(columns={"hu": "zorf_hu"}), on="zorf_hu", how="inner")
+        
+        # Dates are reported in order of first appearance of a HU on any floor
         result: Dict[str, Dict[str, Any]] = {}
+        for date_str in hus["date"].drop_duplicates():
+            result[date_str] = {
+                floor: {'picked': {'amount_of_hu': 0}, 'not_picked': {'amount_of_hu': 0}}
+                for floor in ['ground_floor', 'first_floor', 'second_floor']
+            }
+            result[date_str].update({'picked': {'amount_of_hu': 0}, 'not_picked': {'amount_of_hu': 0}})
         
-        for _, row in vl06f_df.iterrows():
-            hu = str(row['hu']).strip() if pd.notna(row['hu']) else ''
-            gi_date = row['gi_date']
-            
-            if hu == '':
-                continue
-            
-            if pd.isna(gi_date) or gi_date == '':
-                continue
-            
-            # Format date
-            try:
-                if isinstance(gi_date, str):
-                    date_str = gi_date
-                else:
-                    date_str = pd.to_datetime(gi_date).strftime("%d.%m.%Y")
-            except Exception:
-                continue
-            
-            # Convert HU from vl06f format to zorf format
-            hu_with_zeros = f"00{hu}"
-            
-            if hu_with_zeros not in hu_to_info:
-                continue
-            
-            # Get all to_numbers for this HU
-            to_numbers = hu_to_info[hu_with_zeros]['to_numbers']
-            
-            if len(to_numbers) == 0:
-                continue
-            
-            # Check if all to_numbers have confirmation_date
-            is_picked = True
-            for to_number in to_numbers:
-                if to_number not in to_number_to_confirmation_dates:
-                    is_picked = False
-                    break
-                
-                confirmation_statuses = to_number_to_confirmation_dates[to_number]
-                if len(confirmation_statuses) == 0 or not all(confirmation_statuses):
-                    is_picked = False
-                    break
-            
-            # Get floors from source_bins
-            source_bins = hu_to_info[hu_with_zeros]['source_bins']
-            floors = set()
-            for source_bin in source_bins:
-                floor_list = determine_floor(source_bin)
-                floors.update(floor_list)
-            
-            if not floors:
-                continue
-            
-            # Initialize date entry if not exists
-            if date_str not in result:
-                result[date_str] = {
-                    'ground_floor': {
-                        'picked': {'amount_of_hu': set()},
-                        'not_picked': {'amount_of_hu': set()}
-                    },
-                    'first_floor': {
-                        'picked': {'amount_of_hu': set()},
-                        'not_picked': {'amount_of_hu': set()}
-                    },
-                    'second_floor': {
-                        'picked': {'amount_of_hu': set()},
-                        'not_picked': {'amount_of_hu': set()}
-                    },
-                    'picked': {'amount_of_hu': set()},
-                    'not_picked': {'amount_of_hu': set()}
-                }
-            
-            # Add this HU to each floor it belongs to
-            picked_status = 'picked' if is_picked else 'not_picked'
-            
-            for floor in floors:
-                result[date_str][floor][picked_status]['amount_of_hu'].add(hu)
-            
-            result[date_str][picked_status]['amount_of_hu'].add(hu)
-        
-        # Convert sets to counts
-        logger.debug("Converting sets to counts")
-        for date_str in result:
-            for floor in ['ground_floor', 'first_floor', 'second_floor']:
-                result[date_str][floor]['picked']['amount_of_hu'] = len(result[date_str][floor]['picked']['amount_of_hu'])
-                result[date_str][floor]['not_picked']['amount_of_hu'] = len(result[date_str][floor]['not_picked']['amount_of_hu'])
-            
-            result[date_str]['picked']['amount_of_hu'] = len(result[date_str]['picked']['amount_of_hu'])
-            result[date_str]['not_picked']['amount_of_hu'] = len(result[date_str]['not_picked']['amount_of_hu'])
+        for (date_str, floor, status), count in hus.groupby(["date", "floor", "status"], observed=True)["hu"].nunique().items():
+            result[date_str][floor][status]['amount_of_hu'] = int(count)
+        
+        for (date_str, status), count in hus.groupby(["date", "status"])["hu"].nunique().items():
+            result[date_str][status]['amount_of_hu'] = int(count)
         
         # Save to JSON file
         output_path = f"{constant.OUTPUT_PATH}/dashboard/hu_all_floors.json"
         logger.info(f"Saving hu_all_floors.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        write_json(output_path, result)
         
         logger.info(f"Successfully created hu_all_floors.json with {len(result)} dates")
         
@@ -490,135 +429,83 @@ def create_lines_all_floors() -> None:
         ltap_file = f"{constant.OUTPUT_PATH}/dashboard/ltap_vl06f_to_numbers.csv"
         
         # Validate files exist
-        if not Path(vl06f_file).exists():
+        if not table_exists(vl06f_file):
             error_msg = f"Required file not found: vl06f_dashboard.csv at {vl06f_file}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
-        if not Path(ltap_file).exists():
+        if not table_exists(ltap_file):
             error_msg = f"Required file not found: ltap_vl06f_to_numbers.csv at {ltap_file}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         logger.debug("Reading VL06F dashboard file")
-        try:
-            vl06f_df = pd.read_csv(vl06f_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for vl06f_dashboard.csv, trying latin-1")
-            vl06f_df = pd.read_csv(vl06f_file, encoding="latin-1")
+        vl06f_df = read_csv_cached(vl06f_file, dtype=VL06F_DTYPES)
         
         if "delivery" not in vl06f_df.columns or "gi_date" not in vl06f_df.columns:
             error_msg = "Missing required columns in vl06f_dashboard.csv"
             logger.error(error_msg)
             raise KeyError(error_msg)
         
-        vl06f_df["delivery"] = vl06f_df["delivery"].fillna(0).astype(int)
+        vl06f_deliveries = vl06f_df["delivery"].fillna(0).astype(int)
         logger.debug(f"VL06F dashboard: {len(vl06f_df)} rows")
         
         logger.debug("Reading LTAP file")
-        try:
-            ltap_vl06f_to_numbers_df = pd.read_csv(ltap_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for ltap_vl06f_to_numbers.csv, trying latin-1")
-            ltap_vl06f_to_numbers_df = pd.read_csv(ltap_file, encoding="latin-1")
+        ltap_vl06f_to_numbers_df = read_csv_cached(ltap_file, dtype=LTAP_DTYPES)
         
         if "destination_bin" not in ltap_vl06f_to_numbers_df.columns or "source_bin" not in ltap_vl06f_to_numbers_df.columns or "confirmation_date" not in ltap_vl06f_to_numbers_df.columns:
             error_msg = "Missing required columns in ltap_vl06f_to_numbers.csv"
             logger.error(error_msg)
             raise KeyError(error_msg)
         
-        ltap_vl06f_to_numbers_df["destination_bin"] = ltap_vl06f_to_numbers_df["destination_bin"].fillna(0).astype(int)
         logger.debug(f"LTAP file: {len(ltap_vl06f_to_numbers_df)} rows")
         
-        # Create delivery -> date mapping
+        # Create delivery -> date table (first valid GI date of each delivery)
         logger.debug("Creating delivery to date mapping")
-        unique_deliveries = vl06f_df["delivery"].drop_duplicates()
-        delivery_to_date: Dict[int, str] = {}
-        
-        for _, row in vl06f_df.iterrows():
-            delivery = int(row['delivery'])
-            gi_date = row['gi_date']
-            
-            if delivery == 0:
-                continue
-            
-            if pd.isna(gi_date) or gi_date == '':
-                continue
-            
-            try:
-                if isinstance(gi_date, str):
-                    date_str = gi_date
-                else:
-                    date_str = pd.to_datetime(gi_date).strftime("%d.%m.%Y")
-            except Exception:
-                continue
-            
-            if delivery not in delivery_to_date:
-                delivery_to_date[delivery] = date_str
+        delivery_dates = pd.DataFrame({
+            "delivery": vl06f_deliveries,
+            "date": _format_gi_dates(vl06f_df["gi_date"]),
+        })
+        delivery_dates = delivery_dates[(delivery_dates["delivery"] != 0) & delivery_dates["date"].notna()]
+        delivery_dates = delivery_dates.drop_duplicates("delivery")
         
-        logger.info(f"Mapped {len(delivery_to_date)} deliveries to dates")
+        logger.info(f"Mapped {len(delivery_dates)} deliveries to dates")
         
-        # Process each unique delivery
+        # Join LTAP lines onto their delivery's date
         logger.debug("Processing deliveries and counting lines")
+        lines = ltap_vl06f_to_numbers_df[["destination_bin", "source_bin", "confirmation_date"]]
+        lines = lines.assign(destination_bin=lines["destination_bin"].fillna(0).astype(int)).merge(
+            delivery_dates, left_on="destination_bin", right_on="delivery", how="inner"
+        )
+        
+        # Dates are reported in the order deliveries first appear in VL06F, for deliveries with LTAP lines
+        delivery_rank = pd.Series(range(len(vl06f_df)), index=vl06f_deliveries).groupby(level=0).min()
+        matched = lines[["delivery", "date"]].drop_duplicates("delivery")
+        matched = matched.assign(rank=matched["delivery"].map(delivery_rank)).sort_values("rank", kind="stable")
+        
         result: Dict[str, Dict[str, Any]] = {}
+        for date_str in matched["date"].drop_duplicates():
+            result[date_str] = {
+                floor: {'picked': {'amount_of_lines': 0}, 'not_picked': {'amount_of_lines': 0}}
+                for floor in ['ground_floor', 'first_floor', 'second_floor']
+            }
+            result[date_str].update({'picked': {'amount_of_lines': 0}, 'not_picked': {'amount_of_lines': 0}})
         
-        for delivery in unique_deliveries:
-            if delivery == 0:
-                continue
-            
-            if delivery not in delivery_to_date:
-                continue
-            
-            date_str = delivery_to_date[delivery]
-            
-            # Find matching rows in LTAP file
-            matching_rows = ltap_vl06f_to_numbers_df[ltap_vl06f_to_numbers_df["destination_bin"] == delivery]
-            
-            if len(matching_rows) == 0:
-                continue
-            
-            # Initialize date entry if not exists
-            if date_str not in result:
-                result[date_str] = {
-                    'ground_floor': {
-                        'picked': {'amount_of_lines': 0},
-                        'not_picked': {'amount_of_lines': 0}
-                    },
-                    'first_floor': {
-                        'picked': {'amount_of_lines': 0},
-                        'not_picked': {'amount_of_lines': 0}
-                    },
-                    'second_floor': {
-                        'picked': {'amount_of_lines': 0},
-                        'not_picked': {'amount_of_lines': 0}
-                    },
-                    'picked': {'amount_of_lines': 0},
-                    'not_picked': {'amount_of_lines': 0}
-                }
-            
-            # Process each row
-            for _, row in matching_rows.iterrows():
-                source_bin = row['source_bin']
-                confirmation_date = row['confirmation_date']
-                
-                floors = determine_floor(source_bin)
-                
-                if not floors:
-                    continue
-                
-                is_picked = pd.notna(confirmation_date) and str(confirmation_date).strip() != ''
-                picked_status = 'picked' if is_picked else 'not_picked'
-                
-                for floor in floors:
-                    result[date_str][floor][picked_status]['amount_of_lines'] += 1
-                
-                result[date_str][picked_status]['amount_of_lines'] += 1
+        # Count lines per floor and picked status
+        lines["floor"] = classify_floors(lines["source_bin"])
+        lines = lines.dropna(subset=["floor"])
+        lines["status"] = _has_value(lines["confirmation_date"]).map({True: "picked", False: "not_picked"})
+        
+        for (date_str, floor, status), count in lines.groupby(["date", "floor", "status"], observed=True).size().items():
+            result[date_str][floor][status]['amount_of_lines'] = int(count)
+        
+        for (date_str, status), count in lines.groupby(["date", "status"]).size().items():
+            result[date_str][status]['amount_of_lines'] = int(count)
         
         # Save to JSON file
         output_path = f"{constant.OUTPUT_PATH}/dashboard/lines_all_floors.json"
         logger.info(f"Saving lines_all_floors.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        write_json(output_path, result)
         
         logger.info(f"Successfully created lines_all_floors.json with {len(result)} dates")
         
@@ -631,20 +518,47 @@ def create_lines_all_floors() -> None:
         logger.error(error_msg, exc_info=True)
         raise RuntimeError(error_msg) from e
 
-def create_deliveries_all_floors_pgi() -> None:
+# PGI outputs produced by create_all_floors_pgi: name -> (JSON file, count field)
+PGI_OUTPUTS = {
+    "deliveries": ("deliveries_all_floors_pgi", "amount_of_deliveries_pgi"),
+    "hu": ("hu_all_floors_pgi", "amount_of_hu_pgi"),
+    "lines": ("lines_all_floors_pgi", "amount_of_lines_pgi"),
+}
+
+def _pgi_result(today: str, field: str, per_floor: pd.Series, total: int) -> Dict[str, Dict[str, Any]]:
+    """Shape per-floor counts and the overall count as one PGI JSON document."""
+    counts: Dict[str, Any] = {
+        floor: {field: int(per_floor.get(floor, 0))}
+        for floor in ['ground_floor', 'first_floor', 'second_floor']
+    }
+    counts[field] = int(total)
+    return {today: counts}
+
+def create_all_floors_pgi(outputs: Optional[List[str]] = None) -> None:
     """
-    Create deliveries_all_floors_pgi.json with PGI delivery counts for today.
+    Create the PGI JSON files (deliveries, HU and lines for today) in one pass.
+    
+    Reads the LIKP dashboard data and the LIKP ZORF files once, classifies
+    every ZORF line by floor once and derives all requested outputs from it:
+    unique deliveries (present in LIKP), unique HUs and line counts per floor.
     
-    Processes LIKP dashboard data and ZORF files to count unique deliveries
-    by floor for today's date (PGI - Post Goods Issue).
+    Args:
+        outputs: Subset of PGI_OUTPUTS keys to create, all of them by default
     
     Raises:
         FileNotFoundError: If required files don't exist
         KeyError: If required columns don't exist
-        ValueError: If data processing fails
+        ValueError: If an unknown output is requested
     """
     try:
-        logger.info("Starting deliveries_all_floors_pgi JSON creation")
+        outputs = list(PGI_OUTPUTS) if outputs is None else list(outputs)
+        unknown = [name for name in outputs if name not in PGI_OUTPUTS]
+        if unknown:
+            error_msg = f"Unknown PGI outputs: {unknown}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        logger.info(f"Starting all_floors_pgi JSON creation for {', '.join(outputs)}")
         
         today = constant.get_today()
         
@@ -656,317 +570,135 @@ def create_deliveries_all_floors_pgi() -> None:
         }
         
         # Validate files exist
-        if not Path(likp_file).exists():
+        if "deliveries" in outputs and not table_exists(likp_file):
             error_msg = f"Required file not found: likp_dashboard.csv at {likp_file}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         for name, path in zorf_files.items():
-            if not Path(path).exists():
+            if not table_exists(path):
                 error_msg = f"Required file not found: {name} at {path}"
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
         
-        logger.debug("Reading LIKP dashboard file")
-        try:
-            likp_df = pd.read_csv(likp_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for likp_dashboard.csv, trying latin-1")
-            likp_df = pd.read_csv(likp_file, encoding="latin-1")
-        
-        if "delivery" not in likp_df.columns:
-            error_msg = "Missing required column 'delivery' in likp_dashboard.csv"
-            logger.error(error_msg)
-            raise KeyError(error_msg)
+        # Columns each output needs from the ZORF files
+        required_cols = ["source_bin"]
+        if "deliveries" in outputs:
+            required_cols.append("delivery")
+        if "hu" in outputs:
+            required_cols.append("hu")
         
-        likp_df["delivery"] = likp_df["delivery"].fillna(0).astype(int)
-        unique_deliveries = set(likp_df["delivery"].drop_duplicates())
-        unique_deliveries.discard(0)
-        logger.debug(f"Found {len(unique_deliveries)} unique deliveries")
-        
-        # Read zorf files
+        # Read zorf files once and classify every line by floor
         all_zorf_dfs = []
         for name, path in zorf_files.items():
             logger.debug(f"Reading {name}")
-            try:
-                df = pd.read_csv(path, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                df = pd.read_csv(path, encoding="latin-1")
+            df = read_csv_cached(path, dtype=ZORF_DTYPES)
             
-            if "delivery" not in df.columns or "source_bin" not in df.columns:
-                error_msg = f"Missing required columns in {name}"
+            missing_cols = [col for col in required_cols if col not in df.columns]
+            if missing_cols:
+                error_msg = f"Missing required columns in {name}: {missing_cols}"
                 logger.error(error_msg)
                 raise KeyError(error_msg)
             
-            df["delivery"] = df["delivery"].fillna(0).astype(int)
-            all_zorf_dfs.append(df)
+            all_zorf_dfs.append(df[required_cols])
             logger.debug(f"{name}: {len(df)} rows")
         
-        # Create delivery -> floors mapping
-        logger.debug("Creating delivery to floors mapping")
-        delivery_to_floors: Dict[int, Set[str]] = {}
-        
-        for zorf_df in all_zorf_dfs:
-            for _, row in zorf_df.iterrows():
-                delivery = int(row['delivery'])
-                source_bin = row['source_bin']
-                
-                if delivery == 0:
-                    continue
-                
-                floors = determine_floor(source_bin)
-                
-                if delivery not in delivery_to_floors:
-                    delivery_to_floors[delivery] = set()
-                
-                delivery_to_floors[delivery].update(floors)
-        
-        logger.info(f"Mapped {len(delivery_to_floors)} deliveries to floors")
-        
-        # Initialize result dictionary
-        result: Dict[str, Dict[str, Any]] = {
-            today: {
-                'ground_floor': {'amount_of_deliveries_pgi': set()},
-                'first_floor': {'amount_of_deliveries_pgi': set()},
-                'second_floor': {'amount_of_deliveries_pgi': set()},
-                'amount_of_deliveries_pgi': set()
-            }
-        }
+        zorf_df = pd.concat(all_zorf_dfs, ignore_index=True)
+        zorf_df["floor"] = classify_floors(zorf_df["source_bin"])
+        lines = zorf_df.dropna(subset=["floor"])
+        logger.info(f"Classified {len(zorf_df)} ZORF lines, {len(lines)} on a known floor")
         
-        # Process each unique delivery
-        logger.debug("Processing deliveries and counting by floor")
-        for delivery in unique_deliveries:
-            floors = delivery_to_floors.get(delivery, set())
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        if "deliveries" in outputs:
+            logger.debug("Reading LIKP dashboard file")
+            likp_df = read_csv_cached(likp_file, dtype=LIKP_DTYPES)
             
-            if not floors:
-                continue
+            if "delivery" not in likp_df.columns:
+                error_msg = "Missing required column 'delivery' in likp_dashboard.csv"
+                logger.error(error_msg)
+                raise KeyError(error_msg)
             
-            for floor in floors:
-                result[today][floor]['amount_of_deliveries_pgi'].add(delivery)
+            likp_deliveries = likp_df["delivery"].fillna(0).astype(int)
+            likp_deliveries = likp_deliveries[likp_deliveries != 0]
+            logger.debug(f"Found {likp_deliveries.nunique()} unique deliveries")
             
-            result[today]['amount_of_deliveries_pgi'].add(delivery)
+            # Deliveries of today's LIKP export with at least one line on a floor
+            delivery_lines = lines.assign(delivery=lines["delivery"].fillna(0).astype(int))
+            delivery_lines = delivery_lines[delivery_lines["delivery"].isin(likp_deliveries)]
+            per_floor = delivery_lines.groupby("floor", observed=True)["delivery"].nunique()
+            results["deliveries"] = _pgi_result(today, PGI_OUTPUTS["deliveries"][1], per_floor, delivery_lines["delivery"].nunique())
         
-        # Convert sets to counts
-        logger.debug("Converting sets to counts")
-        result[today]['ground_floor']['amount_of_deliveries_pgi'] = len(result[today]['ground_floor']['amount_of_deliveries_pgi'])
-        result[today]['first_floor']['amount_of_deliveries_pgi'] = len(result[today]['first_floor']['amount_of_deliveries_pgi'])
-        result[today]['second_floor']['amount_of_deliveries_pgi'] = len(result[today]['second_floor']['amount_of_deliveries_pgi'])
-        result[today]['amount_of_deliveries_pgi'] = len(result[today]['amount_of_deliveries_pgi'])
+        if "hu" in outputs:
+            hu_lines = lines.assign(hu=lines["hu"].str.strip())
+            hu_lines = hu_lines[hu_lines["hu"].notna() & (hu_lines["hu"] != "")]
+            per_floor = hu_lines.groupby("floor", observed=True)["hu"].nunique()
+            results["hu"] = _pgi_result(today, PGI_OUTPUTS["hu"][1], per_floor, hu_lines["hu"].nunique())
         
-        # Save to JSON file
-        output_path = f"{constant.OUTPUT_PATH}/dashboard/deliveries_all_floors_pgi.json"
-        logger.info(f"Saving deliveries_all_floors_pgi.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        if "lines" in outputs:
+            per_floor = lines.groupby("floor", observed=True).size()
+            results["lines"] = _pgi_result(today, PGI_OUTPUTS["lines"][1], per_floor, len(lines))
+        
+        # Save to JSON files
+        for name in outputs:
+            filename = PGI_OUTPUTS[name][0]
+            output_path = f"{constant.OUTPUT_PATH}/dashboard/{filename}.json"
+            logger.info(f"Saving {filename}.json to {output_path}")
+            write_json(output_path, results[name])
         
-        logger.info(f"Successfully created deliveries_all_floors_pgi.json for {today}")
+        logger.info(f"Successfully created all_floors_pgi JSON files for {today}")
         
     except FileNotFoundError:
         raise
     except KeyError:
         raise
+    except ValueError:
+        raise
     except Exception as e:
-        error_msg = f"Unexpected error creating deliveries_all_floors_pgi.json: {e}"
+        error_msg = f"Unexpected error creating all_floors_pgi JSON files: {e}"
         logger.error(error_msg, exc_info=True)
         raise RuntimeError(error_msg) from e
 
+def create_deliveries_all_floors_pgi() -> None:
+    """
+    Create deliveries_all_floors_pgi.json with PGI delivery counts for today.
+    
+    Use create_all_floors_pgi to create all PGI files from a single pass.
+    """
+    create_all_floors_pgi(["deliveries"])
+
 def create_hu_all_floors_pgi() -> None:
     """
     Create hu_all_floors_pgi.json with PGI HU counts for today.
     
-    Processes ZORF files to count unique HUs by floor for today's date (PGI).
-    
-    Raises:
-        FileNotFoundError: If required files don't exist
-        KeyError: If required columns don't exist
-        ValueError: If data processing fails
+    Use create_all_floors_pgi to create all PGI files from a single pass.
     """
-    try:
-        logger.info("Starting hu_all_floors_pgi JSON creation")
-        
-        today = constant.get_today()
-        
-        # File paths
-        zorf_files = {
-            "zorf_hu_to_link_likp": f"{constant.OUTPUT_PATH}/dashboard/zorf_hu_to_link_likp.csv",
-            "zorf_huto_lnkhis_likp": f"{constant.OUTPUT_PATH}/dashboard/zorf_huto_lnkhis_likp.csv"
-        }
-        
-        # Validate files exist
-        for name, path in zorf_files.items():
-            if not Path(path).exists():
-                error_msg = f"Required file not found: {name} at {path}"
-                logger.error(error_msg)
-                raise FileNotFoundError(error_msg)
-        
-        # Read zorf files
-        all_zorf_dfs = []
-        for name, path in zorf_files.items():
-            logger.debug(f"Reading {name}")
-            try:
-                df = pd.read_csv(path, dtype={'hu': str}, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                df = pd.read_csv(path, dtype={'hu': str}, encoding="latin-1")
-            
-            if "hu" not in df.columns or "source_bin" not in df.columns:
-                error_msg = f"Missing required columns in {name}"
-                logger.error(error_msg)
-                raise KeyError(error_msg)
-            
-            all_zorf_dfs.append(df)
-            logger.debug(f"{name}: {len(df)} rows")
-        
-        # Create HU -> floors mapping
-        logger.debug("Creating HU to floors mapping")
-        hu_to_floors: Dict[str, Set[str]] = {}
-        
-        for zorf_df in all_zorf_dfs:
-            for _, row in zorf_df.iterrows():
-                hu = str(row['hu']).strip() if pd.notna(row['hu']) else ''
-                source_bin = row['source_bin']
-                
-                if hu == '':
-                    continue
-                
-                floors = determine_floor(source_bin)
-                
-                if hu not in hu_to_floors:
-                    hu_to_floors[hu] = set()
-                
-                hu_to_floors[hu].update(floors)
-        
-        logger.info(f"Mapped {len(hu_to_floors)} HUs to floors")
-        
-        # Initialize result dictionary
-        result: Dict[str, Dict[str, Any]] = {
-            today: {
-                'ground_floor': {'amount_of_hu_pgi': set()},
-                'first_floor': {'amount_of_hu_pgi': set()},
-                'second_floor': {'amount_of_hu_pgi': set()},
-                'amount_of_hu_pgi': set()
-            }
-        }
-        
-        # Process each unique HU
-        logger.debug("Processing HUs and counting by floor")
-        for hu, floors in hu_to_floors.items():
-            if not floors:
-                continue
-            
-            for floor in floors:
-                result[today][floor]['amount_of_hu_pgi'].add(hu)
-            
-            result[today]['amount_of_hu_pgi'].add(hu)
-        
-        # Convert sets to counts
-        logger.debug("Converting sets to counts")
-        result[today]['ground_floor']['amount_of_hu_pgi'] = len(result[today]['ground_floor']['amount_of_hu_pgi'])
-        result[today]['first_floor']['amount_of_hu_pgi'] = len(result[today]['first_floor']['amount_of_hu_pgi'])
-        result[today]['second_floor']['amount_of_hu_pgi'] = len(result[today]['second_floor']['amount_of_hu_pgi'])
-        result[today]['amount_of_hu_pgi'] = len(result[today]['amount_of_hu_pgi'])
-        
-        # Save to JSON file
-        output_path = f"{constant.OUTPUT_PATH}/dashboard/hu_all_floors_pgi.json"
-        logger.info(f"Saving hu_all_floors_pgi.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
-        
-        logger.info(f"Successfully created hu_all_floors_pgi.json for {today}")
-        
-    except FileNotFoundError:
-        raise
-    except KeyError:
-        raise
-    except Exception as e:
-        error_msg = f"Unexpected error creating hu_all_floors_pgi.json: {e}"
-        logger.error(error_msg, exc_info=True)
-        raise RuntimeError(error_msg) from e
+    create_all_floors_pgi(["hu"])
 
 def create_lines_all_floors_pgi() -> None:
     """
     Create lines_all_floors_pgi.json with PGI line counts for today.
     
-    Processes ZORF files to count lines by floor for today's date (PGI).
-    
-    Raises:
-        FileNotFoundError: If required files don't exist
-        KeyError: If required columns don't exist
-        ValueError: If data processing fails
+    Use create_all_floors_pgi to create all PGI files from a single pass.
     """
-    try:
-        logger.info("Starting lines_all_floors_pgi JSON creation")
-        
-        today = constant.get_today()
-        
-        # File paths
-        zorf_files = {
-            "zorf_hu_to_link_likp": f"{constant.OUTPUT_PATH}/dashboard/zorf_hu_to_link_likp.csv",
-            "zorf_huto_lnkhis_likp": f"{constant.OUTPUT_PATH}/dashboard/zorf_huto_lnkhis_likp.csv"
-        }
-        
-        # Validate files exist
-        for name, path in zorf_files.items():
-            if not Path(path).exists():
-                error_msg = f"Required file not found: {name} at {path}"
-                logger.error(error_msg)
-                raise FileNotFoundError(error_msg)
-        
-        # Initialize result dictionary
-        result: Dict[str, Dict[str, Any]] = {
-            today: {
-                'ground_floor': {'amount_of_lines_pgi': 0},
-                'first_floor': {'amount_of_lines_pgi': 0},
-                'second_floor': {'amount_of_lines_pgi': 0},
-                'amount_of_lines_pgi': 0
-            }
-        }
-        
-        # Process each row (each row represents a line)
-        logger.debug("Processing lines and counting by floor")
-        for name, path in zorf_files.items():
-            logger.debug(f"Reading {name}")
-            try:
-                zorf_df = pd.read_csv(path, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                zorf_df = pd.read_csv(path, encoding="latin-1")
-            
-            if "source_bin" not in zorf_df.columns:
-                error_msg = f"Missing required column 'source_bin' in {name}"
-                logger.error(error_msg)
-                raise KeyError(error_msg)
-            
-            for _, row in zorf_df.iterrows():
-                source_bin = row['source_bin']
-                
-                floors = determine_floor(source_bin)
-                
-                if not floors:
-                    continue
-                
-                for floor in floors:
-                    result[today][floor]['amount_of_lines_pgi'] += 1
-                
-                result[today]['amount_of_lines_pgi'] += 1
-        
-        # Save to JSON file
-        output_path = f"{constant.OUTPUT_PATH}/dashboard/lines_all_floors_pgi.json"
-        logger.info(f"Saving lines_all_floors_pgi.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
-        
-        logger.info(f"Successfully created lines_all_floors_pgi.json for {today}")
-        
-    except FileNotFoundError:
-        raise
-    except KeyError:
-        raise
-    except Exception as e:
-        error_msg = f"Unexpected error creating lines_all_floors_pgi.json: {e}"
-        logger.error(error_msg, exc_info=True)
-        raise RuntimeError(error_msg) from e
+    create_all_floors_pgi(["lines"])
+
+def _document_numbers(values: pd.Series) -> pd.Series:
+    """Parse SAP document numbers like int(float(value)), NaN where that fails."""
+    numbers = pd.to_numeric(values, errors='coerce')
+    numbers = numbers.where(np.isfinite(numbers))
+    return np.trunc(numbers).astype('Int64')
+
+# HH:MM[:...] with optional whitespace and signs, the forms int() accepts per part
+_TIME_PATTERN = r'^\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*(?::|$)'
+
+def _half_hour_buckets(times: pd.Series) -> pd.Series:
+    """Map confirmation times to 30-minute keys ("0900", "0930"), NaN if unparseable."""
+    parts = times.dropna().astype(str).str.strip().str.extract(_TIME_PATTERN, flags=re.ASCII).dropna()
+    hours = parts[0].astype(int)
+    minutes = parts[1].astype(int)
+    buckets = hours.astype(str).str.zfill(2) + np.where(minutes < 30, "00", "30")
+    return buckets.reindex(times.index)
 
 def create_picking_hourly_dashboard() -> None:
     """
@@ -992,69 +724,53 @@ def create_picking_hourly_dashboard() -> None:
         }
         
         # Validate files exist
-        if not Path(bflow_routes_file).exists():
+        if not table_exists(bflow_routes_file):
             error_msg = f"Required file not found: bflow_routes.csv at {bflow_routes_file}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         for name, path in picking_files.items():
-            if not Path(path).exists():
+            if not table_exists(path):
                 error_msg = f"Required file not found: {name} at {path}"
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
         
         # Read bflow_routes.csv
         logger.debug("Reading bflow_routes.csv")
-        try:
-            bflow_routes_df = pd.read_csv(bflow_routes_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for bflow_routes.csv, trying latin-1")
-            bflow_routes_df = pd.read_csv(bflow_routes_file, encoding="latin-1")
-        
-        if "route" not in bflow_routes_df.columns:
-            error_msg = "Missing required column 'route' in bflow_routes.csv"
-            logger.error(error_msg)
-            raise KeyError(error_msg)
-        
-        valid_routes = set(bflow_routes_df['route'].str.strip().str.upper())
+        valid_routes = bflow_routes()
         logger.info(f"Found {len(valid_routes)} valid b_flow routes")
         
         # Read picking productivity files and create document -> route mapping
         logger.debug("Reading picking productivity files and creating document to route mapping")
-        document_to_route: Dict[int, str] = {}
+        route_links = []
         
         for name, path in [("huto_lnkhis", picking_files["huto_lnkhis"]), ("hu_to_link", picking_files["hu_to_link"])]:
             logger.debug(f"Reading {name}")
-            try:
-                df = pd.read_csv(path, encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"UTF-8 encoding failed for {name}, trying latin-1")
-                df = pd.read_csv(path, encoding="latin-1")
+            df = read_csv_cached(path, dtype=ROUTES_DTYPES)
             
             if "document" not in df.columns or "route" not in df.columns:
                 error_msg = f"Missing required columns in {name}"
                 logger.error(error_msg)
                 raise KeyError(error_msg)
             
-            for _, row in df.iterrows():
-                document = row['document']
-                route = str(row['route']).strip().upper() if pd.notna(row['route']) else ''
-                if pd.notna(document) and route:
-                    try:
-                        doc_value = int(float(document))
-                        document_to_route[doc_value] = route
-                    except (ValueError, TypeError):
-                        continue
+            route_links.append(df[["document", "route"]])
+        
+        links = pd.concat(route_links, ignore_index=True)
+        links = links[links["route"].notna()]
+        links = pd.DataFrame({
+            "document": _document_numbers(links["document"]),
+            "route": links["route"].astype(str).str.strip().str.upper()
+        })
+        links = links[links["document"].notna() & (links["route"] != "")]
+        
+        # Later files and rows override earlier ones, hu_to_link wins over huto_lnkhis
+        document_to_route = links.drop_duplicates("document", keep="last").set_index("document")["route"]
         
         logger.info(f"Mapped {len(document_to_route)} documents to routes")
         
         # Read picking_productivity_ltap.csv
         logger.debug("Reading picking_productivity_ltap.csv")
-        try:
-            ltap_df = pd.read_csv(picking_files["ltap"], encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for picking_productivity_ltap.csv, trying latin-1")
-            ltap_df = pd.read_csv(picking_files["ltap"], encoding="latin-1")
+        ltap_df = read_csv_cached(picking_files["ltap"])
         
         if "destination_bin" not in ltap_df.columns or "confirmation_time" not in ltap_df.columns:
             error_msg = "Missing required columns in picking_productivity_ltap.csv"
@@ -1063,67 +779,20 @@ def create_picking_hourly_dashboard() -> None:
         
         logger.debug(f"LTAP file: {len(ltap_df)} rows")
         
-        # Process each row in ltap_df
+        # Keep LTAP lines whose destination document belongs to a b_flow route
         logger.debug("Processing LTAP data and counting lines by hour")
-        result: Dict[str, Dict[str, int]] = {}
+        routes = _document_numbers(ltap_df["destination_bin"]).map(document_to_route)
+        bflow_lines = ltap_df.loc[routes.isin(valid_routes), "confirmation_time"]
         
-        for _, row in ltap_df.iterrows():
-            destination_bin = row['destination_bin']
-            confirmation_time = row['confirmation_time']
-            
-            if pd.isna(destination_bin):
-                continue
-            
-            try:
-                dest_bin_value = int(float(destination_bin))
-            except (ValueError, TypeError):
-                continue
-            
-            if dest_bin_value not in document_to_route:
-                continue
-            
-            route = document_to_route[dest_bin_value]
-            
-            if route not in valid_routes:
-                continue
-            
-            if pd.isna(confirmation_time) or confirmation_time == '':
-                continue
-            
-            try:
-                time_str = str(confirmation_time).strip()
-                if ':' not in time_str:
-                    continue
-                
-                time_parts = time_str.split(':')
-                if len(time_parts) < 2:
-                    continue
-                
-                hour = int(time_parts[0])
-                minute = int(time_parts[1])
-                
-                # Group into 30-minute intervals
-                if minute < 30:
-                    hour_key = f"{hour:02d}00"
-                else:
-                    hour_key = f"{hour:02d}30"
-                
-                if hour_key not in result:
-                    result[hour_key] = {'lines_picked': 0}
-                
-                result[hour_key]['lines_picked'] += 1
-                
-            except (ValueError, IndexError, TypeError):
-                continue
-        
-        # Sort by hour key
-        sorted_result = dict(sorted(result.items()))
+        # Count lines per 30-minute interval
+        buckets = _half_hour_buckets(bflow_lines).dropna()
+        counts = buckets.value_counts().sort_index()
+        sorted_result = {hour_key: {'lines_picked': int(count)} for hour_key, count in counts.items()}
         
         # Save to JSON file
         output_path = f"{constant.OUTPUT_PATH}/dashboard/picking_hourly_dashboard.json"
         logger.info(f"Saving picking_hourly_dashboard.json to {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(sorted_result, f, indent=4, ensure_ascii=False)
+        write_json(output_path, sorted_result)
         
         logger.info(f"Successfully created picking_hourly_dashboard.json with {len(sorted_result)} time intervals")
         
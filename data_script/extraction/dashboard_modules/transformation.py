@@ -1,8 +1,8 @@
 from typing import Dict, Optional
 import data_script.config.constants as constant
 from data_script.utils.logger import setup_logger
-from data_script.utils.files_utils import convert_to_csv, rename
-import pandas as pd
+from data_script.utils.files_utils import convert_sap_export, write_csv, read_table, read_text_csv, table_exists
+from data_script.utils.reference_data import misc_path, refresh_derived
 from pathlib import Path
 
 # Set up logger
@@ -33,11 +33,7 @@ def extract_bflow_routes() -> None:
         logger.debug(f"Reading routes.csv from {routes_file}")
         
         # Read CSV file
-        try:
-            routes_df = pd.read_csv(routes_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for routes.csv, trying latin-1")
-            routes_df = pd.read_csv(routes_file, encoding="latin-1")
+        routes_df = read_text_csv(routes_file)
         
         logger.debug(f"routes.csv: {len(routes_df)} rows, {len(routes_df.columns)} columns")
         
@@ -61,7 +57,7 @@ def extract_bflow_routes() -> None:
         
         # Save to CSV
         output_file = f"{constant.OUTPUT_PATH}/misc/bflow_routes.csv"
-        bflow_routes_df.to_csv(output_file, index=False)
+        write_csv(bflow_routes_df, output_file)
         logger.info(f"Successfully saved b_flow routes to bflow_routes.csv")
         
     except FileNotFoundError:
@@ -73,6 +69,23 @@ def extract_bflow_routes() -> None:
         logger.error(error_msg, exc_info=True)
         raise RuntimeError(error_msg) from e
 
+def refresh_bflow_routes(force: bool = False) -> bool:
+    """
+    Extract b_flow routes only when routes.csv changed since the last extraction.
+    
+    Args:
+        force: Extract even when routes.csv didn't change
+    
+    Returns:
+        bool: Whether bflow_routes.csv was written
+    
+    Raises:
+        FileNotFoundError: If routes.csv doesn't exist
+    """
+    return refresh_derived(
+        "bflow_routes", misc_path("routes.csv"), [misc_path("bflow_routes.csv")], extract_bflow_routes, force
+    )
+
 def extract_deliveries(input_file: str, output_file: str) -> None:
     """
     Extract unique deliveries from a CSV file.
@@ -92,19 +105,15 @@ def extract_deliveries(input_file: str, output_file: str) -> None:
         input_path = f"{constant.OUTPUT_PATH}/dashboard/{input_file}"
         
         # Validate file exists
-        if not Path(input_path).exists():
+        if not table_exists(input_path):
             error_msg = f"Required file not found: {input_file} at {input_path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         logger.debug(f"Reading {input_file}")
         
-        # Read CSV file
-        try:
-            df = pd.read_csv(input_path, encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning(f"UTF-8 encoding failed for {input_file}, trying latin-1")
-            df = pd.read_csv(input_path, encoding="latin-1")
+        # Read table (Feather when available, otherwise CSV)
+        df = read_table(input_path)
         
         logger.debug(f"{input_file}: {len(df)} rows, {len(df.columns)} columns")
         
@@ -123,7 +132,7 @@ def extract_deliveries(input_file: str, output_file: str) -> None:
         
         # Save to CSV
         output_path = f"{constant.OUTPUT_PATH}/dashboard/{output_file}"
-        deliveries_df.to_csv(output_path, index=False)
+        write_csv(deliveries_df, output_path)
         logger.info(f"Successfully saved deliveries to {output_file}")
         
     except FileNotFoundError:
@@ -158,7 +167,7 @@ def extract_to_number_from_zorf_huto_link_for_dashboard() -> None:
         
         # Validate files exist
         for name, path in file_paths.items():
-            if not Path(path).exists():
+            if not table_exists(path):
                 error_msg = f"Required file not found: {name} at {path}"
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
@@ -175,12 +184,8 @@ def extract_to_number_from_zorf_huto_link_for_dashboard() -> None:
             try:
                 logger.debug(f"Reading {file_key}")
                 
-                # Read CSV file
-                try:
-                    df = pd.read_csv(input_path, encoding="utf-8")
-                except UnicodeDecodeError:
-                    logger.warning(f"UTF-8 encoding failed for {file_key}, trying latin-1")
-                    df = pd.read_csv(input_path, encoding="latin-1")
+                # Read table (Feather when available, otherwise CSV)
+                df = read_table(input_path)
                 
                 logger.debug(f"{file_key}: {len(df)} rows, {len(df.columns)} columns")
                 
@@ -199,7 +204,7 @@ def extract_to_number_from_zorf_huto_link_for_dashboard() -> None:
                 
                 # Save to CSV
                 output_path = f"{constant.OUTPUT_PATH}/dashboard/{output_files[file_key]}"
-                to_number_df.to_csv(output_path, index=False)
+                write_csv(to_number_df, output_path)
                 logger.info(f"Successfully saved TO numbers to {output_files[file_key]}")
                 
             except (FileNotFoundError, KeyError):
@@ -224,7 +229,7 @@ def convert_likp_for_dashboard() -> None:
     """
     Convert and rename LIKP dashboard file.
     
-    Converts the LIKP text file to CSV and renames columns according to LIKP_DF mapping.
+    Converts the LIKP text file to a table, renaming columns according to LIKP_DF mapping.
     
     Raises:
         FileNotFoundError: If LIKP file doesn't exist
@@ -233,11 +238,8 @@ def convert_likp_for_dashboard() -> None:
     try:
         logger.info("Starting LIKP dashboard file conversion and renaming")
         
-        convert_to_csv("likp_dashboard", "dashboard")
-        logger.info("LIKP file converted to CSV successfully")
-        
-        rename("likp_dashboard", "dashboard", constant.LIKP_DF)
-        logger.info("LIKP file columns renamed successfully")
+        convert_sap_export("likp_dashboard", "dashboard", constant.LIKP_DF)
+        logger.info("LIKP file converted and renamed successfully")
         
     except FileNotFoundError as e:
         logger.error(f"File not found during LIKP conversion: {e}")
@@ -251,7 +253,7 @@ def convert_vl06f_for_dashboard() -> None:
     """
     Convert and rename VL06F dashboard file.
     
-    Converts the VL06F text file to CSV and renames columns according to VL06F_DF mapping.
+    Converts the VL06F text file to a table, renaming columns according to VL06F_DF mapping.
     Handles 'Handling Unit' column as string type.
     
     Raises:
@@ -261,11 +263,8 @@ def convert_vl06f_for_dashboard() -> None:
     try:
         logger.info("Starting VL06F dashboard file conversion and renaming")
         
-        convert_to_csv("vl06f_dashboard", "dashboard", dtype={"Handling Unit": "str"})
-        logger.info("VL06F file converted to CSV successfully")
-        
-        rename("vl06f_dashboard", "dashboard", constant.VL06F_DF, dtype={"Handling Unit": "str"})
-        logger.info("VL06F file columns renamed successfully")
+        convert_sap_export("vl06f_dashboard", "dashboard", constant.VL06F_DF, dtype={"Handling Unit": "str"})
+        logger.info("VL06F file converted and renamed successfully")
         
     except FileNotFoundError as e:
         logger.error(f"File not found during VL06F conversion: {e}")
@@ -298,12 +297,8 @@ def convert_zorf_huto_link_for_dashboard() -> None:
         for filename in files:
             try:
                 logger.debug(f"Converting {filename}")
-                convert_to_csv(filename, "dashboard", dtype={"Handling Unit": "str"})
-                logger.debug(f"{filename} converted to CSV successfully")
-                
-                logger.debug(f"Renaming {filename}")
-                rename(filename, "dashboard", constant.HUTOLINK_DASHBOARD_DF, dtype={"Handling Unit": "str"})
-                logger.debug(f"{filename} columns renamed successfully")
+                convert_sap_export(filename, "dashboard", constant.HUTOLINK_DASHBOARD_DF, dtype={"Handling Unit": "str"})
+                logger.debug(f"{filename} converted and renamed successfully")
                 
             except FileNotFoundError as e:
                 logger.error(f"File not found during {filename} conversion: {e}")
@@ -343,12 +338,8 @@ def convert_ltap_to_numbers() -> None:
         for filename in files:
             try:
                 logger.debug(f"Converting {filename}")
-                convert_to_csv(filename, "dashboard")
-                logger.debug(f"{filename} converted to CSV successfully")
-                
-                logger.debug(f"Renaming {filename}")
-                rename(filename, "dashboard", constant.LTAP_DASHBOARD_DF)
-                logger.debug(f"{filename} columns renamed successfully")
+                convert_sap_export(filename, "dashboard", constant.LTAP_DASHBOARD_DF)
+                logger.debug(f"{filename} converted and renamed successfully")
                 
             except FileNotFoundError as e:
                 logger.error(f"File not found during {filename} conversion: {e}")
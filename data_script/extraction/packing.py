@@ -1,28 +1,36 @@
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, Callable, Optional, Dict, List, Tuple
 from data_script.utils.SAP import SAPSession
 import data_script.config.constants as constant
+from data_script.utils.reference_data import users_floor_table
 from data_script.utils.logger import setup_logger
 from data_script.utils.retry import retry_sap_operation
-from data_script.utils.files_utils import convert_to_csv, rename, convert_to_json
+from data_script.utils.productivity import hourly_productivity
+from data_script.utils.files_utils import convert_sap_export, convert_to_json, read_table, table_exists
+from data_script.utils.incremental import (
+    STATE_TIMESTAMP_FORMAT, NO_HOUR, load_state, save_state, state_rows, state_frame, key_frame,
+    timestamps, window_start, in_window, window_entries, prune_window, seen_mask, merge_counts,
+)
+from datetime import datetime
+import numpy as np
 import pandas as pd
-from pathlib import Path
-from collections import defaultdict
 
 # Set up logger
 logger = setup_logger("packing_extraction")
 
-def _extract_cdhdr_internal(date: str, folder: str, filename: str) -> None:
+def _extract_cdhdr_internal(date: str, folder: str, filename: str, since: Optional[str] = None, session_factory: Callable[[], Any] = SAPSession) -> None:
     """Internal extraction function (called by retry wrapper)"""
-    logger.info(f"Starting CDHDR extraction for date: {date}, filename: {filename}, folder: {folder}")
+    logger.info(f"Starting CDHDR extraction for date: {date}, since: {since}, filename: {filename}, folder: {folder}")
 
     # Initialize SAP
-    extractor = SAPSession()
+    extractor = session_factory()
 
     # Start transaction and fill in fields
     extractor.StartTransaction("Z_TABU_DIS")
     extractor.table("CDHDR")
     extractor.checkbox_selection(constant.CDHDR_CHECKBOX)
     extractor.findById('wnd[0]/usr/ctxtI5-LOW').text = date
+    if since and constant.CDHDR_TIME_FIELD:
+        extractor.findById(constant.CDHDR_TIME_FIELD).text = since
     extractor.findById("wnd[0]/usr/ctxtI7-LOW").text = "ZORF_BOX_CLOSING"
     extractor.findById("wnd[0]/usr/btn%_I4_%_APP_%-VALU_PUSH").press()
     extractor.findById("wnd[1]/tbar[0]/btn[23]").press()
@@ -37,7 +45,7 @@ def _extract_cdhdr_internal(date: str, folder: str, filename: str) -> None:
     extractor.save_to_folder(folder, filename)
     logger.info(f"Data saved to {filename}")
 
-def extract_cdhdr(date: str, folder: str, filename: str) -> None:
+def extract_cdhdr(date: str, folder: str, filename: str, since: Optional[str] = None, session_factory: Callable[[], Any] = SAPSession) -> None:
     """
     Extract CDHDR data for packing productivity with automatic retry
     
@@ -45,18 +53,24 @@ def extract_cdhdr(date: str, folder: str, filename: str) -> None:
         date: Date string for the extraction
         folder: Ouput folder
         filename: Output filename
+        since: Only extract change documents from this time (HH:MM:SS) on, when
+            CDHDR_TIME_FIELD is configured
+        session_factory: Creates the SAP session, SAPSession by default
     """
     retry_sap_operation(
-        lambda: _extract_cdhdr_internal(date, folder, filename),
+        lambda: _extract_cdhdr_internal(date, folder, filename, since, session_factory),
         func_name="extract_cdhdr"
     )
 
-def combine() -> pd.DataFrame:
+def combine(cdhdr: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Combine CDHDR file with users data.
     
     Reads packing.csv and users_floor.csv, merges them, and removes duplicates.
     
+    Args:
+        cdhdr: Change documents to combine instead of reading packing.csv
+    
     Returns:
         DataFrame: Combined dataframe with merged user information
         
@@ -71,10 +85,12 @@ def combine() -> pd.DataFrame:
         "cdhdr": f"{constant.OUTPUT_PATH}/packing/packing.csv",
         "users": f"{constant.OUTPUT_PATH}/misc/users_floor.csv"
     }
+    if cdhdr is not None:
+        del file_paths["cdhdr"]
     
     # Validate files exist
     for name, path in file_paths.items():
-        if not Path(path).exists():
+        if not table_exists(path):
             error_msg = f"Required file not found: {name} at {path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
@@ -82,23 +98,16 @@ def combine() -> pd.DataFrame:
     
     try:
         # Read CDHDR file
-        logger.debug("Reading packing.csv")
-        try:
-            cdhdr = pd.read_csv(file_paths["cdhdr"], encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for packing.csv, trying latin-1")
-            cdhdr = pd.read_csv(file_paths["cdhdr"], encoding="latin-1")
+        if cdhdr is None:
+            logger.debug("Reading packing.csv")
+            cdhdr = read_table(file_paths["cdhdr"])
         
         logger.debug(f"packing.csv: {len(cdhdr)} rows, {len(cdhdr.columns)} columns")
         logger.debug(f"Columns: {list(cdhdr.columns)}")
         
         # Read users file
         logger.debug("Reading users_floor.csv")
-        try:
-            users = pd.read_csv(file_paths["users"], encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for users_floor.csv, trying latin-1")
-            users = pd.read_csv(file_paths["users"], encoding="latin-1")
+        users = users_floor_table()
         
         logger.debug(f"users_floor.csv: {len(users)} rows, {len(users.columns)} columns")
         logger.debug(f"Columns: {list(users.columns)}")
@@ -396,134 +405,20 @@ def calculate_packing_hourly_productivity(cdhdr: pd.DataFrame) -> Tuple[Dict[str
             logger.error(error_msg, exc_info=True)
             raise RuntimeError(error_msg) from e
         
-        # Initialize result dictionaries
-        nested_dict = defaultdict(lambda: defaultdict(dict))
-        total_hours = defaultdict(lambda: defaultdict(int))
-        
-        # Track statistics
-        break_adjustments = 0
-        missing_thresholds = 0
-        invalid_floors = set()
-        processed_groups = 0
-        error_groups = 0
-        
-        # Process each group
-        logger.debug("Processing groups and calculating productivity metrics")
-        for (user, floor, hour), count in packing_per_hour.items():
-            try:
-                processed_groups += 1
-                
-                # Validate inputs
-                if pd.isna(user) or pd.isna(floor) or pd.isna(hour):
-                    logger.debug(f"Skipping group with null values: user={user}, floor={floor}, hour={hour}")
-                    error_groups += 1
-                    continue
-                
-                # Convert hour to string if needed
-                hour_str = str(hour).strip() if not pd.isna(hour) else None
-                if hour_str is None:
-                    logger.debug(f"Skipping group with invalid hour: {hour}")
-                    error_groups += 1
-                    continue
-                
-                # Calculate adjusted count for breaks
-                try:
-                    if breaks_config and hour_str in breaks_config:
-                        break_multiplier = breaks_config[hour_str]
-                        
-                        if break_multiplier == 0:
-                            logger.warning(
-                                f"Break multiplier is zero for hour '{hour_str}', "
-                                f"using original count"
-                            )
-                            adjusted_count = count
-                            total_hours[user][floor] += 1
-                        else:
-                            adjusted_count = count / break_multiplier
-                            total_hours[user][floor] += break_multiplier
-                            break_adjustments += 1
-                            logger.debug(
-                                f"Applied break adjustment for hour {hour_str}: "
-                                f"{count} -> {adjusted_count:.2f} (multiplier: {break_multiplier})"
-                            )
-                    else:
-                        adjusted_count = count
-                        total_hours[user][floor] += 1
-                
-                except ZeroDivisionError as e:
-                    logger.error(f"Division by zero error for hour '{hour_str}': {e}")
-                    adjusted_count = count
-                    total_hours[user][floor] += 1
-                except Exception as e:
-                    logger.error(f"Error calculating break adjustment: {e}")
-                    adjusted_count = count
-                    total_hours[user][floor] += 1
-                
-                # Determine productivity color
-                try:
-                    floor_str = str(floor).strip() if not pd.isna(floor) else None
-                    
-                    if floor_str not in thresholds_config:
-                        missing_thresholds += 1
-                        invalid_floors.add(floor_str)
-                        logger.warning(
-                            f"No productivity thresholds found for floor '{floor_str}', "
-                            f"using default color"
-                        )
-                        color = "unknown"
-                    else:
-                        thresholds = thresholds_config[floor_str]
-                        
-                        # Validate thresholds
-                        if not thresholds or len(thresholds) < 3:
-                            logger.warning(
-                                f"Invalid thresholds for floor '{floor_str}': {thresholds}, "
-                                f"using default color"
-                            )
-                            color = "unknown"
-                        else:
-                            try:
-                                color = get_productivity_color(adjusted_count, thresholds)
-                            except NameError:
-                                logger.error("get_productivity_color function not found, using default")
-                                color = "unknown"
-                            except Exception as e:
-                                logger.error(f"Error in get_productivity_color: {e}")
-                                color = "unknown"
-                
-                except Exception as e:
-                    logger.error(f"Error determining productivity color: {e}")
-                    color = "unknown"
-                
-                # Store result
-                nested_dict[user][floor][hour_str] = {
-                    "count": int(count),
-                    "productivity_color": color
-                }
-                
-            except Exception as e:
-                error_groups += 1
-                logger.error(
-                    f"Error processing group (user={user}, floor={floor}, hour={hour}): {e}",
-                    exc_info=True
-                )
-                continue
-        
-        # Log summary statistics
-        successful_groups = processed_groups - error_groups
-        logger.info(
-            f"Productivity calculation complete: "
-            f"{successful_groups}/{processed_groups} groups processed successfully, "
-            f"{break_adjustments} break adjustments applied"
-        )
+        # Break-adjusted counts and colors for every group at once
+        try:
+            nested_dict, total_hours = hourly_productivity(packing_per_hour, breaks_config, thresholds_config)
+        except Exception as e:
+            error_msg = f"Error calculating break-adjusted productivity: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise RuntimeError(error_msg) from e
         
-        if missing_thresholds > 0:
-            logger.warning(
-                f"{missing_thresholds} groups had missing thresholds for floors: {invalid_floors}"
-            )
+        floor_names = packing_per_hour.index.get_level_values("floor").dropna().astype(str).str.strip()
+        invalid_floors = set(floor_names[~floor_names.isin(list(thresholds_config))])
+        if invalid_floors:
+            logger.warning(f"No productivity thresholds found for floors {invalid_floors}, using default color")
         
-        if error_groups > 0:
-            logger.warning(f"{error_groups} groups had processing errors")
+        logger.info(f"Productivity calculation complete: {total_groups} groups processed")
         
         # Log distribution summary
         unique_users = len(nested_dict)
@@ -803,199 +698,324 @@ def calculate_packing_aggregate_metrics(
         )
         raise RuntimeError(f"Unexpected error calculating aggregate metrics: {e}") from e
 
+# Columns of the hourly counts kept by the incremental extraction
+PACKING_STATE_KEYS = ["user", "floor", "hour"]
+PACKING_STATE_VALUES = ["boxes_packed"]
+
+def build_packing_result(hourly: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Build the packing productivity from boxes packed per user/floor/hour.
+
+    Args:
+        hourly: Counts with PACKING_STATE_KEYS and PACKING_STATE_VALUES columns
+
+    Returns:
+        dict: Productivity by user/floor/hour plus the aggregate metrics, as in packing.json
+    """
+    if hourly.empty:
+        return {}
+
+    counted = hourly[hourly["hour"] != NO_HOUR]
+    nested_dict, total_hours = hourly_productivity(
+        counted.set_index(PACKING_STATE_KEYS)["boxes_packed"],
+        getattr(constant, "BREAKS", {}),
+        constant.PACKING_THRESHOLDS,
+    )
+    packing_per_user = hourly.groupby(["user", "floor"], sort=True)["boxes_packed"].sum()
+    calculate_packing_aggregate_metrics(nested_dict, total_hours, packing_per_user)
+    return nested_dict
+
+def run_incremental_packing(date: str, session_factory: Callable[[], Any] = SAPSession) -> Dict[str, Any]:
+    """
+    Update the packing productivity with the CDHDR change documents since the last run.
+
+    The state of the day is kept in packing/packing_state.json: the high-water
+    mark (last change date/time), the number of documents and boxes counted,
+    the document_number and object_value of the change documents processed
+    inside the overlap window and the boxes packed per user/floor/hour. A run
+    is committed by the single write of this file, a run interrupted before
+    it is extracted again from the same mark.
+
+    Documents whose document_number was already processed are skipped and,
+    as combine() keeps the first document of each box, so are documents of
+    a box (object_value) that was already counted. Only the remaining boxes
+    are merged with users and added to the hourly counts, from which
+    packing.json is rebuilt.
+
+    Documents before the window are not extracted again, so their keys are
+    dropped from the state when it is saved and it stays the size of the
+    window all day. A box is therefore only matched with the documents of
+    the window, not with one closed earlier in the day.
+
+    Args:
+        date: Day to extract (DD.MM.YYYY), another day than the stored one starts over
+        session_factory: Creates the SAP sessions, e.g. a fake one producing canned exports
+
+    Returns:
+        dict: The packing productivity written to packing.json
+
+    Raises:
+        ValueError: If the CDHDR export misses the columns needed to deduplicate documents
+    """
+    folder_path = f"{constant.OUTPUT_PATH}/packing"
+    state_path = f"{folder_path}/packing_state.json"
+    document_columns = ["document_number", "object_value"]
+
+    try:
+        state = load_state(state_path, date)
+        mark = state.get("mark")
+        start = window_start(mark)
+        since = start.strftime("%H:%M:%S") if start is not None and start.strftime("%d.%m.%Y") == date else None
+        logger.info(f"Incremental CDHDR extraction for {date}, high-water mark: {mark}")
+
+        # Extract and convert the change documents since the mark
+        extract_cdhdr(date, "packing", "packing_delta", since, session_factory)
+        delta = convert_sap_export("packing_delta", "packing", constant.CDHDR_DF)
+
+        missing_columns = [col for col in document_columns + ["date", "time"] if col not in delta.columns]
+        if missing_columns:
+            error_msg = f"Missing columns for incremental extraction in CDHDR export: {missing_columns}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # Keep documents in the window that were not processed yet
+        window = state.get("window", [])
+        documents = state_frame([entry[1:] for entry in window], document_columns)
+        delta_stamps = timestamps(delta, "date", "time")
+        candidates = delta[in_window(delta_stamps, start)]
+        new = candidates[~seen_mask(candidates, documents, ["document_number"])]
+        logger.info(f"{len(new)} new change documents ({len(delta)} extracted, {len(candidates)} in the window since {start})")
+
+        hourly = state_frame(
+            state.get("hourly"), PACKING_STATE_KEYS + PACKING_STATE_VALUES,
+            dtype={**{key: str for key in PACKING_STATE_KEYS}, **{value: np.int64 for value in PACKING_STATE_VALUES}},
+        )
+
+        if not new.empty:
+            # Only boxes that weren't counted yet are merged with users
+            combined = combine(new.reset_index(drop=True))
+            boxes = combined[~seen_mask(combined, documents, ["object_value"])].reset_index(drop=True)
+            if not boxes.empty:
+                prepared = prepare_cdhdr_data(boxes)
+                prepared["hour"] = prepared["hour"].fillna(NO_HOUR)
+                delta_counts = prepared.groupby(PACKING_STATE_KEYS).size().rename("boxes_packed").reset_index()
+                for key in PACKING_STATE_KEYS:
+                    delta_counts[key] = delta_counts[key].astype(str)
+                hourly = merge_counts(hourly, delta_counts, PACKING_STATE_KEYS, PACKING_STATE_VALUES)
+                logger.info(f"Added {int(delta_counts['boxes_packed'].sum())} boxes to {len(delta_counts)} user/floor/hour counts")
+            state["boxes"] = state.get("boxes", 0) + len(boxes)
+
+        # Saving the state commits the counts, the processed documents and the mark together
+        if not new.empty:
+            keys = key_frame(new, document_columns)
+            window = window + window_entries(delta_stamps[new.index], *(keys[col] for col in document_columns))
+            latest = delta_stamps[new.index].max()
+            if pd.notna(latest) and (mark is None or latest > datetime.strptime(mark, STATE_TIMESTAMP_FORMAT)):
+                state["mark"] = latest.strftime(STATE_TIMESTAMP_FORMAT)
+        state.setdefault("mark", None)
+        state["documents"] = state.get("documents", 0) + len(new)
+        state["window"] = prune_window(window, window_start(state["mark"]))
+        state["hourly"] = state_rows(hourly, PACKING_STATE_KEYS + PACKING_STATE_VALUES)
+        save_state(state_path, state)
+
+        result = build_packing_result(hourly)
+        convert_to_json("packing", "packing", result)
+        logger.info(
+            f"Incremental packing update complete: {state['documents']} documents today, "
+            f"{len(state['window'])} in the overlap window, high-water mark {state['mark']}"
+        )
+        return result
+
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"Incremental packing update failed: {e}", exc_info=True)
+        raise
+
 if __name__ == "__main__":
     try:
         TODAY = constant.get_today()
 
-        # Extract CDHDR data
         logger.info("Starting packing extraction workflow")
-        extract_cdhdr(TODAY, "packing", "packing")
-        logger.info("Extraction of CDHDR was successfully")
+        if constant.CDHDR_INCREMENTAL:
+            # Only change documents since the last run are extracted and aggregated
+            run_incremental_packing(TODAY)
+        else:
+            # Extract CDHDR data
+            extract_cdhdr(TODAY, "packing", "packing")
+            logger.info("Extraction of CDHDR was successfully")
 
-        # Converting and renaming CDHDR file
-        logger.info("Converting and renaming packing file")
-        try:
-            convert_to_csv("packing", "packing")
-            rename("packing", "packing", constant.CDHDR_DF)
-            logger.info("File conversion and renaming completed successfully")
-        except Exception as e:
-            logger.error(f"Error converting/renaming packing file: {e}", exc_info=True)
-            raise
+            # Converting CDHDR file
+            logger.info("Converting packing file")
+            try:
+                convert_sap_export("packing", "packing", constant.CDHDR_DF)
+                logger.info("File conversion completed successfully")
+            except Exception as e:
+                logger.error(f"Error converting packing file: {e}", exc_info=True)
+                raise
 
-        # Combining CDHDR file with users
-        logger.info("File was successfully transformed, now combining the file with the users file")
-        combined = combine()
+            # Combining CDHDR file with users
+            logger.info("File was successfully transformed, now combining the file with the users file")
+            combined = combine()
 
-        # Prepare CDHDR data
-        cdhdr = prepare_cdhdr_data(combined)
+            # Prepare CDHDR data
+            cdhdr = prepare_cdhdr_data(combined)
 
-        # Calculate grouped metrics
-        try:
-            logger.info("Calculating grouped metrics: packing per user by floor")
+            # Calculate grouped metrics
+            try:
+                logger.info("Calculating grouped metrics: packing per user by floor")
             
-            # Validate required columns exist before grouping
-            required_groupby_columns = ["user", "floor"]
-            missing_columns = [col for col in required_groupby_columns if col not in cdhdr.columns]
+                # Validate required columns exist before grouping
+                required_groupby_columns = ["user", "floor"]
+                missing_columns = [col for col in required_groupby_columns if col not in cdhdr.columns]
             
-            if missing_columns:
-                error_msg = f"Cannot calculate grouped metrics: missing required columns {missing_columns}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
+                if missing_columns:
+                    error_msg = f"Cannot calculate grouped metrics: missing required columns {missing_columns}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
             
-            logger.debug(f"Grouping by columns: {required_groupby_columns}")
+                logger.debug(f"Grouping by columns: {required_groupby_columns}")
             
-            # Check for empty dataframe
-            if cdhdr.empty:
-                logger.warning("CDHDR dataframe is empty, groupby will return empty result")
-                packing_per_user = pd.Series(dtype='int64', name='count')
-            else:
-                # Check for null values in grouping columns
-                null_counts = {}
-                for col in required_groupby_columns:
-                    null_count = cdhdr[col].isna().sum()
-                    if null_count > 0:
-                        null_counts[col] = null_count
-                        logger.warning(
-                            f"Found {null_count} null values ({null_count/len(cdhdr)*100:.1f}%) "
-                            f"in grouping column '{col}'"
-                        )
+                # Check for empty dataframe
+                if cdhdr.empty:
+                    logger.warning("CDHDR dataframe is empty, groupby will return empty result")
+                    packing_per_user = pd.Series(dtype='int64', name='count')
+                else:
+                    # Check for null values in grouping columns
+                    null_counts = {}
+                    for col in required_groupby_columns:
+                        null_count = cdhdr[col].isna().sum()
+                        if null_count > 0:
+                            null_counts[col] = null_count
+                            logger.warning(
+                                f"Found {null_count} null values ({null_count/len(cdhdr)*100:.1f}%) "
+                                f"in grouping column '{col}'"
+                            )
                 
-                # Perform groupby operation
-                try:
-                    packing_per_user = cdhdr.groupby(required_groupby_columns).size()
+                    # Perform groupby operation
+                    try:
+                        packing_per_user = cdhdr.groupby(required_groupby_columns).size()
                     
-                    # Validate result
-                    if packing_per_user.empty:
-                        logger.warning("Groupby result is empty - no data matches grouping criteria")
-                    else:
-                        # Log summary statistics
-                        total_groups = len(packing_per_user)
-                        total_packing = packing_per_user.sum()
-                        min_packing = packing_per_user.min()
-                        max_packing = packing_per_user.max()
-                        mean_packing = packing_per_user.mean()
+                        # Validate result
+                        if packing_per_user.empty:
+                            logger.warning("Groupby result is empty - no data matches grouping criteria")
+                        else:
+                            # Log summary statistics
+                            total_groups = len(packing_per_user)
+                            total_packing = packing_per_user.sum()
+                            min_packing = packing_per_user.min()
+                            max_packing = packing_per_user.max()
+                            mean_packing = packing_per_user.mean()
                         
-                        logger.info(
-                            f"Groupby completed successfully: "
-                            f"{total_groups} unique groups, "
-                            f"{total_packing} total packing, "
-                            f"range: {min_packing}-{max_packing} packing per group, "
-                            f"mean: {mean_packing:.1f} packing per group"
-                        )
+                            logger.info(
+                                f"Groupby completed successfully: "
+                                f"{total_groups} unique groups, "
+                                f"{total_packing} total packing, "
+                                f"range: {min_packing}-{max_packing} packing per group, "
+                                f"mean: {mean_packing:.1f} packing per group"
+                            )
                         
-                        # Log distribution by floor
-                        if "floor" in packing_per_user.index.names:
-                            floor_counts = packing_per_user.groupby(level="floor").sum()
-                            logger.debug(f"Packing by floor: {dict(floor_counts)}")
+                            # Log distribution by floor
+                            if "floor" in packing_per_user.index.names:
+                                floor_counts = packing_per_user.groupby(level="floor").sum()
+                                logger.debug(f"Packing by floor: {dict(floor_counts)}")
                         
-                        # Log top groups
-                        top_groups = packing_per_user.nlargest(10)
-                        logger.debug(f"Top 10 groups by packing count:\n{top_groups}")
+                            # Log top groups
+                            top_groups = packing_per_user.nlargest(10)
+                            logger.debug(f"Top 10 groups by packing count:\n{top_groups}")
                 
-                except KeyError as e:
-                    error_msg = f"Column error during groupby operation: {e}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg) from e
-                except Exception as e:
-                    error_msg = f"Unexpected error during groupby operation: {e}"
-                    logger.error(error_msg, exc_info=True)
-                    raise RuntimeError(error_msg) from e
+                    except KeyError as e:
+                        error_msg = f"Column error during groupby operation: {e}"
+                        logger.error(error_msg)
+                        raise ValueError(error_msg) from e
+                    except Exception as e:
+                        error_msg = f"Unexpected error during groupby operation: {e}"
+                        logger.error(error_msg, exc_info=True)
+                        raise RuntimeError(error_msg) from e
             
-            logger.debug(f"Grouped metrics calculation complete. Result type: {type(packing_per_user)}")
+                logger.debug(f"Grouped metrics calculation complete. Result type: {type(packing_per_user)}")
             
-        except ValueError as e:
-            logger.error(f"Failed to calculate grouped metrics: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error calculating grouped metrics: {e}", exc_info=True)
-            raise
+            except ValueError as e:
+                logger.error(f"Failed to calculate grouped metrics: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error calculating grouped metrics: {e}", exc_info=True)
+                raise
 
-        # Calculate hourly productivity
-        nested_dict, total_hours = calculate_packing_hourly_productivity(cdhdr)
+            # Calculate hourly productivity
+            nested_dict, total_hours = calculate_packing_hourly_productivity(cdhdr)
 
-        # Calculate aggregate metrics
-        calculate_packing_aggregate_metrics(nested_dict, total_hours, packing_per_user)
+            # Calculate aggregate metrics
+            calculate_packing_aggregate_metrics(nested_dict, total_hours, packing_per_user)
 
-        # Convert nested dict to regular dict for JSON serialization
-        try:
-            logger.info("Converting nested defaultdict to regular dict for JSON serialization")
+            # Convert nested dict to regular dict for JSON serialization
+            try:
+                logger.info("Converting nested defaultdict to regular dict for JSON serialization")
             
-            # Validate nested_dict
-            if not nested_dict:
-                logger.warning("nested_dict is empty, result will be empty")
-                result = {}
-            else:
-                # Count structure depth and size for logging
-                total_users = len(nested_dict)
-                total_floors = sum(len(floors) for floors in nested_dict.values())
-                total_hours_entries = sum(
-                    len(hours) 
-                    for floors in nested_dict.values() 
-                    for hours in floors.values()
-                )
+                # Validate nested_dict
+                if not nested_dict:
+                    logger.warning("nested_dict is empty, result will be empty")
+                    result = {}
+                else:
+                    # Count structure depth and size for logging
+                    total_users = len(nested_dict)
+                    total_floors = sum(len(floors) for floors in nested_dict.values())
+                    total_hours_entries = sum(
+                        len(hours) 
+                        for floors in nested_dict.values() 
+                        for hours in floors.values()
+                    )
                 
-                logger.debug(
-                    f"Converting structure: {total_users} users, {total_floors} floors, "
-                    f"{total_hours_entries} hour entries"
-                )
+                    logger.debug(
+                        f"Converting structure: {total_users} users, {total_floors} floors, "
+                        f"{total_hours_entries} hour entries"
+                    )
                 
-                # Convert nested defaultdict to regular dict
-                try:
-                    result = {
-                        k: {
-                            k2: dict(v2) if isinstance(v2, dict) else v2
-                            for k2, v2 in v.items()
+                    # Convert nested defaultdict to regular dict
+                    try:
+                        result = {
+                            k: {
+                                k2: dict(v2) if isinstance(v2, dict) else v2
+                                for k2, v2 in v.items()
+                            }
+                            for k, v in nested_dict.items()
                         }
-                        for k, v in nested_dict.items()
-                    }
                     
-                    # Validate conversion
-                    if not result:
-                        logger.warning("Conversion resulted in empty dictionary")
-                    else:
-                        # Verify structure was preserved
-                        converted_users = len(result)
-                        if converted_users != total_users:
-                            logger.warning(
-                                f"User count mismatch after conversion: "
-                                f"expected {total_users}, got {converted_users}"
-                            )
+                        # Validate conversion
+                        if not result:
+                            logger.warning("Conversion resulted in empty dictionary")
+                        else:
+                            # Verify structure was preserved
+                            converted_users = len(result)
+                            if converted_users != total_users:
+                                logger.warning(
+                                    f"User count mismatch after conversion: "
+                                    f"expected {total_users}, got {converted_users}"
+                                )
                         
-                        logger.info(
-                            f"Successfully converted nested dict: {converted_users} users, "
-                            f"{len(result)} top-level entries"
-                        )
+                            logger.info(
+                                f"Successfully converted nested dict: {converted_users} users, "
+                                f"{len(result)} top-level entries"
+                            )
                 
-                except TypeError as e:
-                    error_msg = f"Type error during dict conversion: {e}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg) from e
-                except Exception as e:
-                    error_msg = f"Error converting nested dict structure: {e}"
-                    logger.error(error_msg, exc_info=True)
-                    raise RuntimeError(error_msg) from e
-            
-            # Validate result can be serialized
-            try:
-                import json
-                json.dumps(result)
-                logger.debug("Converted dict passed JSON serialization validation")
-            except TypeError as e:
-                error_msg = f"Converted dict contains non-serializable objects: {e}"
-                logger.error(error_msg)
-                raise TypeError(error_msg) from e
-            except Exception as e:
-                logger.warning(f"Unexpected error during serialization validation: {e}")
+                    except TypeError as e:
+                        error_msg = f"Type error during dict conversion: {e}"
+                        logger.error(error_msg)
+                        raise ValueError(error_msg) from e
+                    except Exception as e:
+                        error_msg = f"Error converting nested dict structure: {e}"
+                        logger.error(error_msg, exc_info=True)
+                        raise RuntimeError(error_msg) from e
         
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error converting nested dict: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in dict conversion: {e}", exc_info=True)
-            raise
+            except (ValueError, TypeError) as e:
+                logger.error(f"Error converting nested dict: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error in dict conversion: {e}", exc_info=True)
+                raise
 
-        # Save
-        convert_to_json("packing", "packing", result)
+            # Save
+            convert_to_json("packing", "packing", result)
 
         logger.info("Packing extraction workflow completed successfully")
 
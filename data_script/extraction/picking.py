@@ -1,23 +1,29 @@
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, Callable, Optional, Dict, List, Tuple
 from data_script.utils.SAP import SAPSession
 import data_script.config.constants as constant
 from data_script.utils.logger import setup_logger
 from data_script.utils.retry import retry_sap_operation
-from data_script.transformation.routes import transform_routes
-from data_script.utils.files_utils import convert_to_csv, rename, convert_to_json
+from data_script.transformation.routes import refresh_routes
+from data_script.utils.reference_data import routes_table
+from data_script.utils.productivity import hourly_productivity, productivity_colors
+from data_script.utils.files_utils import convert_sap_export, convert_to_json, write_csv, read_table, remove_table, table_exists
+from data_script.utils.incremental import (
+    STATE_TIMESTAMP_FORMAT, NO_HOUR, load_state, save_state, state_rows, state_frame, rollback_append, append_csv,
+    timestamps, window_start, in_window, row_keys, unseen, window_entries, prune_window, merge_counts,
+)
+import numpy as np
 import pandas as pd
-from pathlib import Path
-from collections import defaultdict
+from datetime import datetime
 
 # Set up logger
 logger = setup_logger("picking_extraction")
 
-def _extract_ltap_internal(date: str, folder: str, filename: str) -> None:
+def _extract_ltap_internal(date: str, folder: str, filename: str, since: Optional[str] = None, session_factory: Callable[[], Any] = SAPSession) -> None:
     """Internal extraction function (called by retry wrapper)"""
-    logger.info(f"Starting LTAP extraction for date: {date}, filename: {filename}, folder: {folder}")
+    logger.info(f"Starting LTAP extraction for date: {date}, since: {since}, filename: {filename}, folder: {folder}")
 
     # Initialize SAP GUI
-    extractor = SAPSession()
+    extractor = session_factory()
 
     # Start transaction and fill in fields
     extractor.StartTransaction("Z_TABU_DIS")
@@ -25,6 +31,8 @@ def _extract_ltap_internal(date: str, folder: str, filename: str) -> None:
     extractor.checkbox_selection(constant.LTAP_CHECKBOX)
     extractor.findById("wnd[0]/usr/ctxtI1-LOW").text = constant.WAREHOUSE
     extractor.findById("wnd[0]/usr/ctxtI7-LOW").text = date
+    if since and constant.LTAP_CONFIRMATION_TIME_FIELD:
+        extractor.findById(constant.LTAP_CONFIRMATION_TIME_FIELD).text = since
     extractor.findById("wnd[0]/tbar[1]/btn[8]").press()
     logger.info("Transaction executed successfully")
 
@@ -32,12 +40,12 @@ def _extract_ltap_internal(date: str, folder: str, filename: str) -> None:
     extractor.save_to_folder(folder, filename)
     logger.info(f"Data saved to {filename}")
 
-def _extract_hutolink_(transaction: str, folder: str, filename: str) -> None:
+def _extract_hutolink_(transaction: str, folder: str, filename: str, session_factory: Callable[[], Any] = SAPSession) -> None:
     """Internal extraction function (called by retry wrapper)"""
     logger.info(f"Starting {transaction} extraction, filename: {filename}, folder: {folder}")
 
     # Initialize SAP
-    extractor = SAPSession()
+    extractor = session_factory()
 
     # Start transaction and fill in fields
     extractor.StartTransaction("Z_TABU_DIS")
@@ -56,7 +64,7 @@ def _extract_hutolink_(transaction: str, folder: str, filename: str) -> None:
     extractor.save_to_folder(folder, filename)
     logger.info(f"Data saved to {filename}")
 
-def extract_hutolink(transaction: str, folder: str, filename: str) -> None:
+def extract_hutolink(transaction: str, folder: str, filename: str, session_factory: Callable[[], Any] = SAPSession) -> None:
     """
     Extract HUTOLINK data for picking productivity with automatic retry
 
@@ -64,13 +72,14 @@ def extract_hutolink(transaction: str, folder: str, filename: str) -> None:
         transaction: Used transaction for the extraction
         folder: Output folder
         filename: Output filename
+        session_factory: Creates the SAP session, e.g. a fake one producing canned exports
     """
     retry_sap_operation(
-        lambda: _extract_hutolink_(transaction, folder, filename),
+        lambda: _extract_hutolink_(transaction, folder, filename, session_factory),
         func_name="extract_hutolink"
     )
 
-def extract_ltap(date: str, folder: str, filename: str) -> None:
+def extract_ltap(date: str, folder: str, filename: str, since: Optional[str] = None, session_factory: Callable[[], Any] = SAPSession) -> None:
     """
     Extract LTAP data for picking productivity with automatic retry
     
@@ -78,33 +87,30 @@ def extract_ltap(date: str, folder: str, filename: str) -> None:
         date: Date string for the extraction
         folder: Ouput folder
         filename: Output filename
+        since: Optional confirmation time (HH:MM:SS) to extract from, used when
+            constant.LTAP_CONFIRMATION_TIME_FIELD is configured
+        session_factory: Creates the SAP session, e.g. a fake one producing canned exports
     """
     retry_sap_operation(
-        lambda: _extract_ltap_internal(date, folder, filename),
+        lambda: _extract_ltap_internal(date, folder, filename, since, session_factory),
         func_name="extract_ltap"
     )
 
 def retrieve_deliveries() -> None:
     """Internal retrieving function (called by retry wrapper)"""
-    # Convert and rename the picking file
-    convert_to_csv("picking", "picking")
-    rename("picking", "picking", constant.LTAP_DF)
+    # Convert the picking file
+    convert_sap_export("picking", "picking", constant.LTAP_DF)
 
     # Retrieve deliveries
     try:
         logger.debug(f"Reading picking.csv")
 
-        # Read CSV file
-        try:
-            df = pd.read_csv(f"{constant.OUTPUT_PATH}/picking/picking.csv", encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try with different encoding if UTF-8 fails
-            logger.warning(f"UTF-8 encoding failed for picking.csv, trying latin-1")
-            df = pd.read_csv(f"{constant.OUTPUT_PATH}/picking/picking.csv", encoding="latin-1")
+        # Read table (Feather when available, otherwise CSV)
+        df = read_table(f"{constant.OUTPUT_PATH}/picking/picking.csv")
 
         df["delivery"] = df["delivery"].fillna(0).astype(int)
         deliveries = df["delivery"].drop_duplicates()
-        deliveries.to_csv(f"{constant.OUTPUT_PATH}/picking/picking_deliveries.csv", index=False)
+        write_csv(deliveries, f"{constant.OUTPUT_PATH}/picking/picking_deliveries.csv")
         logger.info(f"Successfully retrieved {len(deliveries)} deliveries")
     except Exception as e:
         error_msg = f"Error retrieveing deliveries: {e}"
@@ -136,7 +142,7 @@ def combine() -> pd.DataFrame:
 
     # Validate files exist
     for name, path in file_paths.items():
-        if not Path(path).exists():
+        if not table_exists(path):
             error_msg = f"Required file not found: {name} at {path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
@@ -145,33 +151,21 @@ def combine() -> pd.DataFrame:
     try:
         # Read first file
         logger.debug("Reading zorf_hu_to_link.csv")
-        try:
-            df1 = pd.read_csv(file_paths["zorf_hu_to_link"], encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for zorf_hu_to_link.csv, trying latin-1")
-            df1 = pd.read_csv(file_paths["zorf_hu_to_link"], encoding="latin-1")
+        df1 = read_table(file_paths["zorf_hu_to_link"])
 
         logger.debug(f"zorf_hu_to_link.csv: {len(df1)} rows, {len(df1.columns)} columns")
         logger.debug(f"Columns: {list(df1.columns)}")
 
         # Read second file
         logger.debug("Reading zorf_huto_lnkhis.csv")
-        try:
-            df2 = pd.read_csv(file_paths["zorf_huto_lnkhis"], encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for zorf_huto_lnkhis.csv, trying latin-1")
-            df2 = pd.read_csv(file_paths["zorf_huto_lnkhis"], encoding="latin-1")
+        df2 = read_table(file_paths["zorf_huto_lnkhis"])
 
         logger.debug(f"zorf_huto_lnkhis.csv: {len(df2)} rows, {len(df2.columns)} columns")
         logger.debug(f"Columns: {list(df2.columns)}")
 
         # Read routes file
         logger.debug("Reading routes.csv")
-        try:
-            df3 = pd.read_csv(file_paths["routes"], encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed for routes.csv, trying latin-1")
-            df3 = pd.read_csv(file_paths["routes"], encoding="latin-1")
+        df3 = routes_table()
 
         logger.debug(f"routes.csv: {len(df3)} rows, {len(df3.columns)} columns")
         logger.debug(f"Columns: {list(df3.columns)}")
@@ -346,13 +340,14 @@ def build_floor_mapping(floors_config: Dict[str, List[str]]) -> Dict[str, str]:
         logger.error(f"Unexpected error building floor mapping: {e}", exc_info=True)
         raise ValueError(f"Unexpected error building floor mapping: {e}") from e
 
-def prepare_ltap_data(combined: pd.DataFrame, floor_mapping: Dict[str, str]) -> pd.DataFrame:
+def prepare_ltap_data(combined: pd.DataFrame, floor_mapping: Dict[str, str], ltap: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Prepare LTAP data by loading, transforming, and enriching with route/floor information.
 
     Args:
         combined: DataFrame with route information merged from HUTOLINK data
         floor_mapping: Dictionary mapping picking areas to floor names
+        ltap: Optional LTAP lines to prepare (modified in place), read from picking.csv when omitted
     
     Returns:
         Processed DataFrame with flow, floor, and hour columns added
@@ -365,26 +360,22 @@ def prepare_ltap_data(combined: pd.DataFrame, floor_mapping: Dict[str, str]) ->
     file_path = f"{constant.OUTPUT_PATH}/picking/picking.csv"
 
     try:
-        logger.info(f"Loading LTAP data from {file_path}")
+        if ltap is None:
+            logger.info(f"Loading LTAP data from {file_path}")
 
-        # Load CSV with error handling
-        try:
-            ltap: pd.DataFrame = pd.read_csv(file_path, encoding="utf-8")
-            logger.debug(f"Successfully loaded LTAP data: {ltap.shape[0]} rows, {ltap.shape[1]} columns")
-        except UnicodeDecodeError:
-            logger.warning("UTF-8 encoding failed, trying latin-1")
+        # Load table (Feather when available, otherwise CSV) with error handling
+        if ltap is None:
             try:
-                ltap = pd.read_csv(file_path, encoding="latin-1")
-                logger.debug(f"Successfully loaded LTAP data with latin-1: {ltap.shape[0]} rows")
+                ltap = read_table(file_path)
+                logger.debug(f"Successfully loaded LTAP data: {ltap.shape[0]} rows, {ltap.shape[1]} columns")
+            except FileNotFoundError:
+                logger.error(f"LTAP file not found at {file_path}")
+                raise
             except Exception as e:
-                logger.error(f"Failed to load LTAP CSV file: {e}")
-                raise FileNotFoundError(f"Could not read LTAP file at {file_path}") from e
-        except FileNotFoundError:
-            logger.error(f"LTAP file not found at {file_path}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error loading LTAP file: {e}", exc_info=True)
-            raise
+                logger.error(f"Unexpected error loading LTAP file: {e}", exc_info=True)
+                raise
+        else:
+            logger.debug(f"Using {ltap.shape[0]} given LTAP lines")
 
         # Validate required columns exist
         required_columns = ["actual_quantity", "delivery", "picking_area", "confirmation_time"]
@@ -671,135 +662,20 @@ def calculate_picking_hourly_productivity(ltap: pd.DataFrame) -> Tuple[Dict[str,
             logger.error(error_msg, exc_info=True)
             raise RuntimeError(error_msg) from e
         
-        # Initialize result dictionaries
-        nested_dict = defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
-        total_hours = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-        
-        # Track statistics
-        break_adjustments = 0
-        missing_thresholds = 0
-        invalid_floors = set()
-        processed_groups = 0
-        error_groups = 0
-        
-        # Process each group
-        logger.debug("Processing groups and calculating productivity metrics")
-        for (user, floor, flow, hour), count in lines_per_hour.items():
-            try:
-                processed_groups += 1
-                
-                # Validate inputs
-                if pd.isna(user) or pd.isna(floor) or pd.isna(flow) or pd.isna(hour):
-                    logger.debug(f"Skipping group with null values: user={user}, floor={floor}, flow={flow}, hour={hour}")
-                    error_groups += 1
-                    continue
-                
-                # Convert hour to string if needed
-                hour_str = str(hour).strip() if not pd.isna(hour) else None
-                if hour_str is None:
-                    logger.debug(f"Skipping group with invalid hour: {hour}")
-                    error_groups += 1
-                    continue
-                
-                # Calculate adjusted count for breaks
-                try:
-                    if breaks_config and hour_str in breaks_config:
-                        break_multiplier = breaks_config[hour_str]
-                        
-                        if break_multiplier == 0:
-                            logger.warning(
-                                f"Break multiplier is zero for hour '{hour_str}', "
-                                f"using original count"
-                            )
-                            adjusted_count = count
-                            total_hours[user][floor][flow] += 1
-                        else:
-                            adjusted_count = count / break_multiplier
-                            total_hours[user][floor][flow] += break_multiplier
-                            break_adjustments += 1
-                            logger.debug(
-                                f"Applied break adjustment for hour {hour_str}: "
-                                f"{count} -> {adjusted_count:.2f} (multiplier: {break_multiplier})"
-                            )
-                    else:
-                        adjusted_count = count
-                        total_hours[user][floor][flow] += 1
-                
-                except ZeroDivisionError as e:
-                    logger.error(f"Division by zero error for hour '{hour_str}': {e}")
-                    adjusted_count = count
-                    total_hours[user][floor][flow] += 1
-                except Exception as e:
-                    logger.error(f"Error calculating break adjustment: {e}")
-                    adjusted_count = count
-                    total_hours[user][floor][flow] += 1
-                
-                # Determine productivity color
-                try:
-                    floor_str = str(floor).strip() if not pd.isna(floor) else None
-                    
-                    if floor_str not in thresholds_config:
-                        missing_thresholds += 1
-                        invalid_floors.add(floor_str)
-                        logger.warning(
-                            f"No productivity thresholds found for floor '{floor_str}', "
-                            f"using default color"
-                        )
-                        color = "unknown"
-                    else:
-                        thresholds = thresholds_config[floor_str]
-                        
-                        # Validate thresholds
-                        if not thresholds or len(thresholds) < 3:
-                            logger.warning(
-                                f"Invalid thresholds for floor '{floor_str}': {thresholds}, "
-                                f"using default color"
-                            )
-                            color = "unknown"
-                        else:
-                            # Check if get_productivity_color function exists
-                            try:
-                                color = get_productivity_color(adjusted_count, thresholds)
-                            except NameError:
-                                logger.error("get_productivity_color function not found, using default")
-                                color = "unknown"
-                            except Exception as e:
-                                logger.error(f"Error in get_productivity_color: {e}")
-                                color = "unknown"
-                
-                except Exception as e:
-                    logger.error(f"Error determining productivity color: {e}")
-                    color = "unknown"
-                
-                # Store result
-                nested_dict[user][floor][flow][hour_str] = {
-                    "count": int(count),
-                    "productivity_color": color
-                }
-                
-            except Exception as e:
-                error_groups += 1
-                logger.error(
-                    f"Error processing group (user={user}, floor={floor}, flow={flow}, hour={hour}): {e}",
-                    exc_info=True
-                )
-                continue
-        
-        # Log summary statistics
-        successful_groups = processed_groups - error_groups
-        logger.info(
-            f"Productivity calculation complete: "
-            f"{successful_groups}/{processed_groups} groups processed successfully, "
-            f"{break_adjustments} break adjustments applied"
-        )
+        # Break-adjusted counts and colors for every group at once
+        try:
+            nested_dict, total_hours = hourly_productivity(lines_per_hour, breaks_config, thresholds_config)
+        except Exception as e:
+            error_msg = f"Error calculating break-adjusted productivity: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise RuntimeError(error_msg) from e
         
-        if missing_thresholds > 0:
-            logger.warning(
-                f"{missing_thresholds} groups had missing thresholds for floors: {invalid_floors}"
-            )
+        floor_names = lines_per_hour.index.get_level_values("floor").dropna().astype(str).str.strip()
+        invalid_floors = set(floor_names[~floor_names.isin(list(thresholds_config))])
+        if invalid_floors:
+            logger.warning(f"No productivity thresholds found for floors {invalid_floors}, using default color")
         
-        if error_groups > 0:
-            logger.warning(f"{error_groups} groups had processing errors")
+        logger.info(f"Productivity calculation complete: {total_groups} groups processed")
         
         # Log distribution summary
         unique_users = len(nested_dict)
@@ -825,36 +701,44 @@ def calculate_picking_hourly_productivity(ltap: pd.DataFrame) -> Tuple[Dict[str,
         raise RuntimeError(f"Unexpected error calculating productivity: {e}") from e
 
 def calculate_picking_aggregate_metrics(
-    ltap: pd.DataFrame, 
+    ltap: Optional[pd.DataFrame], 
     nested_dict: Dict[str, Dict[str, Dict[str, Any]]], 
     total_hours: Dict[str, Dict[str, Dict[str, int]]], 
-    lines_per_user: pd.Series
+    lines_per_user: Optional[pd.Series] = None,
+    items_per_user: Optional[pd.Series] = None
 ) -> None:
     """
     Calculate aggregate productivity metrics and update nested dictionary.
     
-    Calculates hours worked, productivity, items picked, ratio, and assigns
-    productivity colors for each user/floor/flow combination.
+    Lines and items picked are computed for every user/floor/flow in a single
+    groupby over ltap, joined with the hours worked from total_hours, and
+    productivity, ratio and productivity color are derived column-wise.
     
     Args:
         ltap: DataFrame with picking data (must contain: user, floor, flow, actual_quantity)
         nested_dict: Dictionary to update with aggregate metrics (modified in place)
         total_hours: Dictionary with hours worked by user/floor/flow
-        lines_per_user: Series with lines picked grouped by user/floor/flow
+        lines_per_user: Optional Series with lines picked grouped by user/floor/flow,
+            computed from ltap when omitted
+        items_per_user: Optional Series with items picked grouped by user/floor/flow,
+            summed from ltap when omitted (ltap is then not needed)
         
     Raises:
         ValueError: If required columns are missing or data is invalid
-        KeyError: If floor not found in thresholds or missing keys in dictionaries
     """
     try:
         logger.info("Starting aggregate metrics calculation for picking productivity")
         
         # Validate inputs
-        if ltap.empty:
+        if items_per_user is None and (ltap is None or ltap.empty):
             logger.warning("LTAP dataframe is empty, no aggregate metrics to calculate")
             return
         
-        if lines_per_user.empty:
+        if items_per_user is not None and (lines_per_user is None or lines_per_user.empty):
+            logger.warning("lines_per_user is required with items_per_user, no metrics to calculate")
+            return
+        
+        if lines_per_user is not None and lines_per_user.empty:
             logger.warning("lines_per_user Series is empty, no metrics to calculate")
             return
         
@@ -865,243 +749,112 @@ def calculate_picking_aggregate_metrics(
             logger.warning("total_hours dictionary is empty, all hours_worked will be 0")
         
         # Validate required columns in ltap
-        required_columns = ["user", "floor", "flow", "actual_quantity"]
-        missing_columns = [col for col in required_columns if col not in ltap.columns]
+        group_columns = ["user", "floor", "flow"]
+        required_columns = group_columns + ["actual_quantity"]
+        missing_columns = [col for col in required_columns if col not in ltap.columns] if items_per_user is None else []
         if missing_columns:
             error_msg = f"Missing required columns in ltap: {missing_columns}"
             logger.error(error_msg)
             raise ValueError(error_msg)
         
         # Validate config
-        try:
-            thresholds_config = constant.PRODUCTIVITY_THRESHOLDS if hasattr(constant, 'PRODUCTIVITY_THRESHOLDS') else {}
-            if not thresholds_config:
-                error_msg = "PRODUCTIVITY_THRESHOLDS configuration not found"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-        except AttributeError as e:
-            logger.error(f"Configuration error: {e}")
-            raise ValueError(f"Missing required configuration: {e}") from e
+        thresholds_config = getattr(constant, "PRODUCTIVITY_THRESHOLDS", {})
+        if not thresholds_config:
+            error_msg = "PRODUCTIVITY_THRESHOLDS configuration not found"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
         
-        # Check if get_productivity_color function exists
+        # Lines and items picked per user/floor/flow in one pass
         try:
-            get_productivity_color
-        except NameError:
-            logger.error("get_productivity_color function not found")
-            raise NameError("get_productivity_color function must be defined")
+            if items_per_user is not None:
+                per_group = items_per_user.rename("items_picked").to_frame()
+            else:
+                per_group = ltap.groupby(group_columns, observed=True).agg(
+                    lines_picked=("actual_quantity", "size"),
+                    items_picked=("actual_quantity", "sum"),
+                )
+        except Exception as e:
+            error_msg = f"Error grouping ltap by {group_columns}: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise RuntimeError(error_msg) from e
         
-        # Track statistics
-        processed_count = 0
-        error_count = 0
-        missing_hours_count = 0
-        missing_thresholds_count = 0
-        zero_productivity_count = 0
-        invalid_floors = set()
+        if lines_per_user is None:
+            lines_per_user = per_group["lines_picked"]
         
-        total_groups = len(lines_per_user)
-        logger.info(f"Processing {total_groups} user/floor/flow combinations")
+        metrics = lines_per_user.rename("lines_picked").reset_index()
+        metrics.columns = group_columns + ["lines_picked"]
+        processed_count = len(metrics)
+        logger.info(f"Processing {processed_count} user/floor/flow combinations")
         
-        # Process each group
-        for (user, floor, flow), lines_picked in lines_per_user.items():
+        # Skip groups with null or empty keys, and groups without lines
+        valid = metrics[group_columns].notna().all(axis=1)
+        for col in group_columns:
+            metrics[f"{col}_str"] = metrics[col].astype(str).str.strip()
+            valid &= metrics[f"{col}_str"] != ""
+        
+        invalid_lines = valid & ~(metrics["lines_picked"] > 0)
+        if invalid_lines.any():
+            logger.warning(
+                f"Skipping {int(invalid_lines.sum())} groups with invalid lines_picked values: "
+                f"{metrics.loc[invalid_lines, group_columns + ['lines_picked']].head(5).to_dict('records')}"
+            )
+        metrics = metrics[valid & ~invalid_lines]
+        error_count = processed_count - len(metrics)
+        
+        # Groups are looked up by their stripped names, like the nested dictionary keys
+        keys = pd.MultiIndex.from_arrays([metrics["user_str"], metrics["floor_str"], metrics["flow_str"]])
+        
+        # Hours worked table
+        hours_table = pd.Series(
+            {
+                (user, floor, flow): hours
+                for user, floors in total_hours.items()
+                for floor, flows in floors.items()
+                for flow, hours in flows.items()
+            },
+            dtype=float,
+        )
+        if hours_table.empty:
+            hours_worked = np.zeros(len(metrics))
+        else:
+            hours_worked = hours_table.reindex(keys).fillna(0).to_numpy()
+        
+        lines_picked = metrics["lines_picked"].to_numpy(dtype=float)
+        items_picked = per_group["items_picked"].reindex(keys).fillna(0).to_numpy(dtype=float)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            productivity = np.where(hours_worked > 0, lines_picked / np.where(hours_worked > 0, hours_worked, 1), 0.0)
+            ratio = items_picked / lines_picked
+        
+        missing_hours_count = int((hours_worked == 0).sum())
+        zero_productivity_count = int((hours_worked <= 0).sum())
+        
+        # Productivity colors per floor
+        colors = productivity_colors(productivity, metrics["floor_str"], thresholds_config)
+        unknown_floors = ~metrics["floor_str"].isin(list(thresholds_config))
+        missing_thresholds_count = int(unknown_floors.sum())
+        invalid_floors = set(metrics.loc[unknown_floors, "floor_str"])
+        
+        # Update nested dictionary
+        for user_str, floor_str, flow_str, hours, prod, color, items, lines, group_ratio in zip(
+            metrics["user_str"].tolist(), metrics["floor_str"].tolist(), metrics["flow_str"].tolist(),
+            hours_worked.tolist(), productivity.tolist(), colors.tolist(),
+            items_picked.tolist(), lines_picked.tolist(), ratio.tolist(),
+        ):
             try:
-                processed_count += 1
-                
-                # Validate group key values
-                if pd.isna(user) or pd.isna(floor) or pd.isna(flow):
-                    logger.debug(
-                        f"Skipping group with null values: user={user}, floor={floor}, flow={flow}"
-                    )
-                    error_count += 1
-                    continue
-                
-                # Convert to strings and strip whitespace
-                user_str = str(user).strip() if not pd.isna(user) else None
-                floor_str = str(floor).strip() if not pd.isna(floor) else None
-                flow_str = str(flow).strip() if not pd.isna(flow) else None
-                
-                if not all([user_str, floor_str, flow_str]):
-                    logger.debug(f"Skipping group with empty values: user={user_str}, floor={floor_str}, flow={flow_str}")
-                    error_count += 1
-                    continue
-                
-                # Validate lines_picked
-                if pd.isna(lines_picked) or lines_picked <= 0:
-                    logger.warning(
-                        f"Invalid lines_picked value ({lines_picked}) for "
-                        f"user={user_str}, floor={floor_str}, flow={flow_str}"
-                    )
-                    error_count += 1
-                    continue
-                
-                # Get hours worked
-                try:
-                    hours_worked = total_hours.get(user_str, {}).get(floor_str, {}).get(flow_str, 0)
-                    
-                    if hours_worked == 0:
-                        missing_hours_count += 1
-                        logger.debug(
-                            f"No hours worked data for user={user_str}, floor={floor_str}, flow={flow_str}"
-                        )
-                except (KeyError, TypeError) as e:
-                    logger.warning(
-                        f"Error accessing hours_worked for user={user_str}, floor={floor_str}, flow={flow_str}: {e}"
-                    )
-                    hours_worked = 0
-                    missing_hours_count += 1
-                
-                # Calculate productivity
-                try:
-                    if hours_worked > 0:
-                        productivity = lines_picked / hours_worked
-                    else:
-                        productivity = 0
-                        zero_productivity_count += 1
-                        logger.debug(
-                            f"Zero hours worked for user={user_str}, floor={floor_str}, flow={flow_str}, "
-                            f"productivity set to 0"
-                        )
-                except ZeroDivisionError:
-                    logger.warning(
-                        f"Division by zero error for user={user_str}, floor={floor_str}, flow={flow_str}"
-                    )
-                    productivity = 0
-                    zero_productivity_count += 1
-                except Exception as e:
-                    logger.error(f"Error calculating productivity: {e}")
-                    productivity = 0
-                
-                # Calculate items picked
-                try:
-                    filter_mask = (
-                        (ltap["user"] == user_str) & 
-                        (ltap["floor"] == floor_str) & 
-                        (ltap["flow"] == flow_str)
-                    )
-                    items_picked = ltap.loc[filter_mask, "actual_quantity"].sum()
-                    
-                    # Handle NaN result
-                    if pd.isna(items_picked):
-                        items_picked = 0
-                        logger.debug(
-                            f"No items found for user={user_str}, floor={floor_str}, flow={flow_str}"
-                        )
-                    else:
-                        items_picked = float(items_picked)
-                
-                except KeyError as e:
-                    logger.error(
-                        f"Column error calculating items_picked for user={user_str}, "
-                        f"floor={floor_str}, flow={flow_str}: {e}"
-                    )
-                    items_picked = 0
-                except Exception as e:
-                    logger.error(
-                        f"Error calculating items_picked for user={user_str}, "
-                        f"floor={floor_str}, flow={flow_str}: {e}"
-                    )
-                    items_picked = 0
-                
-                # Calculate ratio
-                try:
-                    if lines_picked > 0:
-                        ratio = items_picked / lines_picked
-                    else:
-                        ratio = 0
-                        logger.debug(
-                            f"Zero lines_picked for user={user_str}, floor={floor_str}, flow={flow_str}, "
-                            f"ratio set to 0"
-                        )
-                except ZeroDivisionError:
-                    logger.warning(
-                        f"Division by zero error calculating ratio for "
-                        f"user={user_str}, floor={floor_str}, flow={flow_str}"
-                    )
-                    ratio = 0
-                except Exception as e:
-                    logger.error(f"Error calculating ratio: {e}")
-                    ratio = 0
-                
-                # Get productivity color
-                try:
-                    if floor_str not in thresholds_config:
-                        missing_thresholds_count += 1
-                        invalid_floors.add(floor_str)
-                        logger.warning(
-                            f"No productivity thresholds found for floor '{floor_str}', "
-                            f"using default color for user={user_str}, flow={flow_str}"
-                        )
-                        color = "unknown"
-                    else:
-                        thresholds = thresholds_config[floor_str]
-                        
-                        # Validate thresholds
-                        if not thresholds or len(thresholds) < 3:
-                            logger.warning(
-                                f"Invalid thresholds for floor '{floor_str}': {thresholds}, "
-                                f"using default color"
-                            )
-                            color = "unknown"
-                        else:
-                            try:
-                                color = get_productivity_color(productivity, thresholds)
-                            except Exception as e:
-                                logger.error(f"Error in get_productivity_color: {e}")
-                                color = "unknown"
-                
-                except Exception as e:
-                    logger.error(f"Error determining productivity color: {e}")
-                    color = "unknown"
-                
-                # Ensure nested_dict structure exists
-                try:
-                    if user_str not in nested_dict:
-                        nested_dict[user_str] = {}
-                    if floor_str not in nested_dict[user_str]:
-                        nested_dict[user_str][floor_str] = {}
-                    if flow_str not in nested_dict[user_str][floor_str]:
-                        nested_dict[user_str][floor_str][flow_str] = {}
-                except Exception as e:
-                    logger.error(f"Error creating nested_dict structure: {e}")
-                    error_count += 1
-                    continue
-                
-                # Update nested dictionary
-                try:
-                    nested_dict[user_str][floor_str][flow_str]["hours_worked"] = int(hours_worked)
-                    nested_dict[user_str][floor_str][flow_str]["productivity"] = round(productivity, 2)
-                    nested_dict[user_str][floor_str][flow_str]["productivity_color"] = color
-                    nested_dict[user_str][floor_str][flow_str]["items_picked"] = int(items_picked)
-                    nested_dict[user_str][floor_str][flow_str]["lines_picked"] = int(lines_picked)
-                    nested_dict[user_str][floor_str][flow_str]["ratio"] = round(ratio, 2)
-                    
-                    logger.debug(
-                        f"Updated metrics for user={user_str}, floor={floor_str}, flow={flow_str}: "
-                        f"productivity={productivity:.2f}, items={int(items_picked)}, "
-                        f"lines={int(lines_picked)}, ratio={ratio:.2f}, color={color}"
-                    )
-                
-                except (ValueError, TypeError) as e:
-                    logger.error(
-                        f"Error updating nested_dict for user={user_str}, "
-                        f"floor={floor_str}, flow={flow_str}: {e}"
-                    )
-                    error_count += 1
-                    continue
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error updating nested_dict: {e}",
-                        exc_info=True
-                    )
-                    error_count += 1
-                    continue
-            
-            except Exception as e:
-                error_count += 1
+                entry = nested_dict.setdefault(user_str, {}).setdefault(floor_str, {}).setdefault(flow_str, {})
+                entry["hours_worked"] = int(hours)
+                entry["productivity"] = round(prod, 2) if hours > 0 else 0
+                entry["productivity_color"] = color
+                entry["items_picked"] = int(items)
+                entry["lines_picked"] = int(lines)
+                entry["ratio"] = round(group_ratio, 2)
+            except (ValueError, TypeError) as e:
                 logger.error(
-                    f"Unexpected error processing group (user={user}, floor={floor}, flow={flow}): {e}",
-                    exc_info=True
+                    f"Error updating nested_dict for user={user_str}, "
+                    f"floor={floor_str}, flow={flow_str}: {e}"
                 )
-                continue
+                error_count += 1
         
         # Log summary statistics
         successful_count = processed_count - error_count
@@ -1124,25 +877,11 @@ def calculate_picking_aggregate_metrics(
         if error_count > 0:
             logger.warning(f"{error_count} groups had processing errors")
         
-        # Log sample statistics
-        if successful_count > 0:
-            # Calculate some aggregate stats from the results
-            productivities = [
-                nested_dict[user][floor][flow].get("productivity", 0)
-                for user in nested_dict
-                for floor in nested_dict[user]
-                for flow in nested_dict[user][floor]
-                if "productivity" in nested_dict[user][floor][flow]
-            ]
-            
-            if productivities:
-                avg_productivity = sum(productivities) / len(productivities)
-                max_productivity = max(productivities)
-                min_productivity = min(productivities)
-                logger.debug(
-                    f"Productivity statistics: avg={avg_productivity:.2f}, "
-                    f"min={min_productivity:.2f}, max={max_productivity:.2f}"
-                )
+        if len(productivity):
+            logger.debug(
+                f"Productivity statistics: avg={productivity.round(2).mean():.2f}, "
+                f"min={productivity.round(2).min():.2f}, max={productivity.round(2).max():.2f}"
+            )
         
     except ValueError as e:
         logger.error(f"Validation error in aggregate metrics calculation: {e}")
@@ -1154,40 +893,183 @@ def calculate_picking_aggregate_metrics(
         )
         raise RuntimeError(f"Unexpected error calculating aggregate metrics: {e}") from e
 
+PICKING_STATE_KEYS = ["user", "floor", "flow", "hour"]
+PICKING_STATE_VALUES = ["lines_picked", "items_picked"]
+
+def build_picking_result(hourly: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Build the picking productivity from lines and items picked per user/floor/flow/hour.
+
+    Args:
+        hourly: Counts with PICKING_STATE_KEYS and PICKING_STATE_VALUES columns
+
+    Returns:
+        dict: Productivity by user/floor/flow/hour plus the aggregate metrics, as in picking.json
+    """
+    if hourly.empty:
+        return {}
+
+    counted = hourly[hourly["hour"] != NO_HOUR]
+    nested_dict, total_hours = hourly_productivity(
+        counted.set_index(PICKING_STATE_KEYS)["lines_picked"],
+        getattr(constant, "BREAKS", {}),
+        constant.PRODUCTIVITY_THRESHOLDS,
+    )
+    per_user = hourly.groupby(["user", "floor", "flow"], sort=True)[PICKING_STATE_VALUES].sum()
+    calculate_picking_aggregate_metrics(None, nested_dict, total_hours, per_user["lines_picked"], per_user["items_picked"])
+    return nested_dict
+
+def run_incremental_picking(date: str, floor_mapping: Dict[str, str], session_factory: Callable[[], Any] = SAPSession) -> Dict[str, Any]:
+    """
+    Update the picking productivity with the LTAP lines confirmed since the last run.
+
+    The state of the day is kept in the picking folder:
+        - picking_state.json: high-water mark (last confirmation date/time),
+          size of picking.csv, keys of the lines in the overlap window, lines
+          whose delivery has no route yet (retried on the next run) and the
+          lines and items picked per user/floor/flow/hour
+        - picking.csv: every LTAP line of the day, new lines are appended in place
+
+    Only lines after the mark (and the INCREMENTAL_OVERLAP_SECONDS before it,
+    deduplicated against the keys of the window) are merged with routes and
+    added to the hourly counts, from which picking.json is rebuilt. Neither
+    picking.csv nor the lines before the window are read again, so a run
+    costs the same late in the shift as early.
+
+    A run is committed by the single write of picking_state.json. Lines
+    appended to picking.csv by a run interrupted before that write are cut
+    off by the next run, which extracts them again from the same mark.
+
+    Args:
+        date: Day to extract (DD.MM.YYYY), another day than the stored one starts over
+        floor_mapping: Dictionary mapping picking areas to floor names
+        session_factory: Creates the SAP sessions, e.g. a fake one producing canned exports
+
+    Returns:
+        dict: The picking productivity written to picking.json
+
+    Raises:
+        ValueError: If the LTAP export has no confirmation date/time columns
+    """
+    folder_path = f"{constant.OUTPUT_PATH}/picking"
+    state_path = f"{folder_path}/picking_state.json"
+    day_path = f"{folder_path}/picking.csv"
+
+    try:
+        state = load_state(state_path, date)
+        if "mark" in state and not rollback_append(day_path, state.get("day_bytes", 0)):
+            logger.warning(f"{day_path} is shorter than {state_path} records, starting the day over")
+            state = {"date": date}
+        if "mark" not in state:
+            # New day: lines from earlier runs must not be counted again
+            remove_table(day_path)
+
+        mark = state.get("mark")
+        start = window_start(mark)
+        since = start.strftime("%H:%M:%S") if start is not None and start.strftime("%d.%m.%Y") == date else None
+        logger.info(f"Incremental LTAP extraction for {date}, high-water mark: {mark}")
+
+        # Extract and convert the lines since the mark
+        extract_ltap(date, "picking", "picking_delta", since, session_factory)
+        delta = convert_sap_export("picking_delta", "picking", constant.LTAP_DF)
+
+        missing_columns = [col for col in ("confirmation_date", "confirmation_time") if col not in delta.columns]
+        if missing_columns:
+            error_msg = f"Missing columns for incremental extraction in LTAP export: {missing_columns}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # The columns of picking.csv are fixed by the first export of the day
+        columns = state.setdefault("columns", list(delta.columns))
+        extra_columns = [col for col in delta.columns if col not in columns]
+        if extra_columns:
+            logger.warning(f"Ignoring LTAP columns missing from {day_path}: {extra_columns}")
+        delta = delta.reindex(columns=columns)
+
+        # Keep lines in the window that are not stored yet
+        delta_stamps = timestamps(delta, "confirmation_date", "confirmation_time")
+        candidates = delta[in_window(delta_stamps, start)]
+        candidate_keys = row_keys(candidates, columns)
+        window = state.get("window", [])
+        fresh = unseen(candidate_keys, [key for _, key in window])
+        new = candidates[fresh]
+        logger.info(f"{len(new)} new LTAP lines ({len(delta)} extracted, {len(candidates)} in the window since {start})")
+
+        pending = state_frame(state.get("pending"), columns)
+        pending = pd.concat([pending, new], ignore_index=True) if not pending.empty else new.reset_index(drop=True)
+        hourly = state_frame(
+            state.get("hourly"), PICKING_STATE_KEYS + PICKING_STATE_VALUES,
+            dtype={**{key: str for key in PICKING_STATE_KEYS}, **{value: np.int64 for value in PICKING_STATE_VALUES}},
+        )
+
+        # Routes are only looked up for the deliveries of new and pending lines
+        if not pending.empty:
+            deliveries = pending["delivery"].fillna(0).astype(int)
+            write_csv(deliveries.drop_duplicates(), f"{folder_path}/picking_deliveries.csv")
+            extract_hutolink("ZORF_HU_TO_LINK", "picking", "zorf_hu_to_link", session_factory)
+            extract_hutolink("ZORF_HUTO_LNKHIS", "picking", "zorf_huto_lnkhis", session_factory)
+            convert_sap_export("zorf_hu_to_link", "picking", constant.HUTOLINK_DF)
+            convert_sap_export("zorf_huto_lnkhis", "picking", constant.HUTOLINK_DF)
+            combined = combine()
+
+            routed = deliveries.isin(combined["document"]).to_numpy()
+            if routed.any():
+                prepared = prepare_ltap_data(combined, floor_mapping, pending[routed].reset_index(drop=True))
+                prepared["hour"] = prepared["hour"].fillna(NO_HOUR)
+                delta_counts = prepared.groupby(PICKING_STATE_KEYS, observed=True).agg(
+                    lines_picked=("actual_quantity", "size"),
+                    items_picked=("actual_quantity", "sum"),
+                ).reset_index()
+                for key in PICKING_STATE_KEYS:
+                    delta_counts[key] = delta_counts[key].astype(str)
+                hourly = merge_counts(hourly, delta_counts, PICKING_STATE_KEYS, PICKING_STATE_VALUES)
+                logger.info(f"Added {int(delta_counts['lines_picked'].sum())} lines to {len(delta_counts)} user/floor/flow/hour counts")
+
+            pending = pending[~routed]
+            if not pending.empty:
+                logger.info(f"{len(pending)} lines wait for the route of their delivery")
+
+        # The new lines are appended first, saving the state commits them with the counts and the mark
+        if not new.empty:
+            state["day_bytes"] = append_csv(day_path, new, columns)
+            latest = delta_stamps[new.index].max()
+            if pd.notna(latest) and (mark is None or latest > datetime.strptime(mark, STATE_TIMESTAMP_FORMAT)):
+                state["mark"] = latest.strftime(STATE_TIMESTAMP_FORMAT)
+            window = window + window_entries(delta_stamps[new.index], candidate_keys[fresh])
+        state.setdefault("mark", None)
+        state.setdefault("day_bytes", 0)
+        state["lines"] = state.get("lines", 0) + len(new)
+        state["window"] = prune_window(window, window_start(state["mark"]))
+        state["pending"] = state_rows(pending, columns)
+        state["hourly"] = state_rows(hourly, PICKING_STATE_KEYS + PICKING_STATE_VALUES)
+        save_state(state_path, state)
+
+        result = build_picking_result(hourly)
+        convert_to_json("picking", "picking", result)
+        logger.info(
+            f"Incremental picking update complete: {state['lines']} lines today, "
+            f"{len(state['window'])} in the overlap window, high-water mark {state['mark']}"
+        )
+        return result
+
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"Incremental picking update failed: {e}", exc_info=True)
+        raise
+
 if __name__ == "__main__":
     try:
         TODAY = constant.get_today()
 
-        # Transform routes
+        # Transform routes when routes.xlsx changed
         logger.info("Starting picking extraction workflow")
         try:
-            transform_routes()
+            refresh_routes()
             logger.info("Routes transformation completed successfully")
         except Exception as e:
             logger.warning(f"Routes transformation failed, continuing with extraction: {e}")
 
-        # Extract LTAP data
-        extract_ltap(TODAY, "picking", "picking")
-        logger.info("Extraction of LTAP was successfully, now retrieving deliveries")
-
-        # Retrieve deliveries from extracted LTAP file
-        retrieve_deliveries()
-
-        # Extract HUTOLINK files
-        extract_hutolink("ZORF_HU_TO_LINK", "picking", "zorf_hu_to_link")
-        extract_hutolink("ZORF_HUTO_LNKHIS", "picking", "zorf_huto_lnkhis")
-
-        # Converting and renaming HUTOLINK files
-        logger.info("Converting and renaming both files")
-        convert_to_csv("zorf_hu_to_link", "picking")
-        convert_to_csv("zorf_huto_lnkhis", "picking")
-        rename("zorf_hu_to_link", "picking", constant.HUTOLINK_DF)
-        rename("zorf_huto_lnkhis", "picking", constant.HUTOLINK_DF)
-
-        # Combining HUTOLINK files with routes
-        logger.info("Both files were successfully transformed now combining them with the routes")
-        combined = combine()
-
         # Floor mapping
         try:
             FLOOR_MAPPING = build_floor_mapping(constant.FLOORS)
@@ -1195,189 +1077,201 @@ if __name__ == "__main__":
             logger.error(f"Failed to create floor mapping: {e}. Using empty mapping.")
             FLOOR_MAPPING = {}
 
-        # Prepare LTAP data
-        ltap = prepare_ltap_data(combined, FLOOR_MAPPING)
+        if constant.LTAP_INCREMENTAL:
+            # Only lines confirmed since the last run are extracted and aggregated
+            run_incremental_picking(TODAY, FLOOR_MAPPING)
+        else:
+            # Extract LTAP data
+            extract_ltap(TODAY, "picking", "picking")
+            logger.info("Extraction of LTAP was successfully, now retrieving deliveries")
 
-        # Calculate grouped metrics
-        try:
-            logger.info("Calculating grouped metrics: lines per user by floor and flow")
+            # Retrieve deliveries from extracted LTAP file
+            retrieve_deliveries()
+
+            # Extract HUTOLINK files
+            extract_hutolink("ZORF_HU_TO_LINK", "picking", "zorf_hu_to_link")
+            extract_hutolink("ZORF_HUTO_LNKHIS", "picking", "zorf_huto_lnkhis")
+
+            # Converting HUTOLINK files
+            logger.info("Converting both files")
+            convert_sap_export("zorf_hu_to_link", "picking", constant.HUTOLINK_DF)
+            convert_sap_export("zorf_huto_lnkhis", "picking", constant.HUTOLINK_DF)
+
+            # Combining HUTOLINK files with routes
+            logger.info("Both files were successfully transformed now combining them with the routes")
+            combined = combine()
+
+            # Prepare LTAP data
+            ltap = prepare_ltap_data(combined, FLOOR_MAPPING)
+
+            # Calculate grouped metrics
+            try:
+                logger.info("Calculating grouped metrics: lines per user by floor and flow")
             
-            # Validate required columns exist before grouping
-            required_groupby_columns = ["user", "floor", "flow"]
-            missing_columns = [col for col in required_groupby_columns if col not in ltap.columns]
+                # Validate required columns exist before grouping
+                required_groupby_columns = ["user", "floor", "flow"]
+                missing_columns = [col for col in required_groupby_columns if col not in ltap.columns]
             
-            if missing_columns:
-                error_msg = f"Cannot calculate grouped metrics: missing required columns {missing_columns}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
+                if missing_columns:
+                    error_msg = f"Cannot calculate grouped metrics: missing required columns {missing_columns}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
             
-            logger.debug(f"Grouping by columns: {required_groupby_columns}")
+                logger.debug(f"Grouping by columns: {required_groupby_columns}")
             
-            # Check for empty dataframe
-            if ltap.empty:
-                logger.warning("LTAP dataframe is empty, groupby will return empty result")
-                lines_per_user = pd.Series(dtype='int64', name='count')
-            else:
-                # Check for null values in grouping columns
-                null_counts = {}
-                for col in required_groupby_columns:
-                    null_count = ltap[col].isna().sum()
-                    if null_count > 0:
-                        null_counts[col] = null_count
-                        logger.warning(
-                            f"Found {null_count} null values ({null_count/len(ltap)*100:.1f}%) "
-                            f"in grouping column '{col}'"
-                        )
+                # Check for empty dataframe
+                if ltap.empty:
+                    logger.warning("LTAP dataframe is empty, groupby will return empty result")
+                    lines_per_user = pd.Series(dtype='int64', name='count')
+                else:
+                    # Check for null values in grouping columns
+                    null_counts = {}
+                    for col in required_groupby_columns:
+                        null_count = ltap[col].isna().sum()
+                        if null_count > 0:
+                            null_counts[col] = null_count
+                            logger.warning(
+                                f"Found {null_count} null values ({null_count/len(ltap)*100:.1f}%) "
+                                f"in grouping column '{col}'"
+                            )
                 
-                # Perform groupby operation
-                try:
-                    lines_per_user = ltap.groupby(required_groupby_columns).size()
+                    # Perform groupby operation
+                    try:
+                        lines_per_user = ltap.groupby(required_groupby_columns).size()
                     
-                    # Validate result
-                    if lines_per_user.empty:
-                        logger.warning("Groupby result is empty - no data matches grouping criteria")
-                    else:
-                        # Log summary statistics
-                        total_groups = len(lines_per_user)
-                        total_lines = lines_per_user.sum()
-                        min_lines = lines_per_user.min()
-                        max_lines = lines_per_user.max()
-                        mean_lines = lines_per_user.mean()
+                        # Validate result
+                        if lines_per_user.empty:
+                            logger.warning("Groupby result is empty - no data matches grouping criteria")
+                        else:
+                            # Log summary statistics
+                            total_groups = len(lines_per_user)
+                            total_lines = lines_per_user.sum()
+                            min_lines = lines_per_user.min()
+                            max_lines = lines_per_user.max()
+                            mean_lines = lines_per_user.mean()
                         
-                        logger.info(
-                            f"Groupby completed successfully: "
-                            f"{total_groups} unique groups, "
-                            f"{total_lines} total lines, "
-                            f"range: {min_lines}-{max_lines} lines per group, "
-                            f"mean: {mean_lines:.1f} lines per group"
-                        )
+                            logger.info(
+                                f"Groupby completed successfully: "
+                                f"{total_groups} unique groups, "
+                                f"{total_lines} total lines, "
+                                f"range: {min_lines}-{max_lines} lines per group, "
+                                f"mean: {mean_lines:.1f} lines per group"
+                            )
                         
-                        # Log distribution by floor and flow
-                        if "floor" in lines_per_user.index.names:
-                            floor_counts = lines_per_user.groupby(level="floor").sum()
-                            logger.debug(f"Lines by floor: {dict(floor_counts)}")
+                            # Log distribution by floor and flow
+                            if "floor" in lines_per_user.index.names:
+                                floor_counts = lines_per_user.groupby(level="floor").sum()
+                                logger.debug(f"Lines by floor: {dict(floor_counts)}")
                         
-                        if "flow" in lines_per_user.index.names:
-                            flow_counts = lines_per_user.groupby(level="flow").sum()
-                            logger.debug(f"Lines by flow: {dict(flow_counts)}")
+                            if "flow" in lines_per_user.index.names:
+                                flow_counts = lines_per_user.groupby(level="flow").sum()
+                                logger.debug(f"Lines by flow: {dict(flow_counts)}")
                         
-                        # Log top groups
-                        top_groups = lines_per_user.nlargest(10)
-                        logger.debug(f"Top 10 groups by line count:\n{top_groups}")
+                            # Log top groups
+                            top_groups = lines_per_user.nlargest(10)
+                            logger.debug(f"Top 10 groups by line count:\n{top_groups}")
                 
-                except KeyError as e:
-                    error_msg = f"Column error during groupby operation: {e}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg) from e
-                except Exception as e:
-                    error_msg = f"Unexpected error during groupby operation: {e}"
-                    logger.error(error_msg, exc_info=True)
-                    raise RuntimeError(error_msg) from e
+                    except KeyError as e:
+                        error_msg = f"Column error during groupby operation: {e}"
+                        logger.error(error_msg)
+                        raise ValueError(error_msg) from e
+                    except Exception as e:
+                        error_msg = f"Unexpected error during groupby operation: {e}"
+                        logger.error(error_msg, exc_info=True)
+                        raise RuntimeError(error_msg) from e
             
-            logger.debug(f"Grouped metrics calculation complete. Result type: {type(lines_per_user)}")
+                logger.debug(f"Grouped metrics calculation complete. Result type: {type(lines_per_user)}")
             
-        except ValueError as e:
-            logger.error(f"Failed to calculate grouped metrics: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error calculating grouped metrics: {e}", exc_info=True)
-            raise
+            except ValueError as e:
+                logger.error(f"Failed to calculate grouped metrics: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error calculating grouped metrics: {e}", exc_info=True)
+                raise
 
-        # Calculate hourly productivity
-        nested_dict, total_hours = calculate_picking_hourly_productivity(ltap)
+            # Calculate hourly productivity
+            nested_dict, total_hours = calculate_picking_hourly_productivity(ltap)
 
-        # Calculate aggregate metrics
-        calculate_picking_aggregate_metrics(ltap, nested_dict, total_hours, lines_per_user)
+            # Calculate aggregate metrics
+            calculate_picking_aggregate_metrics(ltap, nested_dict, total_hours, lines_per_user)
 
-        # Convert nested dict to regular dict for JSON serialization
-        try:
-            logger.info("Converting nested defaultdict to regular dict for JSON serialization")
+            # Convert nested dict to regular dict for JSON serialization
+            try:
+                logger.info("Converting nested defaultdict to regular dict for JSON serialization")
             
-            # Validate nested_dict
-            if not nested_dict:
-                logger.warning("nested_dict is empty, result will be empty")
-                result = {}
-            else:
-                # Count structure depth and size for logging
-                total_users = len(nested_dict)
-                total_floors = sum(len(floors) for floors in nested_dict.values())
-                total_flows = sum(
-                    len(flows) 
-                    for floors in nested_dict.values() 
-                    for flows in floors.values()
-                )
-                total_hours = sum(
-                    len(hours) 
-                    for floors in nested_dict.values() 
-                    for flows in floors.values() 
-                    for hours in flows.values()
-                )
+                # Validate nested_dict
+                if not nested_dict:
+                    logger.warning("nested_dict is empty, result will be empty")
+                    result = {}
+                else:
+                    # Count structure depth and size for logging
+                    total_users = len(nested_dict)
+                    total_floors = sum(len(floors) for floors in nested_dict.values())
+                    total_flows = sum(
+                        len(flows) 
+                        for floors in nested_dict.values() 
+                        for flows in floors.values()
+                    )
+                    total_hours = sum(
+                        len(hours) 
+                        for floors in nested_dict.values() 
+                        for flows in floors.values() 
+                        for hours in flows.values()
+                    )
                 
-                logger.debug(
-                    f"Converting structure: {total_users} users, {total_floors} floors, "
-                    f"{total_flows} flows, {total_hours} hour entries"
-                )
+                    logger.debug(
+                        f"Converting structure: {total_users} users, {total_floors} floors, "
+                        f"{total_flows} flows, {total_hours} hour entries"
+                    )
                 
-                # Convert nested defaultdict to regular dict
-                try:
-                    result = {
-                        k: {
-                            k2: {
-                                k3: dict(v3) if isinstance(v3, dict) else v3
-                                for k3, v3 in v2.items()
+                    # Convert nested defaultdict to regular dict
+                    try:
+                        result = {
+                            k: {
+                                k2: {
+                                    k3: dict(v3) if isinstance(v3, dict) else v3
+                                    for k3, v3 in v2.items()
+                                }
+                                for k2, v2 in v.items()
                             }
-                            for k2, v2 in v.items()
+                            for k, v in nested_dict.items()
                         }
-                        for k, v in nested_dict.items()
-                    }
                     
-                    # Validate conversion
-                    if not result:
-                        logger.warning("Conversion resulted in empty dictionary")
-                    else:
-                        # Verify structure was preserved
-                        converted_users = len(result)
-                        if converted_users != total_users:
-                            logger.warning(
-                                f"User count mismatch after conversion: "
-                                f"expected {total_users}, got {converted_users}"
-                            )
+                        # Validate conversion
+                        if not result:
+                            logger.warning("Conversion resulted in empty dictionary")
+                        else:
+                            # Verify structure was preserved
+                            converted_users = len(result)
+                            if converted_users != total_users:
+                                logger.warning(
+                                    f"User count mismatch after conversion: "
+                                    f"expected {total_users}, got {converted_users}"
+                                )
                         
-                        logger.info(
-                            f"Successfully converted nested dict: {converted_users} users, "
-                            f"{len(result)} top-level entries"
-                        )
+                            logger.info(
+                                f"Successfully converted nested dict: {converted_users} users, "
+                                f"{len(result)} top-level entries"
+                            )
                 
-                except TypeError as e:
-                    error_msg = f"Type error during dict conversion: {e}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg) from e
-                except Exception as e:
-                    error_msg = f"Error converting nested dict structure: {e}"
-                    logger.error(error_msg, exc_info=True)
-                    raise RuntimeError(error_msg) from e
-            
-            # Validate result can be serialized
-            try:
-                import json
-                json.dumps(result)
-                logger.debug("Converted dict passed JSON serialization validation")
-            except TypeError as e:
-                error_msg = f"Converted dict contains non-serializable objects: {e}"
-                logger.error(error_msg)
-                raise TypeError(error_msg) from e
-            except Exception as e:
-                logger.warning(f"Unexpected error during serialization validation: {e}")
+                    except TypeError as e:
+                        error_msg = f"Type error during dict conversion: {e}"
+                        logger.error(error_msg)
+                        raise ValueError(error_msg) from e
+                    except Exception as e:
+                        error_msg = f"Error converting nested dict structure: {e}"
+                        logger.error(error_msg, exc_info=True)
+                        raise RuntimeError(error_msg) from e
         
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error converting nested dict: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in dict conversion: {e}", exc_info=True)
-            raise
+            except (ValueError, TypeError) as e:
+                logger.error(f"Error converting nested dict: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error in dict conversion: {e}", exc_info=True)
+                raise
 
-        # Save
-        convert_to_json("picking", "picking", result)
+            # Save
+            convert_to_json("picking", "picking", result)
 
         logger.info("Picking extraction workflow completed successfully")
 
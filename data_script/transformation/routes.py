@@ -1,6 +1,8 @@
 import data_script.config.constants as constant
 import pandas as pd
 from data_script.utils.logger import setup_logger
+from data_script.utils.files_utils import write_csv
+from data_script.utils.reference_data import misc_path, refresh_derived
 from pathlib import Path
 
 # Setup logger
@@ -32,7 +34,7 @@ def transform_routes() -> None:
         Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Convert to CSV
-        df.to_csv(csv_path, index=False)
+        write_csv(df, csv_path)
         logger.debug(f"Routes file transformed successfully: {csv_path}")
 
     except FileNotFoundError as e:
@@ -43,4 +45,19 @@ def transform_routes() -> None:
         raise
     except Exception as e:
         logger.error(F"Error transforming routes file: {e}", exc_info=True)
-        raise
\ No newline at end of file
+        raise
+
+def refresh_routes(force: bool = False) -> bool:
+    """
+    Transform routes.xlsx to CSV only when its content changed since the last transformation
+
+    Args:
+        force: Transform even when routes.xlsx didn't change
+
+    Returns:
+        bool: Whether routes.csv was written
+
+    Raises:
+        FileNotFoundError: If the Excel file doesn't exist
+    """
+    return refresh_derived("routes", misc_path("routes.xlsx"), [misc_path("routes.csv")], transform_routes, force)
@@ -1,143 +1,486 @@
+import numpy as np
 import pandas as pd
 import data_script.config.constants as constant
 from data_script.utils.logger import setup_logger
-from typing import Any, Optional, Dict
+from typing import Any, Iterator, Optional, Dict, IO, Tuple, Union
+from contextlib import contextmanager
 from pathlib import Path
+import tempfile
+import threading
+import stat
+import time
+import codecs
 import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Setup logger
 logger = setup_logger("file_transform")
 
-def convert_to_csv(filename: str, folder: str, dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+# Attempts and first delay (doubled after each attempt) of the final rename, which fails on
+# Windows while another program (SAP GUI, Excel, a file share reader) has the target open
+REPLACE_ATTEMPTS = 5
+REPLACE_RETRY_DELAY = 0.1
+
+# Process umask, read once since os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _target_mode(target: Path) -> int:
+    """Permissions for a replaced file: those of the existing target, or the default for new files."""
+    try:
+        return stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+def _replace(tmp_path: Union[str, Path], target: Path) -> None:
+    """os.replace with a short bounded retry while the target is locked by another process."""
+    delay = REPLACE_RETRY_DELAY
+    for attempt in range(1, REPLACE_ATTEMPTS + 1):
+        try:
+            os.replace(tmp_path, target)
+            return
+        except PermissionError as e:
+            if attempt == REPLACE_ATTEMPTS:
+                logger.error(f"Cannot replace {target} after {attempt} attempts: {e}")
+                raise
+            logger.warning(f"{target} is locked (attempt {attempt}/{REPLACE_ATTEMPTS}), retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+            delay *= 2
+
+@contextmanager
+def atomic_write(path: Union[str, Path], mode: str = "w", encoding: Optional[str] = "utf-8", newline: Optional[str] = None) -> Iterator[IO]:
     """
-    Convert a tab-separated text file to CSV format.
+    Open a temporary file that replaces the target path once writing succeeds.
+
+    The temporary file lives in the target's directory, is fsynced and then
+    renamed over the target with os.replace, so readers see either the old or
+    the new file and never a partially written one. On error the temporary
+    file is removed and the target is left untouched.
+
+    The file gets the permissions of the target it replaces (mkstemp creates
+    it readable by its owner only), and the rename is retried for a short
+    while when the target is locked by another program.
 
     Args:
-        filename: Name of the file (without extension) to convert
-        folder: Name of the folder where the file is located
-        dtype: Optional dictionary mapping column names to data types.
+        path: Final path of the file
+        mode: File mode, "w" for text or "wb" for bytes
+        encoding: Text encoding, ignored in binary mode
+        newline: Newline handling passed to open(), ignored in binary mode
+
+    Yields:
+        IO: File object to write the content to
+    """
+    target = Path(path)
+    binary = "b" in mode
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, mode, encoding=None if binary else encoding, newline=None if binary else newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _target_mode(target))
+        _replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+def dump_json(data: Any, compact: Optional[bool] = None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+        compact: Drop indentation and whitespace, defaults to constant.JSON_COMPACT
+
+    Returns:
+        bytes: The encoded JSON document
+
+    Raises:
+        TypeError: If data contains non-serializable objects
+    """
+    if compact is None:
+        compact = constant.JSON_COMPACT
+
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # Two-space indentation like orjson (which supports no other), so both write the same layout
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def write_json(path: Union[str, Path], data: Any, compact: Optional[bool] = None) -> int:
+    """
+    Atomically write data as UTF-8 JSON.
+
+    Args:
+        path: Final path of the JSON file
+        data: JSON-serializable data
+        compact: Drop indentation and whitespace, defaults to constant.JSON_COMPACT
+
+    Returns:
+        int: Number of bytes written
+
+    Raises:
+        TypeError: If data contains non-serializable objects
+    """
+    content = dump_json(data, compact)
+    with atomic_write(path, "wb") as f:
+        f.write(content)
+    return len(content)
+
+def write_csv(df: Union[pd.DataFrame, pd.Series], path: Union[str, Path], **kwargs: Any) -> None:
+    """
+    Atomically write a DataFrame as CSV.
+
+    Args:
+        df: DataFrame (or Series) to write
+        path: Final path of the CSV file
+        **kwargs: Extra arguments passed to DataFrame.to_csv (index defaults to False)
+    """
+    kwargs.setdefault("index", False)
+    with atomic_write(path, encoding=kwargs.pop("encoding", "utf-8"), newline="") as f:
+        df.to_csv(f, **kwargs)
+
+# Bytes sampled by detect_encoding, enough to cover the header and many rows
+ENCODING_SAMPLE_BYTES = 1 << 20
+
+# Encodings found by detect_encoding: path -> (mtime_ns, size, encoding)
+_encoding_cache: Dict[str, Tuple[int, int, str]] = {}
+_encoding_cache_lock = threading.Lock()
+
+def detect_encoding(path: Union[str, Path]) -> str:
+    """
+    Detect the text encoding of a file from its BOM and a bounded byte sample.
+
+    A UTF-8 or UTF-16 BOM decides directly. Otherwise the first
+    ENCODING_SAMPLE_BYTES are run through an incremental UTF-8 decoder (a
+    character cut at the sample boundary is not an error) and anything that
+    is not valid UTF-8 is read as latin-1, which decodes every byte and
+    matches SAP's codepage 1100. The result is cached per file as long as its
+    mtime and size are unchanged.
+
+    Args:
+        path: Path of the text file
 
     Returns:
-        DataFrame: The converted data as a pandas DataFrame
+        str: Encoding to pass to open() or pd.read_csv
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    key = str(path)
+    stat = os.stat(key)
+    with _encoding_cache_lock:
+        cached = _encoding_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(key, "rb") as f:
+        sample = f.read(ENCODING_SAMPLE_BYTES)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        encoding = "utf-8-sig"
+    elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = "utf-16"
+    else:
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=len(sample) < ENCODING_SAMPLE_BYTES)
+            encoding = "utf-8"
+        except UnicodeDecodeError:
+            encoding = "latin-1"
+
+    logger.debug(f"Detected encoding {encoding} for {key}")
+    with _encoding_cache_lock:
+        _encoding_cache[key] = (stat.st_mtime_ns, stat.st_size, encoding)
+    return encoding
+
+def read_text_csv(path: Union[str, Path], **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a CSV (or other delimited text) file decoded with detect_encoding.
+
+    The file is parsed once. Only when bytes past the sample turn out not to be
+    UTF-8 is it parsed a second time as latin-1, and that encoding is cached.
+
+    Args:
+        path: Path of the file
+        **kwargs: Extra arguments passed to pd.read_csv (except encoding)
+
+    Returns:
+        DataFrame: The parsed file
 
     Raises:
         FileNotFoundError: If the file doesn't exist
-        ValueError: If the file cannot be decoded with any standard encoding
         pd.errors.EmptyDataError: If the file is empty
     """
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-    file_path = f"{constant.OUTPUT_PATH}/{folder}/{filename}"
-    txt_file_path = f"{file_path}.txt"
+    encoding = detect_encoding(path)
+    try:
+        return pd.read_csv(path, encoding=encoding, **kwargs)
+    except UnicodeDecodeError:
+        if encoding == "latin-1":
+            raise
+        logger.warning(f"{encoding} decoding failed past the sampled bytes of {path}, reading as latin-1")
+        stat = os.stat(path)
+        with _encoding_cache_lock:
+            _encoding_cache[str(path)] = (stat.st_mtime_ns, stat.st_size, "latin-1")
+        return pd.read_csv(path, encoding="latin-1", **kwargs)
 
-    logger.info(f"Started converting {filename}")
+def _feather_path(path: Union[str, Path]) -> Path:
+    """Feather file stored next to the CSV path of an intermediate table."""
+    return Path(path).with_suffix(".feather")
 
-    # Check if the file exists
-    if not Path(txt_file_path).exists():
-        error_msg = f"File does not exists: {txt_file_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
+def _use_feather() -> bool:
+    return PYARROW_AVAILABLE and constant.TABLE_FORMAT == "feather"
 
-    for encoding in encodings:
+def table_source(path: Union[str, Path]) -> Path:
+    """
+    Pick the file an intermediate table is read from.
+
+    The Feather file is used when pyarrow is installed and it is at least as
+    new as the CSV, so a CSV edited by hand still wins over an older Feather file.
+
+    Args:
+        path: CSV path of the table
+
+    Returns:
+        Path: The Feather file or the CSV path
+    """
+    csv_path = Path(path)
+    feather_path = _feather_path(csv_path)
+    if PYARROW_AVAILABLE and feather_path.exists():
+        if not csv_path.exists() or feather_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+            return feather_path
+    return csv_path
+
+def table_exists(path: Union[str, Path]) -> bool:
+    """Check whether an intermediate table exists as CSV or Feather."""
+    return table_source(path).exists()
+
+def write_table(df: pd.DataFrame, path: Union[str, Path]) -> None:
+    """
+    Atomically write an intermediate pipeline table.
+
+    With pyarrow installed (and TABLE_FORMAT=feather) the table is stored as
+    Feather next to the CSV path, keeping its dtypes for the next stage, and a
+    CSV copy is exported for manual inspection unless TABLE_CSV_EXPORT is off.
+    Otherwise, or when Feather cannot hold the table (e.g. object columns
+    mixing numbers and strings), the CSV is the table.
+
+    Files uploaded to SAP are not intermediate tables and use write_csv.
+
+    Args:
+        df: Table to write
+        path: CSV path of the table, the Feather file uses the .feather suffix
+    """
+    csv_path = Path(path)
+    feather_path = _feather_path(csv_path)
+
+    if _use_feather():
+        # The CSV copy goes first so the Feather file is never older than it
+        if constant.TABLE_CSV_EXPORT:
+            write_csv(df, csv_path)
         try:
-            logger.debug(f"Attempting to read {filename} with encoding: {encoding}")
+            with atomic_write(feather_path, "wb") as f:
+                df.reset_index(drop=True).to_feather(f)
+            if not constant.TABLE_CSV_EXPORT:
+                csv_path.unlink(missing_ok=True)
+            return
+        except (ValueError, TypeError, pyarrow.ArrowException) as e:
+            logger.warning(f"Cannot store {feather_path.name} as Feather, keeping CSV only: {e}")
+            if not constant.TABLE_CSV_EXPORT:
+                write_csv(df, csv_path)
+    else:
+        write_csv(df, csv_path)
 
-            # Read header to get column names
-            df = pd.read_csv(f"{file_path}.txt", sep="\t", skiprows=3, nrows=1, header=0, encoding=encoding)
-            columns = df.columns.tolist()
+    # A Feather file from an earlier run would otherwise shadow the new CSV
+    feather_path.unlink(missing_ok=True)
 
-            # Read full data
-            df = pd.read_csv(f"{file_path}.txt", sep="\t", skiprows=5, header=None, names=columns, on_bad_lines="skip", encoding=encoding, dtype=dtype)
-            df = df.dropna(how="all")
+def remove_table(path: Union[str, Path]) -> None:
+    """Delete an intermediate table, both its CSV and its Feather file."""
+    Path(path).unlink(missing_ok=True)
+    _feather_path(path).unlink(missing_ok=True)
 
-            # Save to CSV
-            df.to_csv(f"{file_path}.csv", index=False, encoding="utf-8")
-            return df
+def _apply_dtypes(df: pd.DataFrame, dtype: Optional[Dict[str, Any]]) -> pd.DataFrame:
+    """Give a Feather table the column dtypes read_csv(dtype=...) would have produced."""
+    for column in df.columns[df.dtypes == object]:
+        # Arrow returns missing strings as None where read_csv yields NaN
+        df[column] = df[column].where(df[column].notna(), np.nan)
 
-        except (UnicodeDecodeError, UnicodeError) as e:
-            logger.warning(f"Failed to decode {filename} with encoding {encoding}: {e}")
+    for column, column_type in (dtype or {}).items():
+        if column not in df.columns:
             continue
-        except pd.errors.EmptyDataError:
-            logger.error(f"File is empty: {txt_file_path}")
-            raise
-        except Exception as e:
-            logger.error(f"Error converting file {filename} with encoding {encoding}: {e}", exc_info=True)
-            raise
+        if column_type in (str, "str", object, "object"):
+            if df[column].dtype != object:
+                df[column] = df[column].astype(object).where(df[column].isna(), df[column].astype(str))
+        elif df[column].dtype != pd.api.types.pandas_dtype(column_type):
+            df[column] = df[column].astype(column_type)
+    return df
+
+def read_table(path: Union[str, Path], dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Read an intermediate pipeline table written by write_table.
+
+    Args:
+        path: CSV path of the table
+        dtype: Optional dictionary mapping column names to data types
+
+    Returns:
+        DataFrame: The table, from Feather when available (see table_source)
+
+    Raises:
+        FileNotFoundError: If neither the CSV nor the Feather file exists
+        pd.errors.EmptyDataError: If the CSV file is empty
+    """
+    source = table_source(path)
+    if source.suffix == ".feather":
+        return _apply_dtypes(pd.read_feather(source), dtype)
+
+    return read_text_csv(source, dtype=dtype)
+
+# Frames shared by read_csv_cached: (path, dtype spec) -> (source, mtime_ns, size, frame)
+_csv_cache: Dict[Tuple[str, Tuple], Tuple[Path, int, int, pd.DataFrame]] = {}
+_csv_cache_lock = threading.Lock()
+
+def read_csv_cached(path: Union[str, Path], dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Read a CSV file (or intermediate table) once per version and share the frame between callers.
+
+    The frame is cached by path and dtypes and reused as long as the file it
+    was read from (see table_source) keeps its mtime and size, so every builder of a workflow run that
+    needs the same file gets the frame parsed by the first one. Dtypes for
+    columns missing from the file are ignored. Only the latest version of a
+    file is kept: frames of an older version are dropped when it is read again.
+
+    The returned frame is shared: callers must not modify it in place, but
+    derive new Series or frames from it instead.
+
+    Args:
+        path: Path of the CSV file
+        dtype: Optional dictionary mapping column names to data types
+
+    Returns:
+        DataFrame: The (shared) parsed file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        pd.errors.EmptyDataError: If the file is empty
+    """
+    path = str(path)
+    source = table_source(path)
+    stat = os.stat(source)
+    key = (path, tuple(sorted((column, str(column_type)) for column, column_type in (dtype or {}).items())))
+
+    with _csv_cache_lock:
+        cached = _csv_cache.get(key)
+    if cached is not None and cached[:3] == (source, stat.st_mtime_ns, stat.st_size):
+        logger.debug(f"Using cached frame for {path}")
+        return cached[3]
+
+    # The parser handles nullable integers ("Int64") through a slow object path,
+    # so those columns are parsed as plain numbers and converted afterwards
+    dtype = dtype or {}
+    nullable_ints = {
+        column: column_type for column, column_type in dtype.items()
+        if pd.api.types.is_extension_array_dtype(column_type) and pd.api.types.is_integer_dtype(column_type)
+    }
+    parse_dtype = {column: column_type for column, column_type in dtype.items() if column not in nullable_ints}
+
+    df = read_table(path, dtype=parse_dtype)
+
+    for column, column_type in nullable_ints.items():
+        if column in df.columns:
+            df[column] = df[column].astype(column_type)
 
-    error_msg = f"Could not decode file {filename} with any standard encoding. Tried: {', '.join(encodings)}"
-    logger.error(error_msg)
-    raise ValueError(error_msg)
+    with _csv_cache_lock:
+        # Drop the frames of older versions of the file, whatever their dtypes
+        for other in [other for other, entry in _csv_cache.items()
+                      if other[0] == path and entry[:3] != (source, stat.st_mtime_ns, stat.st_size)]:
+            del _csv_cache[other]
+        _csv_cache[key] = (source, stat.st_mtime_ns, stat.st_size, df)
+    logger.debug(f"Cached {path}: {len(df)} rows")
+    return df
 
-def rename(filename: str, folder: str, mapping: Dict[str, str], dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+def clear_csv_cache() -> None:
+    """Drop every frame cached by read_csv_cached, e.g. at the end of a workflow run."""
+    with _csv_cache_lock:
+        _csv_cache.clear()
+
+def convert_sap_export(filename: str, folder: str, mapping: Dict[str, str], dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
     """
-    Rename columns of a CSV file
+    Convert a tab-separated SAP list export into an intermediate table in one pass.
+
+    The export has three title lines, the header on line 4 and a separator on
+    line 5. The file is decoded once with the encoding from detect_encoding
+    and parsed with the header taken from line 4, columns are renamed with
+    mapping and the result is written once with write_table.
 
     Args:
         filename: Name of the file (without extension) to convert
         folder: Name of the folder where the file is located
-        mapping: Dictionary mapping columns names to new names
-        dtype: Optional dictionary mapping column names to data types
+        mapping: Dictionary mapping SAP column names to new names
+        dtype: Optional dictionary mapping SAP column names to data types
 
     Returns:
-        DataFrame: The converted data as a pandas DataFrame
+        DataFrame: The converted data with renamed columns
 
     Raises:
         FileNotFoundError: If the file doesn't exist
-        ValueError: If mapping is empty or columns don't exists in the file
         pd.errors.EmptyDataError: If the file is empty
     """
     file_path = f"{constant.OUTPUT_PATH}/{folder}/{filename}"
-    csv_file_path = f"{file_path}.csv"
+    txt_file_path = f"{file_path}.txt"
 
-    logger.info(f"Started renaming columns in {filename}")
+    logger.info(f"Started converting {filename}")
 
     # Check if the file exists
-    if not Path(csv_file_path).exists():
-        error_msg = f"File does not exists: {csv_file_path}"
+    if not Path(txt_file_path).exists():
+        error_msg = f"File does not exists: {txt_file_path}"
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
 
     try:
-        logger.debug(f"Reading {filename}")
-
-        # Read CSV file
-        try:
-            df = pd.read_csv(csv_file_path, dtype=dtype, encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try with different encoding if UTF-8 fails
-            logger.warning(f"UTF-8 encoding failed for {filename}, trying latin-1")
-            df = pd.read_csv(csv_file_path, dtype=dtype, encoding="latin-1")
-
+        # Skip the title lines and the separator below the header
+        df = read_text_csv(txt_file_path, sep="\t", skiprows=[0, 1, 2, 4], header=0, on_bad_lines="skip", dtype=dtype)
+        df = df.dropna(how="all").reset_index(drop=True)
         logger.debug(f"File contains {len(df)} rows and {len(df.columns)} columns")
-        logger.debug(f"Original columns: {list(df.columns)}")
-        
+
         # Rename columns
         df = df.rename(columns=mapping)
-        logger.debug(f"Renamed columns: {mapping}")
-        logger.debug(f"New columns: {list(df.columns)}")
-
-        # Save back to CSV
-        df.to_csv(csv_file_path, index=False, encoding="utf-8")
-        logger.info(f"Successfully renamed columns in {filename}. Renamed {len(mapping)} column(s)")
+        logger.debug(f"Renamed columns: {list(df.columns)}")
 
+        # Save as intermediate table (Feather and/or CSV)
+        write_table(df, f"{file_path}.csv")
+        logger.info(f"Successfully converted {filename}. Renamed {len(mapping)} column(s)")
         return df
 
-    except FileNotFoundError:
-        # Re-raise FileNotFoundError
-        raise
     except pd.errors.EmptyDataError:
-        error_msg = f"File is empty: {csv_file_path}"
-        logger.error(error_msg)
-        raise
-    except ValueError as e:
-        # Re-raise ValueError
+        logger.error(f"File is empty: {txt_file_path}")
         raise
     except PermissionError as e:
-        error_msg = f"Permission denied when writing to {csv_file_path}: {e}"
+        error_msg = f"Permission denied when writing to {file_path}.csv: {e}"
         logger.error(error_msg)
         raise PermissionError(error_msg) from e
     except Exception as e:
-        error_msg = f"Error renaming columns in {filename}: {e}"
-        logger.error(error_msg)
+        logger.error(f"Error converting file {filename}: {e}", exc_info=True)
         raise
 
 def convert_to_json(filename: str, folder: str, dictionary: Dict[str, Any]) -> None:
@@ -202,36 +545,12 @@ def convert_to_json(filename: str, folder: str, dictionary: Dict[str, Any]) -> N
         if file_path.exists():
             logger.debug(f"File already exists, will be overwritten: {file_path}")
         
-        # Validate dictionary can be serialized (basic check)
-        try:
-            # Try to serialize a small sample to catch obvious issues
-            json.dumps(dictionary, indent=4)
-            logger.debug("Dictionary passed JSON serialization validation")
-        except TypeError as e:
-            error_msg = f"Dictionary contains non-serializable objects: {e}"
-            logger.error(error_msg)
-            raise TypeError(error_msg) from e
-        except Exception as e:
-            logger.warning(f"Unexpected error during serialization check: {e}")
-        
-        # Write to file
+        # Write to file (serialization errors surface as TypeError below)
         try:
             logger.debug(f"Writing dictionary to {file_path}")
             
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(dictionary, f, indent=4, ensure_ascii=False)
-            
-            # Verify file was created and has content
-            if not file_path.exists():
-                error_msg = f"File was not created: {file_path}"
-                logger.error(error_msg)
-                raise FileNotFoundError(error_msg)
-            
-            file_size = file_path.stat().st_size
-            if file_size == 0:
-                logger.warning(f"File was created but is empty: {file_path}")
-            else:
-                logger.debug(f"File created successfully, size: {file_size} bytes")
+            file_size = write_json(file_path, dictionary)
+            logger.debug(f"File created successfully, size: {file_size} bytes")
             
             # Log dictionary statistics
             dict_size = len(dictionary)
@@ -249,7 +568,7 @@ def convert_to_json(filename: str, folder: str, dictionary: Dict[str, Any]) -> N
             logger.error(error_msg)
             raise IOError(error_msg) from e
         except TypeError as e:
-            error_msg = f"Type error during JSON serialization: {e}"
+            error_msg = f"Dictionary contains non-serializable objects: {e}"
             logger.error(error_msg)
             raise TypeError(error_msg) from e
         except Exception as e:
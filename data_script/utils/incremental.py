@@ -0,0 +1,248 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+import data_script.config.constants as constant
+from data_script.utils.logger import setup_logger
+from data_script.utils.files_utils import write_json
+from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Setup logger
+logger = setup_logger("incremental")
+
+# Timestamps are stored in the state files in this format
+STATE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Hour stored in hourly count tables for rows without a valid time
+NO_HOUR = "-"
+
+def load_state(path: Union[str, Path], date: str) -> Dict[str, Any]:
+    """
+    Load the state of an incremental extraction for the given day.
+
+    Args:
+        path: Path of the JSON state file
+        date: Day the state must belong to (DD.MM.YYYY)
+
+    Returns:
+        dict: The stored state, or a new state {"date": date} when the file
+        is missing, unreadable or from another day
+    """
+    try:
+        with open(path, "rb") as f:
+            state = json.loads(f.read())
+    except FileNotFoundError:
+        logger.info(f"No incremental state at {path}, starting a new day")
+        return {"date": date}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cannot read incremental state {path}, starting over: {e}")
+        return {"date": date}
+
+    if not isinstance(state, dict) or state.get("date") != date:
+        logger.info(f"Incremental state {path} is from {state.get('date') if isinstance(state, dict) else None}, starting {date}")
+        return {"date": date}
+    return state
+
+def save_state(path: Union[str, Path], state: Dict[str, Any]) -> None:
+    """
+    Atomically write the state of an incremental extraction.
+
+    The state holds the mark together with the counts and keys it applies to
+    (see state_rows), so a run is committed by this single write: a run that
+    is interrupted before it leaves the previous state complete.
+    """
+    write_json(path, state)
+
+def state_rows(df: pd.DataFrame, columns: List[str]) -> List[List[Any]]:
+    """
+    Rows of a small table as JSON lists, to store it in the state file.
+
+    Numpy scalars become Python values and missing values None.
+    """
+    if df.empty:
+        return []
+    values = df[columns].astype(object)
+    return values.where(values.notna(), None).to_numpy().tolist()
+
+def state_frame(rows: Optional[List[List[Any]]], columns: List[str], dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """Table stored with state_rows, an empty frame with the columns when there are no rows."""
+    df = pd.DataFrame(rows or [], columns=columns)
+    return df.astype(dtype) if dtype and not df.empty else df
+
+def timestamps(df: pd.DataFrame, date_column: str, time_column: str) -> pd.Series:
+    """
+    Combine SAP date (DD.MM.YYYY) and time (HH:MM:SS) columns into timestamps.
+
+    Returns:
+        Series: Timestamps, NaT where the date or time is missing or invalid
+    """
+    if df.empty:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    return pd.to_datetime(
+        df[date_column].astype(str).str.strip() + " " + df[time_column].astype(str).str.strip(),
+        format="%d.%m.%Y %H:%M:%S",
+        errors="coerce",
+    )
+
+def window_start(mark: Optional[str]) -> Optional[datetime]:
+    """
+    First timestamp that is extracted again after the high-water mark.
+
+    Lines confirmed shortly before the mark may be committed in SAP after the
+    previous extraction, so INCREMENTAL_OVERLAP_SECONDS before it are
+    extracted again and deduplicated against the lines already stored.
+
+    Args:
+        mark: High-water mark from the state, in STATE_TIMESTAMP_FORMAT
+
+    Returns:
+        datetime: Start of the overlap window, None when there is no mark yet
+    """
+    if not mark:
+        return None
+    return datetime.strptime(mark, STATE_TIMESTAMP_FORMAT) - timedelta(seconds=constant.INCREMENTAL_OVERLAP_SECONDS)
+
+def in_window(stamps: pd.Series, start: Optional[datetime]) -> pd.Series:
+    """Rows at or after start, rows without a timestamp always count as in the window."""
+    if start is None:
+        return pd.Series(True, index=stamps.index)
+    return stamps.isna() | (stamps >= pd.Timestamp(start))
+
+def rollback_append(path: Union[str, Path], size: int) -> bool:
+    """
+    Cut an append-only CSV table back to the size committed in the state.
+
+    Rows are appended before the state counting them is saved, so an
+    interrupted run can leave rows (or half a row) the state doesn't know.
+    They are cut off and extracted again from the unchanged mark.
+
+    Args:
+        path: Path of the CSV table
+        size: Size of the table in bytes when the state was saved
+
+    Returns:
+        bool: False when the table is shorter than the committed size
+        (deleted or replaced) and the day must start over
+    """
+    path = Path(path)
+    current = path.stat().st_size if path.exists() else 0
+    if current < size:
+        return False
+    if current > size:
+        logger.warning(f"Cutting {current - size} bytes off {path} appended by an interrupted run")
+        with open(path, "r+b") as f:
+            f.truncate(size)
+    return True
+
+def append_csv(path: Union[str, Path], rows: pd.DataFrame, columns: List[str]) -> int:
+    """
+    Append rows to a CSV table in place, writing the header when the table is new.
+
+    Only the new rows are written, so the cost doesn't grow with the table.
+    Rows are written in the given column order, missing columns stay empty.
+
+    Returns:
+        int: Size of the table in bytes after the append
+    """
+    path = Path(path)
+    header = not path.exists() or path.stat().st_size == 0
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        rows.reindex(columns=columns).to_csv(f, header=header, index=False)
+        f.flush()
+        os.fsync(f.fileno())
+    return path.stat().st_size
+
+def window_entries(stamps: pd.Series, *values: pd.Series) -> List[List[Any]]:
+    """
+    Entries [timestamp, values...] of rows kept in the state while they can be extracted again.
+
+    Timestamps are stored in STATE_TIMESTAMP_FORMAT, None when missing.
+    """
+    stored = stamps.dt.strftime(STATE_TIMESTAMP_FORMAT).astype(object).where(stamps.notna(), None)
+    return [list(entry) for entry in zip(stored, *values)]
+
+def prune_window(entries: List[List[Any]], start: Optional[datetime]) -> List[List[Any]]:
+    """
+    Entries that are still in the window starting at start (see window_entries).
+
+    Older rows are not extracted again, so they no longer need to be matched.
+    Entries without a timestamp are always in the window (see in_window).
+    """
+    if start is None:
+        return entries
+    first = start.strftime(STATE_TIMESTAMP_FORMAT)
+    return [entry for entry in entries if entry[0] is None or entry[0] >= first]
+
+def _key_column(values: pd.Series) -> pd.Series:
+    """Values as comparable strings, independent of whether they came from CSV, Feather or a state file."""
+    return values.astype(object).where(values.notna(), "").astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+
+def key_frame(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """The columns of df as the strings rows are compared on, e.g. to store keys in the state file."""
+    return pd.DataFrame({col: _key_column(df[col]) for col in columns}, index=df.index)
+
+def row_keys(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """One comparable string per row, independent of whether the values came from CSV or Feather."""
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+    parts = [_key_column(df[col]) for col in columns]
+    keys = parts[0]
+    for part in parts[1:]:
+        keys = keys + "\x1f" + part
+    return keys
+
+def unseen(keys: pd.Series, seen_keys: List[str]) -> pd.Series:
+    """
+    Whether each key (see row_keys) is new, compared with the keys already stored.
+
+    Identical keys are matched one to one, so a line that occurs twice in
+    keys and once in seen_keys is new once.
+
+    Returns:
+        Series: Boolean per key, True for the new rows
+    """
+    if not seen_keys or keys.empty:
+        return pd.Series(True, index=keys.index)
+
+    # Number repeated keys so that each stored occurrence cancels one candidate
+    seen = pd.Series(seen_keys, dtype=object)
+    candidate_ids = keys + "\x1e" + keys.groupby(keys).cumcount().astype(str)
+    seen_ids = seen + "\x1e" + seen.groupby(seen).cumcount().astype(str)
+    return ~candidate_ids.isin(set(seen_ids))
+
+def seen_mask(candidates: pd.DataFrame, seen: pd.DataFrame, key_columns: List[str]) -> pd.Series:
+    """
+    Whether each row of candidates has its key_columns values in seen.
+
+    Unlike unseen, a key stored once marks every candidate with that key,
+    for rows identified by a unique key such as a document number.
+
+    Returns:
+        Series: Boolean per row of candidates
+    """
+    if seen.empty or candidates.empty:
+        return pd.Series(False, index=candidates.index)
+    return row_keys(candidates, key_columns).isin(set(row_keys(seen, key_columns)))
+
+def merge_counts(state: pd.DataFrame, delta: pd.DataFrame, keys: List[str], values: List[str]) -> pd.DataFrame:
+    """
+    Add the counts of delta to the counts stored in state, per key.
+
+    Args:
+        state: Stored counts with the keys and values columns
+        delta: Counts of the new rows with the same columns
+        keys: Columns identifying a count, e.g. user/floor/hour
+        values: Count columns to add up
+
+    Returns:
+        DataFrame: Counts per key, sorted by the keys
+    """
+    if delta.empty:
+        return state.sort_values(keys, ignore_index=True) if not state.empty else state
+    merged = pd.concat([state[keys + values], delta[keys + values]], ignore_index=True) if not state.empty else delta[keys + values]
+    merged = merged.groupby(keys, sort=True)[values].sum().reset_index()
+    for col in values:
+        merged[col] = merged[col].astype(np.int64)
+    return merged
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from data_script.utils.logger import setup_logger
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Setup logger
+logger = setup_logger("productivity")
+
+def productivity_colors(values: Sequence[float], floors: Sequence[Any], thresholds_config: Dict[str, List[int]]) -> np.ndarray:
+    """
+    Assign productivity colors column-wise, like get_productivity_color does for one value.
+
+    Values below the first threshold of their floor are "red", below the
+    second "orange", below the third "green" and "purple" otherwise. Floors
+    (compared stripped) without valid thresholds get "unknown".
+
+    Args:
+        values: Productivity value per row
+        floors: Floor name per row
+        thresholds_config: Floor name -> [low, medium, high] thresholds
+
+    Returns:
+        np.ndarray: Color string per row
+    """
+    values = np.asarray(values, dtype=float)
+    floor_names = pd.Series(floors, dtype=object).astype(str).str.strip().to_numpy()
+    colors = np.full(len(values), "unknown", dtype=object)
+
+    for floor in pd.unique(floor_names):
+        thresholds = thresholds_config.get(floor)
+        if floor not in thresholds_config:
+            continue
+        if not thresholds or len(thresholds) < 3:
+            logger.warning(f"Invalid thresholds for floor '{floor}': {thresholds}, using default color")
+            continue
+
+        in_floor = floor_names == floor
+        floor_values = values[in_floor]
+        colors[in_floor] = np.select(
+            [floor_values < thresholds[0], floor_values < thresholds[1], floor_values < thresholds[2]],
+            ["red", "orange", "green"],
+            default="purple",
+        )
+
+    return colors
+
+def hourly_productivity(
+    per_hour: pd.Series,
+    breaks_config: Dict[str, float],
+    thresholds_config: Dict[str, List[int]],
+) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    """
+    Adjust hourly counts for breaks and give each a productivity color.
+
+    The break multiplier of each hour is mapped as a column: the count of an
+    hour with a break is divided by its multiplier and the hour counts as that
+    fraction of an hour worked. Hours without a break, or with a zero
+    multiplier, count as one full hour.
+
+    Args:
+        per_hour: Count per group and hour, indexed by the group columns
+            (including "floor") followed by "hour", e.g. user/floor/flow/hour
+        breaks_config: Hour ("09") -> share of the hour worked
+        thresholds_config: Floor name -> [low, medium, high] thresholds
+
+    Returns:
+        Tuple containing:
+            - nested_dict: group columns... -> hour -> {"count", "productivity_color"}
+            - total_hours: group columns... -> hours worked
+    """
+    if per_hour.empty:
+        return {}, {}
+
+    group_columns = list(per_hour.index.names[:-1])
+    groups = per_hour.rename("count").reset_index()
+    groups.columns = group_columns + ["hour", "count"]
+    groups["hour"] = groups["hour"].astype(str).str.strip()
+
+    multiplier = groups["hour"].map(breaks_config).astype(float)
+    zero_breaks = multiplier == 0
+    if zero_breaks.any():
+        logger.warning(
+            f"Break multiplier is zero for hours {sorted(groups.loc[zero_breaks, 'hour'].unique())}, "
+            f"using original count"
+        )
+    adjusted = multiplier.notna() & ~zero_breaks
+    groups["hours_worked"] = multiplier.where(adjusted, 1.0)
+    groups["adjusted_count"] = groups["count"] / groups["hours_worked"]
+    groups["productivity_color"] = productivity_colors(groups["adjusted_count"], groups["floor"], thresholds_config)
+    logger.debug(f"Applied break adjustment to {int(adjusted.sum())} of {len(groups)} groups")
+
+    # Later duplicates of an hour (e.g. "09" and "09 ") overwrite earlier ones
+    nested_dict: Dict[Any, Any] = {}
+    for *keys, hour, count, color in zip(
+        *(groups[col].tolist() for col in group_columns),
+        groups["hour"].tolist(), groups["count"].tolist(), groups["productivity_color"].tolist(),
+    ):
+        level = nested_dict
+        for key in keys:
+            level = level.setdefault(key, {})
+        level[hour] = {"count": count, "productivity_color": color}
+
+    total_hours: Dict[Any, Any] = {}
+    for *keys, hours in groups.groupby(group_columns, sort=False)["hours_worked"].sum().reset_index().itertuples(index=False):
+        level = total_hours
+        for key in keys[:-1]:
+            level = level.setdefault(key, {})
+        level[keys[-1]] = hours
+
+    return nested_dict, total_hours
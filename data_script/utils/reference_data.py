@@ -0,0 +1,181 @@
+import hashlib
+import json
+import threading
+import pandas as pd
+import data_script.config.constants as constant
+from data_script.utils.logger import setup_logger
+from data_script.utils.files_utils import read_csv_cached, table_exists, write_json
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+from pathlib import Path
+
+# Setup logger
+logger = setup_logger("reference_data")
+
+# Versions of the reference files, shared by the picking, packing and dashboard processes
+MANIFEST_FILENAME = "reference_data.json"
+
+# Column dtypes of the reference files. The route and user columns of routes.csv and
+# users_floor.csv are merge keys and left to type inference like the SAP exports they
+# are merged with, so numeric codes still match. b_flow routes are compared as strings.
+ROUTES_FILE_DTYPES = {"flow": str}
+USERS_FLOOR_DTYPES = {"floor": str}
+BFLOW_ROUTES_DTYPES = {"route": str}
+
+def misc_path(filename: str) -> Path:
+    """Path of a reference file in the misc folder."""
+    return Path(constant.OUTPUT_PATH) / "misc" / filename
+
+def file_version(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Version of a file: its mtime, size and SHA-256 of the content.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    stat = Path(path).stat()
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest.hexdigest()}
+
+def _load_manifest() -> Dict[str, Any]:
+    try:
+        with open(misc_path(MANIFEST_FILENAME), "rb") as f:
+            manifest = json.loads(f.read())
+        return manifest if isinstance(manifest, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cannot read {MANIFEST_FILENAME}, reference files will be regenerated: {e}")
+        return {}
+
+def _save_manifest(manifest: Dict[str, Any]) -> None:
+    write_json(misc_path(MANIFEST_FILENAME), manifest, compact=False)
+
+def _current_version(stored: Optional[Dict[str, Any]], path: Path) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Compare a file with its stored version.
+
+    The content is only hashed when the mtime or size differ, so a file that
+    was saved again without changes keeps its version.
+
+    Returns:
+        Tuple containing:
+            - changed: Whether the content differs from the stored version
+            - version: Current version of the file
+    """
+    stat = path.stat()
+    if stored and (stored.get("mtime_ns"), stored.get("size")) == (stat.st_mtime_ns, stat.st_size):
+        return False, stored
+    version = file_version(path)
+    return not stored or stored.get("sha256") != version["sha256"], version
+
+def refresh_derived(
+    name: str,
+    source: Union[str, Path],
+    outputs: List[Union[str, Path]],
+    build: Callable[[], None],
+    force: bool = False,
+) -> bool:
+    """
+    Rebuild files derived from a reference file only when that file changed.
+
+    The version of source (see file_version) is stored under name in
+    misc/reference_data.json after each build. As long as the content of
+    source keeps that version and every output exists, build is skipped.
+
+    Args:
+        name: Key of the derived files in the manifest, e.g. "routes"
+        source: Reference file the outputs are derived from
+        outputs: Files written by build
+        build: Writes the outputs from source
+        force: Build even when source didn't change
+
+    Returns:
+        bool: Whether build ran
+
+    Raises:
+        FileNotFoundError: If source doesn't exist
+    """
+    source = Path(source)
+    if not source.exists():
+        error_msg = f"Reference file not found: {source}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+
+    manifest = _load_manifest()
+    stored = manifest.get(name)
+    changed, version = _current_version(stored, source)
+    missing = [str(path) for path in outputs if not table_exists(path)]
+
+    if not (force or changed or missing):
+        if version is not stored:
+            # Saved again with the same content, only the mtime is updated
+            manifest[name] = version
+            _save_manifest(manifest)
+        logger.info(f"{source.name} unchanged (sha256 {version['sha256'][:12]}), keeping {[Path(path).name for path in outputs]}")
+        return False
+
+    logger.info(f"Rebuilding {name} from {source.name} (changed: {changed}, missing outputs: {missing}, forced: {force})")
+    build()
+
+    # Re-read the manifest, another process may have updated other entries meanwhile
+    manifest = _load_manifest()
+    manifest[name] = version
+    _save_manifest(manifest)
+    return True
+
+# Lookups parsed per file version: (kind, path) -> (mtime_ns, size, lookup)
+_lookup_cache: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+_lookup_cache_lock = threading.Lock()
+
+def _cached_lookup(kind: str, path: Path, build: Callable[[pd.DataFrame], Any], dtype: Optional[Dict[str, Any]] = None) -> Any:
+    """Build a lookup from a reference CSV once per version of the file."""
+    stat = path.stat()
+    key = (kind, str(path))
+    with _lookup_cache_lock:
+        cached = _lookup_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    lookup = build(read_csv_cached(path, dtype=dtype))
+    with _lookup_cache_lock:
+        _lookup_cache[key] = (stat.st_mtime_ns, stat.st_size, lookup)
+    return lookup
+
+def routes_table() -> pd.DataFrame:
+    """
+    The routes (misc/routes.csv) as a shared frame, parsed once per version.
+
+    Callers must not modify the frame in place (see read_csv_cached).
+    """
+    return read_csv_cached(misc_path("routes.csv"), dtype=ROUTES_FILE_DTYPES)
+
+def users_floor_table() -> pd.DataFrame:
+    """
+    The users and their floor (misc/users_floor.csv) as a shared frame, parsed once per version.
+
+    Callers must not modify the frame in place (see read_csv_cached).
+    """
+    return read_csv_cached(misc_path("users_floor.csv"), dtype=USERS_FLOOR_DTYPES)
+
+def _route_set(df: pd.DataFrame) -> FrozenSet[str]:
+    if "route" not in df.columns:
+        error_msg = "Missing required column 'route' in bflow_routes.csv"
+        logger.error(error_msg)
+        raise KeyError(error_msg)
+    return frozenset(df["route"].dropna().astype(str).str.strip().str.upper())
+
+def bflow_routes() -> FrozenSet[str]:
+    """
+    Routes of the b_flow from misc/bflow_routes.csv.
+
+    Returns:
+        frozenset: Stripped, upper-case routes
+
+    Raises:
+        FileNotFoundError: If bflow_routes.csv doesn't exist
+        KeyError: If the route column is missing
+    """
+    return _cached_lookup("bflow_routes", misc_path("bflow_routes.csv"), _route_set, BFLOW_ROUTES_DTYPES)
@@ -0,0 +1,28 @@
+import { useEffect, useRef } from 'react';
+import { subscribeToDatasetEvents } from '../services/api';
+
+/**
+ * Call onChange whenever the server reports a new version of one of the datasets.
+ * The initial versions sent on connect only record what the client already has.
+ */
+export const useDatasetEvents = (datasets, onChange, enabled = true) => {
+  const onChangeRef = useRef(onChange);
+  onChangeRef.current = onChange;
+  const datasetsKey = datasets.join(',');
+
+  useEffect(() => {
+    if (!enabled) return undefined;
+
+    const watched = new Set(datasetsKey.split(','));
+    const knownEtags = {};
+
+    return subscribeToDatasetEvents(({ dataset, etag }) => {
+      if (!watched.has(dataset)) return;
+      const isUpdate = dataset in knownEtags && knownEtags[dataset] !== etag;
+      knownEtags[dataset] = etag;
+      if (isUpdate) {
+        onChangeRef.current(dataset);
+      }
+    });
+  }, [datasetsKey, enabled]);
+};
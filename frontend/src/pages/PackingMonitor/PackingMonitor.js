@@ -1,5 +1,6 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useLocalStorage } from '../../hooks/useLocalStorage';
+import { useDatasetEvents } from '../../hooks/useDatasetEvents';
 import { fetchPackingData } from '../../services/api';
 import { PACKING_PASSWORD, FLOORS, FLOOR_NAMES } from '../../utils/constants';
 import PageLayout from '../../components/common/PageLayout/PageLayout';
@@ -51,6 +52,9 @@ function PackingMonitor() {
     }
   }, [isAuthenticated, fetchData]);
 
+  // Refetch when the server pushes a new version of the data
+  useDatasetEvents(['cdhdr'], fetchData, isAuthenticated);
+
   if (!isAuthenticated) {
     return (
       <PageLayout>
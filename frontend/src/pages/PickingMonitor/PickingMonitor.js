@@ -1,5 +1,6 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useLocalStorage } from '../../hooks/useLocalStorage';
+import { useDatasetEvents } from '../../hooks/useDatasetEvents';
 import { fetchPickingData } from '../../services/api';
 import { PICKING_PASSWORD, FLOORS, FLOOR_NAMES, FLOW_TYPES } from '../../utils/constants';
 import PageLayout from '../../components/common/PageLayout/PageLayout';
@@ -52,6 +53,9 @@ function PickingMonitor() {
     }
   }, [isAuthenticated, fetchData]);
 
+  // Refetch when the server pushes a new version of the data
+  useDatasetEvents(['ltap'], fetchData, isAuthenticated);
+
   if (!isAuthenticated) {
     return (
       <PageLayout>
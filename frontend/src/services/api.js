@@ -37,6 +37,18 @@ export const fetchPackingData = async () => {
   return apiFetch(API_ENDPOINTS.PACKING_DATA);
 };
 
+/**
+ * Subscribe to dataset change events pushed by the server.
+ * Returns a function that closes the stream.
+ */
+export const subscribeToDatasetEvents = (onEvent) => {
+  const source = new EventSource(`${API_BASE_URL}${API_ENDPOINTS.EVENTS}`);
+  source.addEventListener('dataset', (message) => {
+    onEvent(JSON.parse(message.data));
+  });
+  return () => source.close();
+};
+
 /**
  * Fetch users names
  */
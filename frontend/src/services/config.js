@@ -7,6 +7,7 @@ export const API_ENDPOINTS = {
   PACKING_DATA: '/data_cdhdr',
   USERS_NAMES: '/users_names',
   BARCODE: '/barcode',
+  EVENTS: '/events',
   DELIVERIES_PAST: '/data_deliveries_past',
   DELIVERIES_TODAY: '/data_deliveries_today',
   DELIVERIES_FUTURE: '/data_deliveries_future',
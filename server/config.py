@@ -21,10 +21,23 @@ class Settings:
     printer_2nd_floor_ip = os.getenv("PRINTER_2ND_FLOOR_IP", "")
     printer_port = int(os.getenv("PRINTER_PORT", "0")) if os.getenv("PRINTER_PORT") else 0
 
+    # Additional datasets to serve, as "name=relative/path.json" pairs separated by commas
+    extra_datasets = os.getenv("EXTRA_DATASETS", "")
+
     # Retry configuration
     file_load_retries = int(os.getenv("FILE_LOAD_RETRIES", "3"))
     file_load_retry_delay = float(os.getenv("FILE_LOAD_RETRY_DELAY", "1.0"))
 
+    # Reload scheduler configuration
+    file_reload_debounce = float(os.getenv("FILE_RELOAD_DEBOUNCE", "0.5"))
+    # A file that keeps changing is reloaded at the latest this long after its first change
+    file_reload_max_delay = float(os.getenv("FILE_RELOAD_MAX_DELAY", str(10 * file_reload_debounce)))
+    file_reload_workers = int(os.getenv("FILE_RELOAD_WORKERS", "4"))
+
+    # Event stream configuration
+    sse_heartbeat_interval = float(os.getenv("SSE_HEARTBEAT_INTERVAL", "15.0"))
+    sse_client_queue_size = int(os.getenv("SSE_CLIENT_QUEUE_SIZE", "100"))
+
     # Socket timeout configuration
     socket_timeout = float(os.getenv("SOCKET_TIMEOUT", "0.0"))
 
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from typing import Set
+from data_script.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger("events")
+
+
+@dataclass(frozen=True)
+class DatasetEvent:
+    dataset: str
+    version: int
+    etag: str
+
+    def to_sse(self) -> str:
+        """Format the event as a Server-Sent Events message."""
+        payload = json.dumps({"dataset": self.dataset, "version": self.version, "etag": self.etag})
+        return f"event: dataset\nid: {self.dataset}:{self.version}\ndata: {payload}\n\n"
+
+
+class EventSubscription:
+    """Queue of pending events for one connected client."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def _put(self, event: DatasetEvent) -> None:
+        # Runs on the event loop; a slow client only needs the latest versions
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    def push(self, event: DatasetEvent) -> None:
+        """Hand an event to the client's queue, safe to call from any thread."""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+
+class EventBroker:
+    """
+    Fans out dataset change notifications from the file watcher to streaming clients.
+
+    The watcher calls ``publish`` from its observer thread; every subscription
+    belongs to the asyncio loop that created it and receives the event through
+    ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._subscriptions: Set[EventSubscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> EventSubscription:
+        subscription = EventSubscription(asyncio.get_running_loop(), self.max_pending)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        logger.info(f"Event stream client connected ({len(self._subscriptions)} active)")
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+        logger.info(f"Event stream client disconnected ({len(self._subscriptions)} active)")
+
+    def publish(self, dataset: str, version: int, etag: str) -> None:
+        """Push a dataset change to every connected client."""
+        event = DatasetEvent(dataset=dataset, version=version, etag=etag)
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        for subscription in subscriptions:
+            try:
+                subscription.push(event)
+            except RuntimeError:
+                # Loop already closed, the client is gone
+                self.unsubscribe(subscription)
+
+        logger.debug(f"Published {dataset} version {version} to {len(subscriptions)} clients")
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscriptions)
@@ -2,15 +2,19 @@ from data_script.utils.logger import setup_logger
 
 # Set up logger
 logger = setup_logger("main")
-import copy
-import math
-from typing import Dict, Any, List, Set, Union
-from fastapi import FastAPI, HTTPException, Request
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Set, Union
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import pandas as pd
+from data_script.utils.files_utils import write_csv
 from .watch import WatchFiles
+from .events import DatasetEvent, EventBroker
 from .barcode_printer import print_barcode
 from .config import settings
 
@@ -38,19 +42,40 @@ class BarcodeResponse(BaseModel):
     message: str
 
 
+class DatasetHealth(BaseModel):
+    loaded: bool = Field(..., description="Whether the initial load finished")
+    last_loaded_at: Optional[datetime] = Field(None, description="Last successful load")
+    file_modified_at: Optional[datetime] = Field(None, description="Modification time of the JSON file")
+    size_bytes: Optional[int] = Field(None, description="Size of the JSON file")
+    entries: int = Field(..., description="Number of top-level entries served")
+    parse_seconds: Optional[float] = Field(None, description="Duration of the last successful read and parse")
+    loads: int = Field(..., description="Loads since start")
+    retries: int = Field(..., description="Retried reads since start")
+    failures: int = Field(..., description="Failed loads since start")
+    source_modified_at: Optional[datetime] = Field(None, description="Modification time of the SAP export the data comes from")
+    data_age_seconds: Optional[float] = Field(None, description="Age of the served data since the SAP export")
+    pipeline_seconds: Optional[float] = Field(None, description="Time between the SAP export and the JSON file")
+
+
 class HealthResponse(BaseModel):
     status: str
     service: str
     data_loaded: bool
+    loaded_datasets: List[str] = Field(default_factory=list, description="Datasets whose initial load finished")
+    pending_datasets: List[str] = Field(default_factory=list, description="Datasets still loading")
+    datasets: Dict[str, DatasetHealth] = Field(default_factory=dict, description="Per-dataset load metrics")
 
 
 class UsersNamesResponse(BaseModel):
     status: str
 
 
-# Initialize watcher
+# Initialize event broker and watcher
+event_broker = EventBroker(max_pending=settings.sse_client_queue_size)
+
 try:
     watcher = WatchFiles()
+    watcher.add_listener(event_broker.publish)
     watcher.start_watching()
     logger.info("File watcher initialized and started")
 except Exception as e:
@@ -69,224 +94,171 @@ async def log_requests(request: Request, call_next):
 
 
 # Utility functions
-def merge_names(data: Dict[str, Any], names_dict: Dict[str, str]) -> Dict[str, Any]:
-    new_data = copy.deepcopy(data)
-    for username, user_data in new_data.items():
-        if username in names_dict:
-            user_data['name'] = names_dict[username]
-        else:
-            user_data['name'] = 'Unknown'
-    return new_data
-
-
-def clean_nan_values(data: Any) -> Any:
-    if isinstance(data, dict):
-        return {key: clean_nan_values(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [clean_nan_values(item) for item in data]
-    elif isinstance(data, float) and (math.isnan(data) or math.isinf(data)):
-        return None
-    else:
-        return data
+def is_not_modified(request: Request, etag: str, loaded_at: float) -> bool:
+    """Evaluate the client's conditional headers against a dataset version."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        if if_none_match.strip() == "*":
+            return True
+        client_etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag in client_etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have second resolution
+        return int(loaded_at) <= since
+
+    return False
+
+
+def cached_json_response(dataset: str, request: Request) -> Response:
+    """Return the pre-encoded body of a dataset, or 304 if the client has it."""
+    cached = watcher.get_response(dataset)
+    headers = {
+        "ETag": cached.etag,
+        "Last-Modified": cached.last_modified,
+        "Cache-Control": "no-cache",
+    }
+    if is_not_modified(request, cached.etag, cached.loaded_at):
+        logger.debug(f"{dataset} not modified since client's copy ({cached.etag})")
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+
+
+def dataset_health(name: str, now: float) -> DatasetHealth:
+    """Collect the load metrics and data age of one dataset."""
+    stats = watcher.stats[name]
+    source_mtime = watcher.source_mtime(name)
+
+    data_age = None
+    pipeline = None
+    if source_mtime is not None:
+        data_age = round(now - source_mtime, 3)
+        if stats.file_mtime is not None:
+            pipeline = round(stats.file_mtime - source_mtime, 3)
+
+    return DatasetHealth(
+        loaded=watcher.is_loaded(name),
+        last_loaded_at=to_datetime(stats.last_loaded_at),
+        file_modified_at=to_datetime(stats.file_mtime),
+        size_bytes=stats.size_bytes,
+        entries=stats.entries,
+        parse_seconds=round(stats.parse_seconds, 4) if stats.parse_seconds is not None else None,
+        loads=stats.loads,
+        retries=stats.retries,
+        failures=stats.failures,
+        source_modified_at=to_datetime(source_mtime),
+        data_age_seconds=data_age,
+        pipeline_seconds=pipeline,
+    )
 
 
 # API Endpoints
 @app.get('/health', response_model=HealthResponse)
 def health_check() -> HealthResponse:
-    data_loaded = watcher is not None and (
-        bool(watcher.cdhdr_data) or 
-        bool(watcher.ltap_data) or 
-        bool(watcher.bflow_monitor_data) or 
-        bool(watcher.shipment_workl_data)
-    )
-    
+    if watcher is None:
+        return HealthResponse(status="unhealthy", service="CVNS Dashboard API", data_loaded=False)
+
+    loaded = sorted(name for name in watcher.dataset_paths if watcher.is_loaded(name))
+    pending = sorted(name for name in watcher.dataset_paths if not watcher.is_loaded(name))
+    data_loaded = any(bool(watcher.get_data(name)) for name in loaded)
+    now = time.time()
+
     return HealthResponse(
-        status="healthy" if watcher is not None else "unhealthy",
+        status="healthy",
         service="CVNS Dashboard API",
-        data_loaded=data_loaded
+        data_loaded=data_loaded,
+        loaded_datasets=loaded,
+        pending_datasets=pending,
+        datasets={name: dataset_health(name, now) for name in sorted(watcher.dataset_paths)},
     )
 
 
-@app.get('/data_cdhdr')
-def get_packing_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.cdhdr_data:
-            logger.warning("CDHDR data is empty")
-            return {}
-        
-        result = merge_names(watcher.cdhdr_data, watcher.users_name)
-        logger.debug(f"Returning CDHDR data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting packing data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+@app.get('/events')
+async def stream_dataset_events(request: Request) -> StreamingResponse:
+    """
+    Stream dataset change notifications as Server-Sent Events.
+
+    On connect the client receives the current version of every dataset, then
+    one ``dataset`` event per change. Comment lines are sent as heartbeats so
+    proxies keep the connection open.
+    """
+    if watcher is None:
+        logger.error("Watcher not initialized")
+        raise HTTPException(status_code=503, detail="File watcher not initialized", headers={"Retry-After": "1"})
+
+    subscription = event_broker.subscribe()
+
+    async def event_generator():
+        try:
+            yield f"retry: {int(settings.sse_heartbeat_interval * 1000)}\n\n"
+            for dataset, version in list(watcher.versions.items()):
+                cached = watcher.get_response(dataset)
+                yield DatasetEvent(dataset=dataset, version=version, etag=cached.etag).to_sse()
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=settings.sse_heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield event.to_sse()
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
-@app.get('/data_ltap')
-def get_picking_data() -> Dict[str, Any]:
+@app.get('/data/{name}')
+def get_dataset(name: str, request: Request) -> Response:
     try:
         if watcher is None:
             raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.ltap_data:
-            logger.warning("LTAP data is empty")
-            return {}
-        
-        result = merge_names(watcher.ltap_data, watcher.users_name)
-        logger.debug(f"Returning LTAP data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting picking data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@app.get('/data_deliveries_dashboard')
-def get_deliveries_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.deliveries_dashboard_data:
-            logger.warning("DELIVERIES DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.deliveries_dashboard_data
-        logger.debug(f"Returning DELIVERIES DASHBOARD data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting deliveries dashboard data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        if name not in watcher.dataset_paths:
+            raise HTTPException(status_code=404, detail=f"Unknown dataset: {name}")
 
-@app.get('/data_hu_dashboard')
-def get_hu_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.hu_dashboard_data:
-            logger.warning("HU DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.hu_dashboard_data
-        logger.debug(f"Returning HU DASHBOARD data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting hu dashboard data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        if not watcher.is_loaded(name):
+            logger.warning(f"{name} data requested before its initial load finished")
+            raise HTTPException(status_code=503, detail=f"Dataset {name} is still loading", headers={"Retry-After": "1"})
 
-@app.get('/data_lines_dashboard')
-def get_lines_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.lines_dashboard_data:
-            logger.warning("LINES DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.lines_dashboard_data
-        logger.debug(f"Returning LINES DASHBOARD data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting lines dashboard data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        logger.debug(f"Returning {name} data: {len(watcher.get_data(name) or {})} entries")
+        return cached_json_response(name, request)
 
-@app.get('/data_deliveries_pgi_dashboard')
-def get_deliveries_pgi_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.deliveries_pgi_dashboard_data:
-            logger.warning("DELIVERIES PGI DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.deliveries_pgi_dashboard_data
-        logger.debug(f"Returning DELIVERIES PGI DASHBOARD data: {len(result)} entries")
-        return result
-        
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting deliveries pgi dashboard data: {e}", exc_info=True)
+        logger.error(f"Error getting {name} data: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@app.get('/data_hu_pgi_dashboard')
-def get_hu_pgi_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.hu_pgi_dashboard_data:
-            logger.warning("HU PGI DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.hu_pgi_dashboard_data
-        logger.debug(f"Returning HU PGI DASHBOARD data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting hu pgi dashboard data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@app.get('/data_lines_pgi_dashboard')
-def get_lines_pgi_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.lines_pgi_dashboard_data:
-            logger.warning("LINES PGI DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.lines_pgi_dashboard_data
-        logger.debug(f"Returning LINES PGI DASHBOARD data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting lines pgi dashboard data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+def register_dataset_aliases() -> None:
+    """Expose every registered dataset under its legacy /data_<name> path too."""
+    if watcher is None:
+        return
+
+    for name in watcher.dataset_paths:
+        def endpoint(request: Request, name: str = name) -> Response:
+            return get_dataset(name, request)
+
+        app.add_api_route(f"/data_{name}", endpoint, methods=["GET"], name=f"get_{name}_data", include_in_schema=False)
+
+
+register_dataset_aliases()
 
-@app.get('/data_lines_hourly_dashboard')
-def get_lines_hourly_dashboard_data() -> Dict[str, Any]:
-    try:
-        if watcher is None:
-            raise HTTPException(status_code=503, detail="File watcher not initialized")
-        
-        if not watcher.lines_hourly_dashboard_data:
-            logger.warning("LINES HOURLY DASHBOARD data is empty")
-            return {}
-        
-        result = watcher.lines_hourly_dashboard_data
-        logger.debug(f"Returning LINES HOURLY DASHBOARD data: {len(result)} entries")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting lines hourly dashboard data: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get('/users_names')
 def get_all_users() -> Set[str]:
@@ -294,7 +266,7 @@ def get_all_users() -> Set[str]:
         if watcher is None:
             raise HTTPException(status_code=503, detail="File watcher not initialized")
         
-        all_usernames = set(watcher.cdhdr_data.keys()) | set(watcher.ltap_data.keys())
+        all_usernames = set(watcher.get_data("cdhdr").keys()) | set(watcher.get_data("ltap").keys())
         logger.debug(f"Returning {len(all_usernames)} unique usernames")
         return all_usernames
         
@@ -328,7 +300,7 @@ def save_users_name(names_data: Dict[str, str]) -> UsersNamesResponse:
             result.append({'user': username, 'name': name})
         
         df = pd.DataFrame(result)
-        df.to_csv(watcher.users_name_path, index=False)
+        write_csv(df, watcher.users_name_path)
         
         # Reload user names
         watcher.load_users_name()
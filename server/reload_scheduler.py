@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+from data_script.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger("reload_scheduler")
+
+
+class PendingReload:
+    """Reload waiting for its key to go quiet."""
+
+    def __init__(self, callback: Callable[[], None], deadline: float, latest: float):
+        self.callback = callback
+        self.deadline = deadline
+        # Deadline cap, fixed by the first event
+        self.latest = latest
+        self.events = 1
+
+
+class ReloadScheduler:
+    """
+    Debounces file change events per key and runs the resulting reloads on a worker pool.
+
+    Every event pushes the key's deadline ``quiet_period`` seconds into the
+    future, so a burst of modify events for one file collapses into a single
+    reload once the writer is done. A file that keeps changing is still
+    reloaded ``max_delay`` seconds after its first pending event. Reloads run off the watchdog observer
+    thread, and a key is never reloaded twice at the same time: events that
+    arrive during a reload schedule exactly one follow-up reload.
+    """
+
+    def __init__(self, quiet_period: float, max_workers: int, max_delay: Optional[float] = None):
+        self.quiet_period = quiet_period
+        self.max_delay = max(quiet_period, max_delay if max_delay is not None else 10 * quiet_period)
+        self._pending: Dict[str, PendingReload] = {}
+        self._running: Set[str] = set()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reload")
+        self._thread = threading.Thread(target=self._run, name="reload-scheduler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        logger.info(f"Reload scheduler started (quiet period {self.quiet_period}s, max delay {self.max_delay}s)")
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._executor.shutdown(wait=False)
+        logger.info("Reload scheduler stopped")
+
+    def schedule(self, key: str, callback: Callable[[], None]) -> None:
+        """Request a reload of ``key``, replacing any reload still waiting for it."""
+        now = time.monotonic()
+        with self._condition:
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = PendingReload(callback, now + self.quiet_period, now + self.max_delay)
+            else:
+                pending.callback = callback
+                pending.deadline = min(now + self.quiet_period, pending.latest)
+                pending.events += 1
+            self._condition.notify()
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+                next_deadline = None
+
+                for key, pending in list(self._pending.items()):
+                    if key in self._running:
+                        continue
+                    if pending.deadline <= now:
+                        del self._pending[key]
+                        self._running.add(key)
+                        if pending.events > 1:
+                            logger.debug(f"Coalesced {pending.events} change events for {key}")
+                        self._executor.submit(self._execute, key, pending.callback)
+                    elif next_deadline is None or pending.deadline < next_deadline:
+                        next_deadline = pending.deadline
+
+                timeout = None if next_deadline is None else next_deadline - now
+                self._condition.wait(timeout)
+
+    def _execute(self, key: str, callback: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        try:
+            callback()
+            logger.debug(f"Reloaded {key} in {time.perf_counter() - start:.3f}s")
+        except Exception as e:
+            logger.error(f"Error reloading {key}: {e}", exc_info=True)
+        finally:
+            with self._condition:
+                self._running.discard(key)
+                self._condition.notify()
@@ -1,15 +1,158 @@
 import os
 import json
+import math
+import hashlib
+import threading
+from dataclasses import dataclass
+from email.utils import formatdate
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
 from data_script.utils.logger import setup_logger
+from data_script.utils.files_utils import write_csv
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import time
 import pandas as pd
 from server.config import settings
+from server.reload_scheduler import ReloadScheduler
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Set up logger
 logger = setup_logger("watch")
 
+# Datasets served by the API: name -> path relative to the data folder
+DATASETS = {
+    "cdhdr": os.path.join("packing", "packing.json"),
+    "ltap": os.path.join("picking", "picking.json"),
+    "deliveries_dashboard": os.path.join("dashboard", "deliveries_all_floors.json"),
+    "hu_dashboard": os.path.join("dashboard", "hu_all_floors.json"),
+    "lines_dashboard": os.path.join("dashboard", "lines_all_floors.json"),
+    "deliveries_pgi_dashboard": os.path.join("dashboard", "deliveries_all_floors_pgi.json"),
+    "hu_pgi_dashboard": os.path.join("dashboard", "hu_all_floors_pgi.json"),
+    "lines_pgi_dashboard": os.path.join("dashboard", "lines_all_floors_pgi.json"),
+    "lines_hourly_dashboard": os.path.join("dashboard", "picking_hourly_dashboard.json"),
+}
+
+# SAP exports each dataset is ultimately built from, used to report end-to-end data age.
+# The newest existing file counts: picking/packing export the whole day to picking.txt/packing.txt,
+# or only the changes to picking_delta.txt/packing_delta.txt with LTAP_INCREMENTAL/CDHDR_INCREMENTAL
+PICKING_SOURCES = (os.path.join("picking", "picking.txt"), os.path.join("picking", "picking_delta.txt"))
+PACKING_SOURCES = (os.path.join("packing", "packing.txt"), os.path.join("packing", "packing_delta.txt"))
+
+DATASET_SOURCES = {
+    "cdhdr": PACKING_SOURCES,
+    "ltap": PICKING_SOURCES,
+    "deliveries_dashboard": (os.path.join("dashboard", "vl06f_dashboard.txt"),),
+    "hu_dashboard": (os.path.join("dashboard", "vl06f_dashboard.txt"),),
+    "lines_dashboard": (os.path.join("dashboard", "vl06f_dashboard.txt"),),
+    "deliveries_pgi_dashboard": (os.path.join("dashboard", "likp_dashboard.txt"),),
+    "hu_pgi_dashboard": (os.path.join("dashboard", "likp_dashboard.txt"),),
+    "lines_pgi_dashboard": (os.path.join("dashboard", "likp_dashboard.txt"),),
+    "lines_hourly_dashboard": PICKING_SOURCES,
+}
+
+# Datasets whose responses carry the display name of every user
+NAMED_DATASETS = ("cdhdr", "ltap")
+
+
+def parse_extra_datasets(value: str) -> Dict[str, str]:
+    """
+    Parse extra datasets from a "name=relative/path.json,..." setting.
+
+    Args:
+        value: Comma separated name=path pairs
+
+    Returns:
+        Dict[str, str]: Dataset name mapped to its path relative to the data folder
+    """
+    datasets = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, separator, path = item.partition("=")
+        name, path = name.strip(), path.strip()
+        if not separator or not name.isidentifier() or not path:
+            logger.warning(f"Ignoring invalid EXTRA_DATASETS entry: {item!r}")
+            continue
+        datasets[name] = os.path.normpath(path)
+    return datasets
+
+
+def clean_nan_values(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {key: clean_nan_values(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [clean_nan_values(item) for item in data]
+    elif isinstance(data, float) and (math.isnan(data) or math.isinf(data)):
+        return None
+    else:
+        return data
+
+
+def parse_json(content: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens the stdlib writer emits
+            pass
+    return json.loads(content)
+
+
+def encode_response(data: Any) -> bytes:
+    """Encode data exactly like FastAPI's JSONResponse would."""
+    if ORJSON_AVAILABLE:
+        # orjson already writes NaN/Infinity as null
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    try:
+        content = json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    except ValueError:
+        logger.warning("Data contains NaN/Infinity values, replacing them with null")
+        content = json.dumps(clean_nan_values(data), ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    return content.encode("utf-8")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Encoded body of a dataset together with its HTTP validators."""
+    body: bytes
+    etag: str
+    loaded_at: float
+
+    @property
+    def last_modified(self) -> str:
+        return formatdate(self.loaded_at, usegmt=True)
+
+
+@dataclass
+class DatasetStats:
+    """Load metrics of one dataset since the server started."""
+    last_loaded_at: Optional[float] = None
+    file_mtime: Optional[float] = None
+    size_bytes: Optional[int] = None
+    entries: int = 0
+    parse_seconds: Optional[float] = None
+    loads: int = 0
+    retries: int = 0
+    failures: int = 0
+
+
+class MergedUser(NamedTuple):
+    """Encoded name-merged entry of one user, kept between rebuilds."""
+    source: Any
+    name: Any
+    fragment: bytes
+
+
+EMPTY_RESPONSE = CachedResponse(body=b"{}", etag=f'"{hashlib.sha1(b"{}").hexdigest()}"', loaded_at=0.0)
+
+
 class WatchFiles:
     def __init__(self):
         self.data_folder_path = settings.path_to_data
@@ -23,152 +166,255 @@ class WatchFiles:
             logger.error(f"Data folder does not exists: {self.data_folder_path}")
             raise ValueError(f"Data folder does not exist: {self.data_folder_path}")
         
-        # SET UP FILE PATHS (updated to match data_script structure)
-        self.cdhdr_data_path = os.path.join(self.data_folder_path, "packing", "packing.json")
-        self.ltap_data_path = os.path.join(self.data_folder_path, "picking", "picking.json")
-        self.deliveries_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "deliveries_all_floors.json")
-        self.hu_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "hu_all_floors.json")
-        self.lines_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "lines_all_floors.json")
-        self.deliveries_pgi_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "deliveries_all_floors_pgi.json")
-        self.hu_pgi_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "hu_all_floors_pgi.json")
-        self.lines_pgi_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "lines_all_floors_pgi.json")
-        self.lines_hourly_dashboard_data_path = os.path.join(self.data_folder_path, "dashboard", "picking_hourly_dashboard.json")
+        # SET UP DATASET REGISTRY (paths match data_script structure)
+        registry = {**DATASETS, **parse_extra_datasets(settings.extra_datasets)}
+        self.dataset_paths: Dict[str, str] = {
+            name: os.path.join(self.data_folder_path, relative_path) for name, relative_path in registry.items()
+        }
+        self._path_to_dataset: Dict[str, str] = {
+            os.path.normpath(path): name for name, path in self.dataset_paths.items()
+        }
+        self.source_paths: Dict[str, List[str]] = {
+            name: [os.path.join(self.data_folder_path, relative_path) for relative_path in relative_paths]
+            for name, relative_paths in DATASET_SOURCES.items() if name in self.dataset_paths
+        }
         self.users_name_path = os.path.join(self.data_folder_path, "misc", "users_name.csv")
 
         # INITIALIZE DATA STORAGE
         self.users_name = {}
-        self.cdhdr_data = {}
-        self.ltap_data = {}
-        self.deliveries_dashboard_data = {}
-        self.hu_dashboard_data = {}
-        self.lines_dashboard_data = {}
-        self.deliveries_pgi_dashboard_data = {}
-        self.hu_pgi_dashboard_data = {}
-        self.lines_pgi_dashboard_data = {}
-        self.lines_hourly_dashboard_data = {}
-
-        # LOAD INITIAL DATA
-        self.load_cdhdr()
-        self.load_ltap()
-        self.load_deliveries_dashboard()
-        self.load_hu_dashboard()
-        self.load_lines_dashboard()
-        self.load_deliveries_pgi_dashboard()
-        self.load_hu_pgi_dashboard()
-        self.load_lines_pgi_dashboard()
-        self.load_lines_hourly_dashboard()
+        self.data: Dict[str, Any] = {name: {} for name in self.dataset_paths}
+
+        # PRE-ENCODED RESPONSE BODIES (rebuilt on every reload)
+        self.responses: Dict[str, CachedResponse] = {}
+
+        # ENCODED NAME-MERGED USERS OF CDHDR/LTAP (reused while their data and name are unchanged)
+        self._merged_users: Dict[str, Dict[str, MergedUser]] = {}
+        self._refresh_lock = threading.RLock()
+
+        # VERSION COUNTERS AND CHANGE LISTENERS (called as listener(dataset, version, etag))
+        self.versions: Dict[str, int] = {}
+        self._listeners: List[Callable[[str, int, str], None]] = []
+
+        # LOAD STATE (a dataset is served once its first load finished)
+        self.loaded: Set[str] = set()
+        self.stats: Dict[str, DatasetStats] = {name: DatasetStats() for name in self.dataset_paths}
+        self._load_locks: Dict[str, threading.Lock] = {name: threading.Lock() for name in self.dataset_paths}
+
+        # LOAD INITIAL DATA (datasets load in the background and become ready one by one)
         self.load_users_name()
+        self.start_initial_load()
 
-        logger.info("WatchFiles initialized successfully")
+        logger.info(f"WatchFiles initialized successfully with {len(self.dataset_paths)} datasets")
     
-    def _load_file_with_retry(self, file_path, file_type="json"):
+    def _load_file_with_retry(self, file_path, file_type="json", stats=None):
         retries = settings.file_load_retries
         delay = settings.file_load_retry_delay
+        # Metrics are only kept for registered datasets
+        stats = stats if stats is not None else DatasetStats()
 
         for attempt in range(retries):
             try:
                 if not os.path.exists(file_path):
+                    stats.file_mtime = stats.size_bytes = None
                     if file_type == "json":
                         logger.warning(f"File does not exist: {file_path}, returning empty dict")
                         return {}
                     return None
 
                 # CHECK FILE SIZE (BASIC VALIDATION)
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
+                file_stat = os.stat(file_path)
+                stats.file_mtime = file_stat.st_mtime
+                stats.size_bytes = file_stat.st_size
+                if file_stat.st_size == 0:
                     logger.warning(f"File is empty: {file_path}")
                     return {} if file_type == "json" else None
 
-                with open(file_path, "r", encoding="utf-8") as f:
-                    if file_type == "json":
-                        data = json.load(f)
-                        logger.debug(f"Successfully loaded JSON file: {file_path}")
-                        return data
-                    else:
-                        return file_path
+                if file_type != "json":
+                    return file_path
+
+                start = time.perf_counter()
+                with open(file_path, "rb") as f:
+                    data = parse_json(f.read())
+                stats.parse_seconds = time.perf_counter() - start
+                stats.last_loaded_at = time.time()
+                logger.debug(f"Successfully loaded JSON file: {file_path}")
+                return data
 
             except json.JSONDecodeError as e:
                 logger.warning(f"JSON decode error on attempt {attempt + 1}/{retries} for {file_path}: {e}")
                 if attempt < retries - 1:
+                    stats.retries += 1
                     time.sleep(delay)
                 else:
                     logger.error(f"Failed to load JSON after {retries} attempts: {file_path}")
+                    stats.failures += 1
                     return {}
 
             except FileNotFoundError as e:
                 logger.warning(f"File not found on attempt {attempt + 1}/{retries}: {file_path}")
                 if attempt < retries - 1:
+                    stats.retries += 1
                     time.sleep(delay)
                 else:
                     logger.error(f"File not found after {retries} attempts: {file_path}")
+                    stats.failures += 1
                     return {} if file_type == "json" else None
 
             except PermissionError as e:
                 logger.error(f"Permission denied reading file: {file_path}: {e}")
+                stats.failures += 1
                 return {} if file_type == "json" else None
 
             except Exception as e:
                 logger.error(f"Unexpected error loading file {file_path}: {e}", exc_info=True)
                 if attempt < retries - 1:
+                    stats.retries += 1
                     time.sleep(delay)
                 else:
+                    stats.failures += 1
                     return {} if file_type == "json" else None
 
         return {} if file_type == "json" else None
 
-    def _load_json_file(self, file_path, default_value=None):
+    def _load_json_file(self, file_path, default_value=None, stats=None):
         if default_value is None:
             default_value = {}
         
-        data = self._load_file_with_retry(file_path, file_type="json")
+        data = self._load_file_with_retry(file_path, file_type="json", stats=stats)
         if data is None:
             return default_value
         return data
 
-    def load_cdhdr(self):
-        logger.info(f"Loading CDHDR data from {self.cdhdr_data_path}")
-        self.cdhdr_data = self._load_json_file(self.cdhdr_data_path, {})
-        logger.info(f"CDHDR data loaded {len(self.cdhdr_data)} entries")
-    
-    def load_ltap(self):
-        logger.info(f"Loading LTAP data from {self.ltap_data_path}")
-        self.ltap_data = self._load_json_file(self.ltap_data_path, {})
-        logger.info(f"LTAP data loaded {len(self.ltap_data)} entries")
-
-    def load_deliveries_dashboard(self):
-        logger.info(f"Loading DELIVERIES DASHBOARD data from {self.deliveries_dashboard_data_path}")
-        self.deliveries_dashboard_data = self._load_json_file(self.deliveries_dashboard_data_path, {})
-        logger.info(f"DELIVERIES DASHBOARD data loaded {len(self.deliveries_dashboard_data)} entries")
-
-    def load_hu_dashboard(self):
-        logger.info(f"Loading HU DASHBOARD data from {self.hu_dashboard_data_path}")
-        self.hu_dashboard_data = self._load_json_file(self.hu_dashboard_data_path, {})
-        logger.info(f"HU DASHBOARD data loaded {len(self.hu_dashboard_data)} entries")
-
-    def load_lines_dashboard(self):
-        logger.info(f"Loading LINES DASHBOARD data from {self.lines_dashboard_data_path}")
-        self.lines_dashboard_data = self._load_json_file(self.lines_dashboard_data_path, {})
-        logger.info(f"LINES DASHBOARD data loaded {len(self.lines_dashboard_data)} entries")
-    
-    def load_deliveries_pgi_dashboard(self):
-        logger.info(f"Loading DELIVERIES PGI DASHBOARD data from {self.deliveries_pgi_dashboard_data_path}")
-        self.deliveries_pgi_dashboard_data = self._load_json_file(self.deliveries_pgi_dashboard_data_path, {})
-        logger.info(f"DELIVERIES PGI DASHBOARD data loaded {len(self.deliveries_pgi_dashboard_data)} entries")
-    
-    def load_hu_pgi_dashboard(self):
-        logger.info(f"Loading HU PGI DASHBOARD data from {self.hu_pgi_dashboard_data_path}")
-        self.hu_pgi_dashboard_data = self._load_json_file(self.hu_pgi_dashboard_data_path, {})
-        logger.info(f"HU PGI DASHBOARD data loaded {len(self.hu_pgi_dashboard_data)} entries")
+    def _merge_names(self, dataset: str) -> bytes:
+        """
+        Return the encoded body of a dataset with the display name of every user.
+
+        The data of a dataset is replaced as a whole when its file is reloaded,
+        so a user whose data is still the same object and whose display name
+        did not change keeps its encoded fragment. Reloading user names thus
+        only re-encodes the users whose name changed, without comparing their
+        data.
+        """
+        data = self.get_data(dataset)
+        previous = self._merged_users.get(dataset, {})
+        merged_users: Dict[str, MergedUser] = {}
+        rebuilt = 0
+
+        for username, user_data in data.items():
+            name = self.users_name.get(username, 'Unknown')
+            entry = previous.get(username)
+
+            if entry is None or entry.source is not user_data or entry.name != name:
+                rebuilt += 1
+                merged_user = {**user_data, 'name': name} if isinstance(user_data, dict) else user_data
+                fragment = encode_response(username) + b":" + encode_response(merged_user)
+                entry = MergedUser(source=user_data, name=name, fragment=fragment)
+
+            merged_users[username] = entry
+
+        self._merged_users[dataset] = merged_users
+        logger.debug(f"Merged names into {dataset}: {rebuilt}/{len(merged_users)} users rebuilt")
+
+        return b"{" + b",".join(entry.fragment for entry in merged_users.values()) + b"}"
+
+    def _refresh_response(self, dataset: str) -> None:
+        """Re-encode the response body of a dataset after its data changed."""
+        with self._refresh_lock:
+            self._refresh_response_locked(dataset)
+
+    def _refresh_response_locked(self, dataset: str) -> None:
+        if dataset in NAMED_DATASETS:
+            body = self._merge_names(dataset)
+        else:
+            body = encode_response(self.get_data(dataset))
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+        # Keep the original timestamp when a reload produced identical content
+        previous = self.responses.get(dataset)
+        if previous is not None and previous.etag == etag:
+            logger.debug(f"{dataset} content unchanged after reload, keeping ETag {etag}")
+            return
+
+        self.responses[dataset] = CachedResponse(body=body, etag=etag, loaded_at=time.time())
+        self.versions[dataset] = self.versions.get(dataset, 0) + 1
+        logger.debug(f"Encoded {dataset} response: {len(body)} bytes, ETag {etag}, version {self.versions[dataset]}")
+
+        self._notify_listeners(dataset, self.versions[dataset], etag)
+
+    def add_listener(self, listener: Callable[[str, int, str], None]) -> None:
+        """Register a callback invoked from the reloading thread whenever a dataset changes."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, int, str], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_listeners(self, dataset: str, version: int, etag: str) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(dataset, version, etag)
+            except Exception as e:
+                logger.error(f"Dataset change listener failed for {dataset}: {e}", exc_info=True)
+
+    def get_response(self, dataset: str) -> CachedResponse:
+        return self.responses.get(dataset, EMPTY_RESPONSE)
 
-    def load_lines_pgi_dashboard(self):
-        logger.info(f"Loading LINES PGI DASHBOARD data from {self.lines_pgi_dashboard_data_path}")
-        self.lines_pgi_dashboard_data = self._load_json_file(self.lines_pgi_dashboard_data_path, {})
-        logger.info(f"LINES PGI DASHBOARD data loaded {len(self.lines_pgi_dashboard_data)} entries")
+    def dataset_for_path(self, path: str) -> Optional[str]:
+        return self._path_to_dataset.get(os.path.normpath(path))
 
-    def load_lines_hourly_dashboard(self):
-        logger.info(f"Loading LINES HOURLY DASHBOARD data from {self.lines_hourly_dashboard_data_path}")
-        self.lines_hourly_dashboard_data = self._load_json_file(self.lines_hourly_dashboard_data_path, {})
-        logger.info(f"LINES HOURLY DASHBOARD data loaded {len(self.lines_hourly_dashboard_data)} entries")
+    def get_data(self, dataset: str) -> Any:
+        return self.data.get(dataset, {})
+
+    def source_mtime(self, dataset: str) -> Optional[float]:
+        """Modification time of the newest SAP export a dataset is built from, if known."""
+        mtimes = []
+        for path in self.source_paths.get(dataset, []):
+            try:
+                mtimes.append(os.path.getmtime(path))
+            except OSError:
+                continue
+        return max(mtimes, default=None)
+
+    def is_loaded(self, dataset: str) -> bool:
+        return dataset in self.loaded
+
+    def load_dataset(self, dataset: str) -> None:
+        # Serialize loads of one dataset so a reload never races the initial read
+        with self._load_locks[dataset]:
+            path = self.dataset_paths[dataset]
+            logger.info(f"Loading {dataset} data from {path}")
+            start = time.perf_counter()
+            stats = self.stats[dataset]
+            self.data[dataset] = self._load_json_file(path, {}, stats=stats)
+            stats.loads += 1
+            stats.entries = len(self.data[dataset])
+            self._refresh_response(dataset)
+            self.loaded.add(dataset)
+            logger.info(f"{dataset} data loaded {len(self.data[dataset])} entries in {time.perf_counter() - start:.3f}s")
+
+    def start_initial_load(self) -> None:
+        """
+        Load every registered dataset in the background, reading the files in parallel.
+
+        Returns immediately; each dataset is served as soon as its own load
+        finished, so one slow or retrying file does not hold up the others.
+        """
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=settings.file_reload_workers, thread_name_prefix="initial-load")
+        futures = {executor.submit(self.load_dataset, dataset): dataset for dataset in self.dataset_paths}
+
+        def on_done(future):
+            dataset = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error loading {dataset} data: {e}", exc_info=True)
+            if all(f.done() for f in futures):
+                logger.info(f"Initial load of {len(futures)} datasets finished in {time.perf_counter() - start:.3f}s")
+
+        for future in futures:
+            future.add_done_callback(on_done)
+        executor.shutdown(wait=False)
 
     def load_users_name(self):
         logger.info(f"Loading user names from {self.users_name_path}")
@@ -176,7 +422,7 @@ class WatchFiles:
             if not os.path.exists(self.users_name_path):
                 logger.info(f"User names file does not exist, creating empty file: {self.users_name_path}")
                 df = pd.DataFrame(columns=["user", "name"])
-                df.to_csv(self.users_name_path, index=False)
+                write_csv(df, self.users_name_path)
                 self.users_name = {}
             else:
                 df = pd.read_csv(self.users_name_path)
@@ -186,8 +432,19 @@ class WatchFiles:
             logger.error(f"Error loading user names: {e}", exc_info=True)
             self.users_name = {}
 
+        # Names are embedded in the CDHDR/LTAP responses (built on first load otherwise)
+        for dataset in NAMED_DATASETS:
+            if dataset in self.responses:
+                self._refresh_response(dataset)
+
     def start_watching(self):
         try:
+            self.reload_scheduler = ReloadScheduler(
+                quiet_period=settings.file_reload_debounce,
+                max_delay=settings.file_reload_max_delay,
+                max_workers=settings.file_reload_workers,
+            )
+            self.reload_scheduler.start()
             event_handler = self.FileChangeHandler(self)
             self.observer = Observer()
             # Watch recursively since files are now in subdirectories (packing/, picking/, dashboard/, misc/)
@@ -203,40 +460,37 @@ class WatchFiles:
             self.watcher = watcher
             logger.debug("FileChangeHandler initialized")
 
+        def _schedule(self, event_path, label, loader):
+            # Writers emit several modify events per file, reload once they are done
+            logger.debug(f"{label} file modified, scheduling reload")
+
+            def reload():
+                logger.info(f"{label} file modified, reloading...")
+                loader()
+
+            self.watcher.reload_scheduler.schedule(event_path, reload)
+
         def on_modified(self, event):
+            self._handle(event.src_path)
+
+        def on_created(self, event):
+            self._handle(event.src_path)
+
+        def on_moved(self, event):
+            # Atomic writers rename a temporary file over the watched path
+            self._handle(event.dest_path)
+
+        def _handle(self, path):
             try:
                 # Normalize paths for comparison (handle Windows backslashes)
-                event_path = os.path.normpath(event.src_path)
+                event_path = os.path.normpath(path)
                 
-                if event_path == os.path.normpath(self.watcher.cdhdr_data_path):
-                    logger.info("CDHDR file modified, reloading...")
-                    self.watcher.load_cdhdr()
-                elif event_path == os.path.normpath(self.watcher.ltap_data_path):
-                    logger.info("LTAP file modified, reloading...")
-                    self.watcher.load_ltap()
-                elif event_path == os.path.normpath(self.watcher.deliveries_dashboard_data_path):
-                    logger.info("DELIVERIES DASHBOARD file modified, reloading...")
-                    self.watcher.load_deliveries_dashboard()
-                elif event_path == os.path.normpath(self.watcher.hu_dashboard_data_path):
-                    logger.info("HU DASHBOARD file modified, reloading...")
-                    self.watcher.load_hu_dashboard()
-                elif event_path == os.path.normpath(self.watcher.lines_dashboard_data_path):
-                    logger.info("LINES DASHBOARD file modified, reloading...")
-                    self.watcher.load_lines_dashboard()
-                elif event_path == os.path.normpath(self.watcher.deliveries_pgi_dashboard_data_path):
-                    logger.info("DELIVERIES PGI DASHBOARD file modified, reloading...")
-                    self.watcher.load_deliveries_pgi_dashboard()
-                elif event_path == os.path.normpath(self.watcher.hu_pgi_dashboard_data_path):
-                    logger.info("HU PGI DASHBOARD file modified, reloading...")
-                    self.watcher.load_hu_pgi_dashboard()
-                elif event_path == os.path.normpath(self.watcher.lines_pgi_dashboard_data_path):
-                    logger.info("LINES PGI DASHBOARD file modified, reloading...")
-                    self.watcher.load_lines_pgi_dashboard()
-                elif event_path == os.path.normpath(self.watcher.lines_hourly_dashboard_data_path):
-                    logger.info("LINES HOURLY DASHBOARD file modified, reloading...")
-                    self.watcher.load_lines_hourly_dashboard()
-                elif event_path == os.path.normpath(self.watcher.users_name_path):
-                    logger.info("User names file modified, reloading...")
-                    self.watcher.load_users_name()
+                if event_path == os.path.normpath(self.watcher.users_name_path):
+                    self._schedule(event_path, "User names", self.watcher.load_users_name)
+                    return
+
+                dataset = self.watcher.dataset_for_path(event_path)
+                if dataset is not None:
+                    self._schedule(event_path, dataset.upper(), lambda: self.watcher.load_dataset(dataset))
             except Exception as e:
                 logger.error(f"Error handling file modification: {e}", exc_info=True)
\ No newline at end of file